@@ -12,8 +12,17 @@ Functions executed in order:
 3. delete_connection - Delete Event Hub connection
 4. delete_workspace - Delete the Fabric workspace
 
+Fleet teardown mode (--config/--count, same environments as deploy_fabric_rti_fleet.py):
+1. authenticate - Authenticate Fabric API client
+2. lookup_workspaces/lookup_connections - Find all target workspaces and connections,
+   with one paginated scan of each list
+3. delete_resources - Delete all found workspaces and connections concurrently
+   (bounded by --max-parallel) and wait for their long-running operations together
+
 Usage:
     python delete_fabric_rti.py
+    python delete_fabric_rti.py --config fleet.json --max-parallel 10
+    python delete_fabric_rti.py --count 10 --suffix-prefix load
 
 Environment Variables (from Bicep outputs):
     AZURE_ENV_NAME - Name of the Azure environment
@@ -22,29 +31,136 @@ Environment Variables (from Bicep outputs):
     FABRIC_EVENT_HUB_CONNECTION_NAME - Name of the Event Hub connection (optional, uses default if not provided)
 """
 
+import argparse
 import os
 import sys
 from datetime import datetime
+from typing import Dict, List, Mapping, Tuple
 
 # Add current directory to path so we can import local modules
 sys.path.append(os.path.dirname(__file__))
 
 # Import removal functions
 from fabric_auth import authenticate
-from fabric_workspace_delete import lookup_workspace, delete_workspace
-from fabric_connection_delete import delete_connection
+from fabric_workspace_delete import lookup_workspace, lookup_workspaces, delete_workspace
+from fabric_connection_delete import delete_connection, lookup_connections
 from fabric_common_utils import get_required_env_var, print_step, print_steps_summary
+from deploy_fabric_rti_fleet import load_fleet_config
+
+def get_teardown_targets(env: Mapping[str, str]) -> Tuple[str, str, str]:
+    """
+    Get the names of the resources of one environment to remove.
+    
+    Args:
+        env: Configuration of the environment (e.g., os.environ)
+        
+    Returns:
+        Tuple of (solution_suffix, workspace_name, connection_name)
+    """
+    solution_suffix = get_required_env_var("SOLUTION_SUFFIX", env)
+    workspace_name = env.get("FABRIC_WORKSPACE_NAME", f"Real-Time Intelligence for Operations - {solution_suffix}")
+    connection_name = env.get("FABRIC_EVENT_HUB_CONNECTION_NAME", f"rti_eventhub_connection_{solution_suffix}")
+    return solution_suffix, workspace_name, connection_name
+
+def teardown_fleet(configs: List[Dict[str, str]], max_parallel: int = 8) -> None:
+    """
+    Remove the workspaces and connections of several environments concurrently.
+    
+    Args:
+        configs: Configuration overrides of each environment (see load_fleet_config)
+        max_parallel: Maximum number of deletions in flight
+    """
+    solution_name = get_required_env_var("AZURE_ENV_NAME")
+    targets = [get_teardown_targets({**os.environ, **config}) for config in configs]
+    
+    print(f"🏭 {solution_name} Fleet Removal")
+    print("="*60)
+    print(f"Target environments: {len(targets)}")
+    print(f"Maximum parallel deletions: {max_parallel}")
+    print(f"Start time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("="*60)
+    
+    executed_steps = []
+    failed_steps = []
+    
+    # Step 1: Authenticate Fabric API client
+    print_step(1, 3, "Authenticating Fabric API client")
+    fabric_client = authenticate()
+    if fabric_client is None:
+        print(f"\n❌ Authentication failed. Cannot proceed with fleet removal.")
+        print_steps_summary(solution_name, "fleet", executed_steps, ["authenticate"])
+        sys.exit(1)
+    executed_steps.append("authenticate")
+    
+    # Step 2: Find all target workspaces and connections with one scan each
+    print_step(2, 3, "Looking up workspaces and connections", environments=len(targets))
+    try:
+        workspaces = lookup_workspaces(fabric_client, [workspace_name for _, workspace_name, _ in targets])
+        connections = lookup_connections(fabric_client, [connection_name for _, _, connection_name in targets])
+        executed_steps.append("lookup_resources")
+    except Exception as e:
+        print(f"❌ Could not look up workspaces and connections: {e}")
+        print_steps_summary(solution_name, "fleet", executed_steps, ["lookup_resources"])
+        sys.exit(1)
+    
+    # Step 3: Delete everything concurrently and wait for the deletions together
+    resources = {}
+    for solution_suffix, workspace_name, connection_name in targets:
+        if connection_name in connections:
+            resources[f"connection:{solution_suffix}"] = f"connections/{connections[connection_name]}"
+        if workspace_name in workspaces:
+            resources[f"workspace:{solution_suffix}"] = f"workspaces/{workspaces[workspace_name][0]}"
+    print_step(3, 3, "Deleting workspaces and connections", resources=len(resources), max_parallel=max_parallel)
+    results = fabric_client.delete_many(resources, max_parallel=max_parallel) if resources else {}
+    
+    def describe(key: str) -> str:
+        if key not in resources:
+            return "not found"
+        result = results.get(key)
+        if isinstance(result, Exception):
+            return f"failed ({result})"
+        return "deleted" if result else "not found"
+    
+    print(f"\n📋 Removal results:")
+    for solution_suffix, workspace_name, connection_name in targets:
+        workspace_status = describe(f"workspace:{solution_suffix}")
+        connection_status = describe(f"connection:{solution_suffix}")
+        icon = "❌" if "failed" in workspace_status or "failed" in connection_status else "✅"
+        print(f"{icon} {solution_suffix}: workspace {workspace_status}, connection {connection_status}")
+    
+    failures = [key for key, result in results.items() if isinstance(result, Exception)]
+    if failures:
+        failed_steps.append("delete_resources")
+    else:
+        executed_steps.append("delete_resources")
+    print_steps_summary(solution_name, "fleet", executed_steps, failed_steps)
+    if failures:
+        sys.exit(1)
 
 def main():
+    parser = argparse.ArgumentParser(description="Remove the Fabric workspace and connection of one or several environments")
+    parser.add_argument("--config", help="Fleet configuration file of deploy_fabric_rti_fleet.py to remove all its environments")
+    parser.add_argument("--count", type=int, default=0, help="Number of generated fleet environments to remove")
+    parser.add_argument("--suffix-prefix", default="fleet", help="SOLUTION_SUFFIX prefix of generated environments (default: fleet)")
+    parser.add_argument("--max-parallel", type=int, default=8, help="Maximum number of deletions in flight in fleet mode (default: 8)")
+    args = parser.parse_args()
+    
+    if args.config or args.count > 0:
+        try:
+            configs = load_fleet_config(args.config, args.count, args.suffix_prefix)
+        except (OSError, ValueError) as e:
+            print(f"❌ Invalid fleet configuration: {e}")
+            sys.exit(1)
+        teardown_fleet(configs, max_parallel=args.max_parallel)
+        return
+    
     # Calculate repository root directory (3 levels up from this script)
     script_dir = os.path.dirname(os.path.abspath(__file__))
     repo_dir = os.path.abspath(os.path.join(script_dir, "..", "..", ".."))
     
     # Load configuration from environment variables
     solution_name = get_required_env_var("AZURE_ENV_NAME")
-    solution_suffix = get_required_env_var("SOLUTION_SUFFIX")
-    workspace_name = os.getenv("FABRIC_WORKSPACE_NAME", f"Real-Time Intelligence for Operations - {solution_suffix}")
-    connection_name = os.getenv("FABRIC_EVENT_HUB_CONNECTION_NAME", f"rti_eventhub_connection_{solution_suffix}")
+    solution_suffix, workspace_name, connection_name = get_teardown_targets(os.environ)
 
     # Show removal summary
     print(f"🏭 {solution_name} Workspace Removal")
@@ -24,6 +24,7 @@ Functions executed in order:
 
 Usage:
     python deploy_fabric_rti.py
+    python deploy_fabric_rti_fleet.py --config fleet.json  # Deploy several environments concurrently
 
 Environment Variables (from Bicep outputs):
     AZURE_LOCATION - The location the resources were deployed to
@@ -52,11 +53,18 @@ Optional Environment Variables (custom configuration):
     FABRIC_DATA_AGENT_NAME - Custom name for the Data Agent (defaults to "rti_dataagent_{suffix}")
     FABRIC_NOTEBOOK_NAME - Custom name for the Data Agent configuration notebook (defaults to "rti_notebook_{suffix}")
     FABRIC_FOLDER_NAME - Custom name for the folder containing environment and data agent (defaults to "rti_folder_{suffix}")
+    FABRIC_DEFINITION_STATE_PATH - Custom path of the definition hash state file (defaults to ".azure/{env}/fabric_definition_state.json")
+    FABRIC_FORCE_DEFINITION_UPDATE - Set to "true" to upload item definitions even when unchanged since the last deployment
+    FABRIC_TOKEN_CACHE_PERSIST - Set to "true" to share Azure access tokens with later runs through an encrypted "~/.azure/fabric_token_cache.bin"
+    FABRIC_EVENT_ENRICHMENT - Set to "true" to deploy the events_enriched table with ingestion-time z-scores and anomaly flags
+    FABRIC_RATE_LIMIT_RPS - Initial Fabric API requests per second per API family, adapted to throttling (defaults to 10, 0 disables)
+    FABRIC_PROFILE - Set to "true" to write a timeline of step, API call and LRO wait timings to ".azure/{env}/fabric_deploy_profile.json"
 """
 
 import os
 import sys
 from datetime import datetime
+from typing import Any, Dict, List, Optional
 
 # Add current directory to path so we can import local modules
 sys.path.append(os.path.dirname(__file__))
@@ -77,36 +85,59 @@ from fabric_eventstream_definition import setup_eventstream_definition
 from fabric_activator_definition import setup_activator_definition
 from fabric_folder import setup_folder
 from fabric_environment import setup_environment
-from fabric_data_agent import setup_data_agent
+from fabric_data_agent import setup_data_agent, report_notebook_job
+from fabric_job_runner import JobRunner
 from fabric_common_utils import get_required_env_var, print_step, print_steps_summary
+from fabric_profiler import start_profiling_from_env
 
-def main():
+def main(config: Optional[Dict[str, str]] = None, executed_steps: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Deploy one solution environment.
+    
+    Args:
+        config: Optional configuration values overriding the environment variables
+            (used by deploy_fabric_rti_fleet.py to deploy several environments in one process)
+        executed_steps: Optional list the names of completed steps are appended to,
+            so callers can report progress of deployments that exit early
+    
+    Returns:
+        Dictionary with the IDs and URLs of the deployed resources
+    
+    Raises:
+        SystemExit: If a step fails (code 1), or on graceful exits (code 0)
+    """
+    env = {**os.environ, **(config or {})}
+    
     # Calculate repository root directory (3 levels up from this script)
     script_dir = os.path.dirname(os.path.abspath(__file__))
     repo_dir = os.path.abspath(os.path.join(script_dir, "..", "..", ".."))
     
     # Load configuration from environment variables
-    solution_name = get_required_env_var("AZURE_ENV_NAME")
-    solution_suffix = get_required_env_var("SOLUTION_SUFFIX")
-    subscription_id = get_required_env_var("AZURE_SUBSCRIPTION_ID")
-    resource_group_name = get_required_env_var("AZURE_RESOURCE_GROUP")
-    capacity_name = get_required_env_var("AZURE_FABRIC_CAPACITY_NAME")
-    event_hub_name = get_required_env_var("AZURE_EVENT_HUB_NAME")
-    event_hub_namespace_name = get_required_env_var("AZURE_EVENT_HUB_NAMESPACE_NAME")
-    event_hub_authorization_rule_name = os.getenv("AZURE_EVENT_HUB_AUTHORIZATION_RULE_NAME", "RootManageSharedAccessKey")
-    workspace_name = os.getenv("FABRIC_WORKSPACE_NAME", f"Real-Time Intelligence for Operations - {solution_suffix}")
-    workspace_administrators = os.getenv("FABRIC_WORKSPACE_ADMINISTRATORS")
-    eventhouse_name = os.getenv("FABRIC_EVENTHOUSE_NAME", f"rti_eventhouse_{solution_suffix}")
-    eventhouse_database_name = os.getenv("FABRIC_EVENTHOUSE_DATABASE_NAME", f"rti_kqldb_{solution_suffix}")
-    event_hub_connection_name = os.getenv("FABRIC_EVENT_HUB_CONNECTION_NAME", f"rti_eventhub_connection_{solution_suffix}")
-    dashboard_title = os.getenv("FABRIC_RTIDASHBOARD_NAME", f"rti_dashboard_{solution_suffix}")
-    eventstream_name = os.getenv("FABRIC_EVENTSTREAM_NAME", f"rti_eventstream_{solution_suffix}")
-    activator_name = os.getenv("FABRIC_ACTIVATOR_NAME", f"rti_activator_{solution_suffix}")
-    activator_alerts_email = os.getenv("FABRIC_ACTIVATOR_ALERTS_EMAIL", "alerts@contoso.com")
-    data_agent_name = os.getenv("FABRIC_DATA_AGENT_NAME", f"rti_dataagent_{solution_suffix}")
-    folder_name = os.getenv("FABRIC_DATA_AGENT_CONFIGURATION_FOLDER_NAME", f"rti_dataagentconfig_{solution_suffix}")
-    environment_name = os.getenv("FABRIC_DATA_AGENT_CONFIGURATION_ENVIRONMENT_NAME", f"rti_environment_{solution_suffix}")
-    notebook_name = os.getenv("FABRIC_DATA_AGENT_CONFIGURATION_NOTEBOOK_NAME", f"rti_notebook_{solution_suffix}")
+    solution_name = get_required_env_var("AZURE_ENV_NAME", env)
+    solution_suffix = get_required_env_var("SOLUTION_SUFFIX", env)
+    subscription_id = get_required_env_var("AZURE_SUBSCRIPTION_ID", env)
+    resource_group_name = get_required_env_var("AZURE_RESOURCE_GROUP", env)
+    capacity_name = get_required_env_var("AZURE_FABRIC_CAPACITY_NAME", env)
+    event_hub_name = get_required_env_var("AZURE_EVENT_HUB_NAME", env)
+    event_hub_namespace_name = get_required_env_var("AZURE_EVENT_HUB_NAMESPACE_NAME", env)
+    event_hub_authorization_rule_name = env.get("AZURE_EVENT_HUB_AUTHORIZATION_RULE_NAME", "RootManageSharedAccessKey")
+    workspace_name = env.get("FABRIC_WORKSPACE_NAME", f"Real-Time Intelligence for Operations - {solution_suffix}")
+    workspace_administrators = env.get("FABRIC_WORKSPACE_ADMINISTRATORS")
+    eventhouse_name = env.get("FABRIC_EVENTHOUSE_NAME", f"rti_eventhouse_{solution_suffix}")
+    eventhouse_database_name = env.get("FABRIC_EVENTHOUSE_DATABASE_NAME", f"rti_kqldb_{solution_suffix}")
+    event_hub_connection_name = env.get("FABRIC_EVENT_HUB_CONNECTION_NAME", f"rti_eventhub_connection_{solution_suffix}")
+    dashboard_title = env.get("FABRIC_RTIDASHBOARD_NAME", f"rti_dashboard_{solution_suffix}")
+    eventstream_name = env.get("FABRIC_EVENTSTREAM_NAME", f"rti_eventstream_{solution_suffix}")
+    activator_name = env.get("FABRIC_ACTIVATOR_NAME", f"rti_activator_{solution_suffix}")
+    activator_alerts_email = env.get("FABRIC_ACTIVATOR_ALERTS_EMAIL", "alerts@contoso.com")
+    data_agent_name = env.get("FABRIC_DATA_AGENT_NAME", f"rti_dataagent_{solution_suffix}")
+    folder_name = env.get("FABRIC_DATA_AGENT_CONFIGURATION_FOLDER_NAME", f"rti_dataagentconfig_{solution_suffix}")
+    environment_name = env.get("FABRIC_DATA_AGENT_CONFIGURATION_ENVIRONMENT_NAME", f"rti_environment_{solution_suffix}")
+    notebook_name = env.get("FABRIC_DATA_AGENT_CONFIGURATION_NOTEBOOK_NAME", f"rti_notebook_{solution_suffix}")
+    enable_event_enrichment = env.get("FABRIC_EVENT_ENRICHMENT", "").lower() == "true"
+    
+    # Profile steps, API calls and LRO waits when FABRIC_PROFILE=true
+    start_profiling_from_env("deploy")
     
     # Show initialization summary
     print(f"🏭 {solution_name} Initialization")
@@ -135,7 +166,7 @@ def main():
         sys.exit(1)
     print("✅ Authentication successful")
     
-    executed_steps = []
+    executed_steps = [] if executed_steps is None else executed_steps
     
     # Step 1: Setup workspace
     print_step(1, 14, "Setting up Fabric workspace and capacity assignment", capacity_name=capacity_name, workspace_name=workspace_name)
@@ -188,6 +219,9 @@ def main():
         sys.exit(1)
     print("✅ Workspace-specific authentication successful")
     
+    # Notebook jobs run in the background, tracked from one poller thread
+    job_runner = JobRunner(workspace_client)
+    
     # Step 2: Setup workspace administrators
     print_step(2, 14, "Setting up Fabric workspace administrators", workspace_id=workspace_id, admin_list=workspace_administrators or "None")
     
@@ -232,7 +266,8 @@ def main():
     try:
         result = setup_fabric_database(
             cluster_uri=kusto_cluster_uri,
-            database_name=eventhouse_database_name
+            database_name=eventhouse_database_name,
+            enable_event_enrichment=enable_event_enrichment
         )
         if result is None:
             print_steps_summary(solution_name, solution_suffix, executed_steps, [])
@@ -463,8 +498,14 @@ def main():
             kusto_db_workspace_id=workspace_id,
             environment_id=environment_id,
             notebook_name=notebook_name,
-            notebook_folder_id=folder_id
+            notebook_folder_id=folder_id,
+            job_runner=job_runner
         )
+        if data_agent_result is not None:
+            # Wait for the configuration notebook submitted above (and any other background jobs)
+            for job in job_runner.wait():
+                report_notebook_job(job)
+            print(f"✅ Data Agent configuration completed successfully!")
         if data_agent_result is None:
             print(f"⚠️ Failed to create data agent: Unknown error")
             print(f"📄 To complete data agent setup manually:")
@@ -552,6 +593,20 @@ def main():
     
     print(f"\n✨ Your real-time intelligence solution is ready!")
     print(f"="*60)
+    
+    return {
+        "solution_suffix": solution_suffix,
+        "workspace_name": workspace_name,
+        "workspace_id": workspace_id,
+        "workspace_url": workspace_url,
+        "eventhouse_id": eventhouse_id,
+        "kql_database_id": eventhouse_database_id,
+        "dashboard_url": dashboard_url,
+        "eventstream_id": eventstream_id,
+        "activator_id": activator_id,
+        "environment_id": environment_id,
+        "data_agent_id": data_agent_id,
+    }
 
 if __name__ == "__main__":
     try:
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Fleet deployment orchestrator script.
+
+This script deploys several real-time intelligence environments (e.g., one per plant or per
+customer) concurrently in one process, by running deploy_fabric_rti.main() for each environment
+on a bounded pool of worker threads. Running the environments in one process lets them share
+what would otherwise be set up once per deployment:
+    - One Azure credential and token cache, so tokens are acquired once for the whole fleet
+    - One pooled HTTP session, so connections to the Fabric API are reused across environments
+    - One adaptive rate limiter per Fabric API family, so the whole fleet stays within a global
+      request budget and backs off together when Fabric throttles
+
+The output of each environment is written to its own log file, and a per-environment summary
+(status, duration, completed steps, workspace) is printed and written as JSON at the end.
+
+Fleet configuration file (JSON):
+    {
+        "defaults": {"AZURE_SUBSCRIPTION_ID": "...", "AZURE_FABRIC_CAPACITY_NAME": "...", ...},
+        "environments": [
+            {"SOLUTION_SUFFIX": "plant01", "FABRIC_ACTIVATOR_ALERTS_EMAIL": "plant01@contoso.com"},
+            {"SOLUTION_SUFFIX": "plant02"}
+        ]
+    }
+
+Each environment is configured by the process environment variables, overridden by "defaults",
+overridden by its own entry, using the same variables as deploy_fabric_rti.py. Settings that
+are process-wide (FABRIC_FORCE_DEFINITION_UPDATE, FABRIC_DEFINITION_STATE_PATH,
+FABRIC_TOKEN_CACHE_PERSIST, FABRIC_PROFILE, FABRIC_HTTP_CASSETTE, FABRIC_API_URL) are taken
+from the environment of the fleet process only.
+
+Usage:
+    python deploy_fabric_rti_fleet.py --config fleet.json --max-parallel 5
+    python deploy_fabric_rti_fleet.py --count 10 --suffix-prefix load --max-rps 20
+
+Environment Variables:
+    The variables of deploy_fabric_rti.py, used for all environments unless overridden
+"""
+
+import argparse
+import contextvars
+import io
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Any, Dict, List, Optional, TextIO
+
+import deploy_fabric_rti
+from fabric_http_cassette import DEFAULT_POOL_SIZE
+from fabric_profiler import end_profile_step
+
+
+class ThreadOutputRouter(io.TextIOBase):
+    """
+    Stand-in for sys.stdout that routes the output of each worker thread to its own stream.
+
+    The route is held in a context variable, so threads started by a deployment with
+    contextvars.copy_context() (parallel administrator assignments and deletions, the job
+    poller, background token refreshes) write to the stream of that deployment too.
+    Output without a routed stream (e.g. the fleet progress lines of the main thread) goes to
+    the original stream. The last error line (❌) of each route is kept for the summary.
+    """
+
+    def __init__(self, default: TextIO):
+        """
+        Initialize the ThreadOutputRouter.
+
+        Args:
+            default: Stream receiving the output of threads without a routed stream
+        """
+        self.default = default
+        # Shared by the threads started from the routed context, so their errors count too
+        self._route: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar("output_route", default=None)
+
+    def route(self, stream: Optional[TextIO]) -> None:
+        """Route the output of the calling context to a stream (None restores the default)."""
+        route = self._route.get()
+        if route is not None:
+            # Threads still running from the previous route fall back to the default stream
+            route["stream"] = None
+        self._route.set({"stream": stream, "last_error": None} if stream is not None else None)
+
+    @property
+    def last_error(self) -> Optional[str]:
+        """Last error line written in the calling context since it was routed."""
+        route = self._route.get()
+        return route["last_error"] if route else None
+
+    def _get_stream(self) -> Optional[TextIO]:
+        route = self._route.get()
+        return route["stream"] if route else None
+
+    def write(self, text: str) -> int:
+        stream = self._get_stream()
+        if stream is None:
+            return self.default.write(text)
+        route = self._route.get()
+        for line in text.splitlines():
+            if "❌" in line:
+                route["last_error"] = line.strip()
+        return stream.write(text)
+
+    def flush(self) -> None:
+        (self._get_stream() or self.default).flush()
+
+    @property
+    def encoding(self) -> str:
+        return getattr(self.default, "encoding", None) or "utf-8"
+
+
+def load_fleet_config(config_path: Optional[str] = None,
+                      count: int = 0,
+                      suffix_prefix: str = "fleet") -> List[Dict[str, str]]:
+    """Load the configuration of each environment of the fleet.
+
+    Args:
+        config_path: Optional path of the fleet configuration file
+        count: Number of additional environments to generate, named by suffix_prefix
+        suffix_prefix: Prefix of the SOLUTION_SUFFIX of generated environments
+
+    Returns:
+        List with the configuration overrides of each environment
+
+    Raises:
+        ValueError: If the configuration is invalid
+    """
+    defaults: Dict[str, Any] = {}
+    environments: List[Dict[str, Any]] = []
+    if config_path:
+        with open(config_path, "r", encoding="utf-8") as f:
+            fleet_config = json.load(f)
+        defaults = fleet_config.get("defaults", {})
+        environments = list(fleet_config.get("environments", []))
+
+    for index in range(1, count + 1):
+        environments.append({"SOLUTION_SUFFIX": f"{suffix_prefix}{index:02d}"})
+
+    configs = []
+    for environment in environments:
+        config = {key: str(value) for key, value in {**defaults, **environment}.items()}
+        if not config.get("SOLUTION_SUFFIX") and not os.getenv("SOLUTION_SUFFIX"):
+            raise ValueError(f"Environment {environment} has no SOLUTION_SUFFIX")
+        configs.append(config)
+
+    suffixes = [config.get("SOLUTION_SUFFIX", os.getenv("SOLUTION_SUFFIX")) for config in configs]
+    duplicates = sorted({suffix for suffix in suffixes if suffixes.count(suffix) > 1})
+    if duplicates:
+        raise ValueError(f"Environments must have distinct SOLUTION_SUFFIX values, duplicated: {', '.join(duplicates)}")
+    return configs
+
+
+def deploy_environment(name: str, config: Dict[str, str], log_path: str, router: ThreadOutputRouter) -> Dict[str, Any]:
+    """Deploy one environment of the fleet, writing its output to a log file.
+
+    Args:
+        name: Environment name used in the summary
+        config: Configuration overrides of the environment
+        log_path: Path of the log file of the environment
+        router: Output router installed as sys.stdout
+
+    Returns:
+        Dictionary with the status, duration, completed steps and outputs of the deployment
+    """
+    executed_steps: List[str] = []
+    result: Dict[str, Any] = {"name": name, "log_path": log_path, "error": None, "outputs": {}}
+    started = time.time()
+    with open(log_path, "w", encoding="utf-8") as log:
+        router.route(log)
+        try:
+            result["outputs"] = deploy_fabric_rti.main(config, executed_steps) or {}
+            result["status"] = "succeeded"
+        except SystemExit as e:
+            # deploy_fabric_rti exits with 0 when it stops gracefully (e.g. without a data agent)
+            result["status"] = "partial" if e.code in (0, None) else "failed"
+            result["error"] = router.last_error
+        except Exception as e:
+            print(f"❌ Unexpected error: {e}")
+            result["status"] = "failed"
+            result["error"] = str(e)
+        finally:
+            end_profile_step()
+            router.route(None)
+    result["duration_sec"] = time.time() - started
+    result["executed_steps"] = executed_steps
+    return result
+
+
+def print_fleet_summary(results: List[Dict[str, Any]], duration_sec: float) -> None:
+    """Print the per-environment summary of a fleet deployment.
+
+    Args:
+        results: Deployment results returned by deploy_environment()
+        duration_sec: Wall-clock duration of the fleet deployment
+    """
+    status_icons = {"succeeded": "✅", "partial": "⚠️ ", "failed": "❌"}
+    print(f"\n" + "="*60)
+    print(f"🚢 FLEET DEPLOYMENT SUMMARY")
+    print(f"="*60)
+    print(f"   {'Environment':<20}  {'Status':<10}  {'Duration':>9}  {'Steps':>5}  Workspace / last step")
+    for result in results:
+        icon = status_icons.get(result["status"], "❔")
+        workspace_id = result["outputs"].get("workspace_id")
+        last_step = result["executed_steps"][-1] if result["executed_steps"] else "-"
+        detail = workspace_id if result["status"] == "succeeded" else f"after {last_step}"
+        print(f"{icon} {result['name']:<20}  {result['status']:<10}  {result['duration_sec']:>8.1f}s  {len(result['executed_steps']):>5}  {detail}")
+        if result["error"]:
+            print(f"      {result['error']}")
+        if result["status"] != "succeeded":
+            print(f"      Log: {result['log_path']}")
+
+    succeeded = sum(1 for result in results if result["status"] == "succeeded")
+    serial_sec = sum(result["duration_sec"] for result in results)
+    print(f"\n📊 {succeeded}/{len(results)} environment(s) deployed in {duration_sec:.1f}s "
+          f"(sum of deployment durations: {serial_sec:.1f}s)")
+
+
+def main():
+    """Main function to deploy a fleet of environments from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Deploy several real-time intelligence environments concurrently",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python deploy_fabric_rti_fleet.py --config fleet.json
+  python deploy_fabric_rti_fleet.py --config fleet.json --max-parallel 10 --max-rps 20
+  python deploy_fabric_rti_fleet.py --count 5 --suffix-prefix load
+        """
+    )
+    parser.add_argument("--config", help="Fleet configuration file with \"defaults\" and \"environments\"")
+    parser.add_argument("--count", type=int, default=0, help="Number of environments to generate in addition to the configuration file")
+    parser.add_argument("--suffix-prefix", default="fleet", help="SOLUTION_SUFFIX prefix of generated environments (default: fleet)")
+    parser.add_argument("--max-parallel", type=int, default=5, help="Maximum number of environments deployed at once (default: 5)")
+    parser.add_argument("--max-rps", type=float, help="Fabric API requests per second per API family for the whole fleet (default: FABRIC_RATE_LIMIT_RPS)")
+    parser.add_argument("--log-dir", default="fleet_deployment_logs", help="Directory for the per-environment logs and the summary (default: fleet_deployment_logs)")
+    args = parser.parse_args()
+
+    if not args.config and args.count <= 0:
+        parser.error("either --config or --count is required")
+    try:
+        configs = load_fleet_config(args.config, args.count, args.suffix_prefix)
+    except (OSError, ValueError) as e:
+        print(f"❌ Invalid fleet configuration: {e}")
+        sys.exit(1)
+    if not configs:
+        print("❌ The fleet configuration has no environments")
+        sys.exit(1)
+
+    # Limiters and the HTTP session are created on first use, so these apply to the whole fleet
+    if args.max_rps is not None:
+        os.environ["FABRIC_RATE_LIMIT_RPS"] = str(args.max_rps)
+        os.environ["FABRIC_RATE_LIMIT_MAX_RPS"] = str(args.max_rps)
+    os.environ.setdefault("FABRIC_HTTP_POOL_SIZE", str(max(DEFAULT_POOL_SIZE, args.max_parallel * 8)))
+
+    run_dir = os.path.join(args.log_dir, datetime.now().strftime("%Y%m%dT%H%M%S"))
+    os.makedirs(run_dir, exist_ok=True)
+
+    print(f"🚢 Deploying {len(configs)} environment(s), {args.max_parallel} at a time")
+    print(f"   Rate limit per API family: {os.getenv('FABRIC_RATE_LIMIT_RPS', 'default')} requests/s")
+    print(f"   Logs: {os.path.abspath(run_dir)}")
+
+    router = ThreadOutputRouter(sys.stdout)
+    sys.stdout = router
+    started = time.time()
+    results = []
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, args.max_parallel), thread_name_prefix="fleet") as executor:
+            futures = {}
+            for config in configs:
+                name = config.get("SOLUTION_SUFFIX", os.getenv("SOLUTION_SUFFIX"))
+                log_path = os.path.join(run_dir, f"{re.sub(r'[^A-Za-z0-9_.-]', '_', name)}.log")
+                futures[executor.submit(deploy_environment, name, config, log_path, router)] = name
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                print(f"{'✅' if result['status'] == 'succeeded' else '❌'} [{len(results)}/{len(configs)}] "
+                      f"{result['name']}: {result['status']} in {result['duration_sec']:.1f}s "
+                      f"({len(result['executed_steps'])} step(s) completed)")
+    finally:
+        sys.stdout = router.default
+    duration_sec = time.time() - started
+
+    results.sort(key=lambda result: result["name"])
+    print_fleet_summary(results, duration_sec)
+
+    summary_path = os.path.join(run_dir, "fleet_summary.json")
+    with open(summary_path, "w", encoding="utf-8") as f:
+        json.dump({"duration_sec": duration_sec, "environments": results}, f, indent=2)
+    print(f"   Summary written to: {summary_path}")
+
+    if any(result["status"] == "failed" for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print(f"\n⚠️ Fleet deployment interrupted by user")
+        sys.exit(1)
@@ -39,6 +39,10 @@ from fabric_api import (
     FabricWorkspaceApiClient,
     FabricApiError
 )
+from fabric_definition_state import (
+    is_definition_unchanged,
+    record_definition_hash
+)
 
 def transform_activator_config(
     activator_config: list,
@@ -263,6 +267,17 @@ def setup_activator_definition(
             f"✅ Activator configuration encoded "
             f"({len(activator_base64)} characters)"
         )
+        definition_parts = {"ReflexEntities.json": activator_base64}
+
+        # Skip the update LRO when the deployed definition already matches
+        if is_definition_unchanged(
+            workspace_client, activator_id, definition_parts
+        ):
+            print(
+                f"⏭️  Skipping activator definition update "
+                f"(ID: {activator_id}), definition unchanged"
+            )
+            return existing_activator
 
         # Update the existing activator
         print(f"🔄 Updating activator definition (ID: {activator_id})...")
@@ -273,6 +288,9 @@ def setup_activator_definition(
         )
         
         if update_success:
+            record_definition_hash(
+                workspace_client, activator_id, definition_parts
+            )
             print(f"✅ Successfully updated activator definition")
             
             # Get updated activator information
@@ -9,9 +9,12 @@ This library adheres strictly to Fabric API operations and does not contain busi
 or project-specific transformations. For UDFWF-specific functionality, see udfwf_utils.py.
 
 Core Features:
-- Authentication management with Azure CLI credentials
+- Authentication management with shared, cached Azure CLI credentials
 - HTTP request handling with error management
 - Long Running Operation (LRO) support
+- Optional HTTP record/replay of all requests (see fabric_http_cassette.py)
+- Optional timing spans of calls, retries and LRO waits (see fabric_profiler.py)
+- Adaptive client-side rate limiting per API family (see fabric_rate_limiter.py)
 - Workspace, folder, notebook, and item operations
 - OneLake file system client integration
 
@@ -21,15 +24,26 @@ Dependencies:
 Author: Generated for Unified Data Foundation with Fabric (UDFWF) project
 """
 
+import contextvars
+import os
 import time
 import json
 import base64
 import requests
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Union, Any
+from urllib.parse import quote
 from azure.identity import AzureCliCredential, DefaultAzureCredential
 from azure.storage.filedatalake import DataLakeServiceClient, FileSystemClient
+from fabric_token_cache import get_shared_credential
+from fabric_http_cassette import http_request
+from fabric_profiler import profile_span
+from fabric_rate_limiter import get_rate_limiter
+
+DEFAULT_API_URL = "https://api.fabric.microsoft.com/v1"
+
 
 class FabricApiError(Exception):
     """Custom exception for Fabric API errors."""
@@ -38,7 +52,12 @@ class FabricApiError(Exception):
         super().__init__(message)
         self.status_code = status_code
         self.response_data = response_data
-    
+
+
+class FabricOperationCancelledError(FabricApiError):
+    """Raised when a long-running operation or job instance ended as Cancelled."""
+
+
 class FabricApiClient:
     """
     Microsoft Fabric API Client
@@ -48,23 +67,28 @@ class FabricApiClient:
     """
     
     def __init__(self, 
-                 api_url: str = "https://api.fabric.microsoft.com/v1",
+                 api_url: Optional[str] = None,
                  resource_url: str = "https://api.fabric.microsoft.com",
                  credential: Optional[Any] = None,
-                 timeout_sec: int = 240):
+                 timeout_sec: int = 240,
+                 lro_max_wait_sec: int = 1800):
         """
         Initialize the Fabric API client.
         
         Args:
-            api_url: Base URL for Fabric API
+            api_url: Base URL for Fabric API (defaults to FABRIC_API_URL or the public endpoint)
             resource_url: Resource URL for authentication scope
-            credential: Azure credential object (defaults to AzureCliCredential)
+            credential: Azure credential object (defaults to the shared cached AzureCliCredential)
             timeout_sec: Default timeout for API requests
+            lro_max_wait_sec: Maximum time to wait for a long-running operation
         """
-        self.api_url = api_url.rstrip('/')
+        self.api_url = (api_url or os.getenv("FABRIC_API_URL") or DEFAULT_API_URL).rstrip('/')
         self.resource_url = resource_url
         self.timeout_sec = timeout_sec
-        self._credential = credential or AzureCliCredential()
+        self.lro_max_wait_sec = lro_max_wait_sec
+        self.lro_initial_interval_sec = 0.5
+        self.lro_max_interval_sec = 20
+        self._credential = credential or get_shared_credential()
         self._token = None
         self._token_expiry = None
     
@@ -119,18 +143,19 @@ class FabricApiClient:
         """
         return {"Authorization": f"Bearer {self._get_auth_token()}"}
     
-    def get_workspace_file_system_client(self, workspace_name: str) -> FileSystemClient:
+    def get_workspace_file_system_client(self, workspace_name: str, **client_kwargs) -> FileSystemClient:
         """
         Create a Data Lake file system client for a Fabric workspace.
         
         Args:
-            workspace_name: Name of the Fabric workspace
+            workspace_name: Name or ID of the Fabric workspace
+            **client_kwargs: Additional DataLakeServiceClient options (e.g., transport, max_single_put_size)
             
         Returns:
             FileSystemClient for OneLake operations
         """
         account_url = "https://onelake.dfs.fabric.microsoft.com"
-        service_client = DataLakeServiceClient(account_url, credential=self._credential)
+        service_client = DataLakeServiceClient(account_url, credential=self._credential, **client_kwargs)
         return service_client.get_file_system_client(file_system=workspace_name)
     
     def _get_auth_token(self) -> str:
@@ -169,7 +194,8 @@ class FabricApiClient:
         Make an HTTP request to the Fabric API.
         
         Args:
-            uri: API endpoint URI (relative to base URL)
+            uri: API endpoint URI (relative to base URL), or a full URL returned by the API
+                (e.g., the Location of a long running operation)
             method: HTTP method
             data: Request body data
             headers: Additional headers
@@ -187,7 +213,7 @@ class FabricApiClient:
         if retry_count > max_retries:
             raise FabricApiError(f"Maximum retries ({max_retries}) exceeded for rate limiting")
         
-        url = f"{self.api_url}/{uri.lstrip('/')}"
+        url = uri if uri.startswith(("https://", "http://")) else f"{self.api_url}/{uri.lstrip('/')}"
         
         # Prepare headers
         request_headers = {
@@ -201,86 +227,316 @@ class FabricApiClient:
         if isinstance(data, dict):
             data = json.dumps(data)
         
-        try:
-            self._log(f"Making {method} request to {url} (attempt {retry_count + 1})")
-            response = requests.request(
-                method=method.upper(),
-                url=url,
-                headers=request_headers,
-                data=data,
-                timeout=timeout or self.timeout_sec
-            )
-            
-            # Log request ID if available
-            request_id = response.headers.get('requestId', 'N/A')
-            self._log(f"Request ID: {request_id}")
-            
-            # Handle Long Running Operations (LRO)
-            if response.status_code == 202 and wait_for_lro:
-                location = response.headers.get('Location')
-                if location:
-                    return self._wait_for_lro_completion(
-                        job_url=location,
-                        operation_name=f"{method} {uri}",
-                        max_wait_time=1800
-                    )
-                else:
-                    self._log("Long-running operation detected but no Location header found", "WARNING")
-                
-            elif response.status_code == 202 and not wait_for_lro:
-                self._log("Long-running operation detected, returning 202 response without waiting")
-            
-            elif response.status_code == 429:
-                # Handle rate limiting with exponential backoff
-                retry_after_header = response.headers.get('Retry-After', '60')
+        kind = "retry" if retry_count else "api_call"
+        with profile_span(f"{method.upper()} {uri}", kind, attempt=retry_count + 1):
+            try:
+                # Pace requests per API family; this also waits out throttling seen by other callers
+                rate_limiter = get_rate_limiter(uri)
+                delay = rate_limiter.reserve() if rate_limiter else 0.0
+                if delay > 0:
+                    with profile_span(f"{rate_limiter.family} {delay:.1f}s", "throttle" if retry_count else "rate_limit", uri=uri):
+                        time.sleep(delay)
                 
-                # Parse retry-after header (could be seconds or HTTP date)
-                try:
-                    retry_after = int(retry_after_header)
-                except ValueError:
-                    # If it's not a number, assume it's an HTTP date (not implemented here)
-                    retry_after = min(60, 2 ** retry_count)  # Exponential backoff with cap
+                self._log(f"Making {method} request to {url} (attempt {retry_count + 1})")
+                with profile_span(f"{method.upper()} {url}", "http"):
+                    response = http_request(
+                        method=method.upper(),
+                        url=url,
+                        headers=request_headers,
+                        data=data,
+                        timeout=timeout or self.timeout_sec
+                    )
                 
-                # Cap the retry time to reasonable limits
-                retry_after = min(retry_after, 300)  # Max 5 minutes
+                # Log request ID if available
+                request_id = response.headers.get('requestId', 'N/A')
+                self._log(f"Request ID: {request_id}")
+                if rate_limiter and response.status_code != 429:
+                    rate_limiter.on_success()
                 
-                self._log(f"Rate limit exceeded. Retrying in {retry_after} seconds... (attempt {retry_count + 1}/{max_retries})", "WARNING")
-                time.sleep(retry_after)
+                # Handle Long Running Operations (LRO)
+                if response.status_code == 202 and wait_for_lro:
+                    location = self._get_lro_url(response)
+                    if location:
+                        return self._wait_for_lro_completion(
+                            job_url=location,
+                            operation_name=f"{method} {uri}"
+                        )
+                    else:
+                        self._log("Long-running operation detected but no Location or x-ms-operation-id header found", "WARNING")
+                    
+                elif response.status_code == 202 and not wait_for_lro:
+                    self._log("Long-running operation detected, returning 202 response without waiting")
                 
-                # Recursive call with retry count
-                return self._make_request(uri, method, data, headers, timeout, wait_for_lro, max_retries, retry_count + 1)
-            
-            # Check for errors
-            elif response.status_code >= 400:
-                error_msg = f"API request failed with status {response.status_code}"
-                error_data = None
+                elif response.status_code == 429:
+                    # Handle rate limiting with exponential backoff
+                    retry_after_header = response.headers.get('Retry-After', '60')
+                    
+                    # Parse retry-after header (could be seconds or HTTP date)
+                    try:
+                        retry_after = int(retry_after_header)
+                    except ValueError:
+                        # If it's not a number, assume it's an HTTP date (not implemented here)
+                        retry_after = min(60, 2 ** retry_count)  # Exponential backoff with cap
+                    
+                    # Cap the retry time to reasonable limits
+                    retry_after = min(retry_after, 300)  # Max 5 minutes
+                    
+                    self._log(f"Rate limit exceeded. Retrying in {retry_after} seconds... (attempt {retry_count + 1}/{max_retries})", "WARNING")
+                    if rate_limiter:
+                        # Pauses every caller of this API family; the retry waits in reserve()
+                        rate_limiter.on_throttle(retry_after)
+                    else:
+                        with profile_span(f"Retry-After {retry_after}s", "throttle", uri=uri):
+                            time.sleep(retry_after)
+                    
+                    # Recursive call with retry count
+                    return self._make_request(uri, method, data, headers, timeout, wait_for_lro, max_retries, retry_count + 1)
                 
-                try:
-                    error_response = response.json()
-                    self._log(f"Error response: {json.dumps(error_response, indent=2)}", level="error")
+                # Check for errors
+                elif response.status_code >= 400:
+                    error_msg = f"API request failed with status {response.status_code}"
+                    error_data = None
+                    
+                    try:
+                        error_response = response.json()
+                        self._log(f"Error response: {json.dumps(error_response, indent=2)}", level="error")
 
-                    if 'error' in error_response:
-                        error_data = error_response['error']
-                        error_msg += f": {error_data.get('message', 'Unknown error')}"
-                except (ValueError, json.JSONDecodeError):
-                    error_msg += f": {response.text[:500]}"  # Limit error text length
+                        if 'error' in error_response:
+                            error_data = error_response['error']
+                            error_msg += f": {error_data.get('message', 'Unknown error')}"
+                    except (ValueError, json.JSONDecodeError):
+                        error_msg += f": {response.text[:500]}"  # Limit error text length
+                    
+                    raise FabricApiError(error_msg, response.status_code, error_data)
                 
-                raise FabricApiError(error_msg, response.status_code, error_data)
+                self._log("Request completed successfully")
+                return response
+                
+            except requests.Timeout as e:
+                raise FabricApiError(f"Request timed out after {timeout or self.timeout_sec} seconds: {str(e)}")
+            except requests.ConnectionError as e:
+                raise FabricApiError(f"Connection error: {str(e)}")
+            except requests.RequestException as e:
+                raise FabricApiError(f"Request failed: {str(e)}")
+    
+    def _get_lro_url(self, response: requests.Response) -> Optional[str]:
+        """
+        Get the monitoring URL of a long-running operation from a 202 response.
+        
+        Args:
+            response: Response that started the operation
+            
+        Returns:
+            Location header if present, otherwise the operation URL built from x-ms-operation-id
+        """
+        location = response.headers.get('Location')
+        if location:
+            return location
+        operation_id = response.headers.get('x-ms-operation-id')
+        if operation_id:
+            return f"{self.api_url}/operations/{operation_id}"
+        return None
+    
+    def _get_retry_after(self, response: requests.Response) -> Optional[float]:
+        """
+        Parse the Retry-After header of a response.
+        
+        Args:
+            response: HTTP response
+            
+        Returns:
+            Retry-After value in seconds, or None if missing or not numeric
+        """
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is None:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            return None
+    
+    def _get_lro_poll_interval(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Get the delay before the next poll of a long-running operation.
+        
+        Starts at lro_initial_interval_sec and doubles on each attempt. A Retry-After
+        header sent by the service takes precedence. Both are capped at lro_max_interval_sec.
+        
+        Args:
+            attempt: Number of polls already made for the operation
+            retry_after: Optional Retry-After value from the last poll response
+            
+        Returns:
+            Delay in seconds
+        """
+        if retry_after is not None:
+            return min(retry_after, self.lro_max_interval_sec)
+        return min(self.lro_initial_interval_sec * (2 ** attempt), self.lro_max_interval_sec)
+    
+    def _poll_lro(self, job_url: str, operation_display: str) -> tuple:
+        """
+        Poll a long-running operation once.
+        
+        Args:
+            job_url: Full URL for monitoring the operation
+            operation_display: Operation name for logging and error messages
             
-            self._log("Request completed successfully")
-            return response
+        Returns:
+            Tuple of (final response or None if still running, Retry-After in seconds or None)
             
-        except requests.Timeout as e:
-            raise FabricApiError(f"Request timed out after {timeout or self.timeout_sec} seconds: {str(e)}")
-        except requests.ConnectionError as e:
-            raise FabricApiError(f"Connection error: {str(e)}")
+        Raises:
+            FabricApiError: If the operation failed, was cancelled (FabricOperationCancelledError)
+                or cannot be polled
+        """
+        rate_limiter = get_rate_limiter(job_url)
+        delay = rate_limiter.reserve() if rate_limiter else 0.0
+        if delay > 0:
+            with profile_span(f"{rate_limiter.family} {delay:.1f}s", "rate_limit", url=job_url):
+                time.sleep(delay)
+        
+        try:
+            headers = {'Authorization': f'Bearer {self._get_auth_token()}'}
+            with profile_span(operation_display, "lro_poll", url=job_url):
+                response = http_request("GET", job_url, headers=headers, timeout=self.timeout_sec)
         except requests.RequestException as e:
-            raise FabricApiError(f"Request failed: {str(e)}")
+            raise FabricApiError(f"Error checking {operation_display} status: {str(e)}")
+        
+        retry_after = self._get_retry_after(response)
+        if rate_limiter:
+            if response.status_code == 429:
+                rate_limiter.on_throttle(retry_after)
+            else:
+                rate_limiter.on_success()
+        
+        if response.status_code == 200:
+            try:
+                job_data = response.json()
+                job_status = job_data.get('status', 'Completed')
+            except (ValueError, AttributeError):
+                # No JSON or status field - treat as completed
+                return response, None
+            
+            # Operation and job instance statuses
+            if job_status in ['InProgress', 'Running', 'Queued', 'NotStarted']:
+                return None, retry_after
+            elif job_status in ['Completed', 'Succeeded']:
+                return response, None
+            elif job_status == 'Failed':
+                error_message = f"{operation_display} failed"
+                error_details = job_data.get('error') or job_data.get('failureReason') or {}
+                if isinstance(error_details, dict) and error_details:
+                    error_code = error_details.get('code', error_details.get('errorCode', 'Unknown'))
+                    error_desc = error_details.get('message', 'No details available')
+                    error_message = f"{operation_display} failed with error {error_code}: {error_desc}"
+                raise FabricApiError(error_message, response.status_code, error_details or None)
+            elif job_status == 'Cancelled':
+                raise FabricOperationCancelledError(f"{operation_display} was cancelled")
+            else:
+                # Unknown status - log warning and treat as completed
+                self._log(f"{operation_display} has unknown status '{job_status}', treating as completed", "WARNING")
+                return response, None
+        elif response.status_code == 202:
+            return None, retry_after
+        elif response.status_code == 429:
+            self._log(f"Rate limit exceeded while polling {operation_display}", "WARNING")
+            return None, retry_after if retry_after is not None else 30.0
+        else:
+            raise FabricApiError(f"{operation_display} failed with status {response.status_code}: {response.text}", response.status_code)
+    
+    def poll_operation(self, job_url: str, operation_name: str, attempt: int = 0) -> Tuple[Optional[requests.Response], float]:
+        """
+        Poll a long-running operation or job instance once, for callers tracking operations themselves.
+        
+        Args:
+            job_url: Full URL for monitoring the operation
+            operation_name: Operation name for logging and error messages
+            attempt: Number of polls already made for the operation (drives the backoff)
+            
+        Returns:
+            Tuple of (final response or None if still running, seconds until the next poll is due)
+            
+        Raises:
+            FabricApiError: If the operation failed, was cancelled (FabricOperationCancelledError)
+                or cannot be polled
+        """
+        response, retry_after = self._poll_lro(job_url, f"'{operation_name}'")
+        return response, self._get_lro_poll_interval(attempt, retry_after)
+    
+    def wait_for_lros(self,
+                      operations: Dict[str, str],
+                      max_wait_time: Optional[int] = None,
+                      check_interval: Optional[int] = None) -> Dict[str, Union[requests.Response, FabricApiError]]:
+        """
+        Wait for several Long Running Operations to complete from a single polling loop.
+        
+        Each operation is polled on its own schedule (Retry-After or exponential backoff),
+        and the loop only sleeps until the next operation is due, so fast operations
+        return quickly and outstanding operations do not each need a thread.
+        
+        Args:
+            operations: Dictionary mapping operation names to monitoring URLs
+            max_wait_time: Maximum time to wait in seconds (defaults to lro_max_wait_sec)
+            check_interval: Optional fixed check interval in seconds (disables backoff)
+            
+        Returns:
+            Dictionary mapping operation names to the final response, or to the
+            FabricApiError raised for operations that failed or timed out
+        """
+        max_wait_time = max_wait_time or self.lro_max_wait_sec
+        start_time = time.time()
+        results = {}
+        pending = {}
+        
+        for name, job_url in operations.items():
+            first_delay = check_interval if check_interval else self._get_lro_poll_interval(0)
+            pending[name] = {'url': job_url, 'attempt': 0, 'next_poll': start_time + first_delay}
+            self._log(f"Waiting for '{name}' to complete...")
+        
+        while pending:
+            now = time.time()
+            if now - start_time >= max_wait_time:
+                break
+            
+            due = [name for name, op in pending.items() if op['next_poll'] <= now]
+            if not due:
+                next_poll = min(op['next_poll'] for op in pending.values())
+                with profile_span(", ".join(pending), "lro_wait", pending=len(pending)):
+                    time.sleep(max(0.0, min(next_poll, start_time + max_wait_time) - now))
+                continue
+            
+            for name in due:
+                op = pending[name]
+                operation_display = f"'{name}'"
+                try:
+                    response, retry_after = self._poll_lro(op['url'], operation_display)
+                except FabricApiError as e:
+                    self._log(str(e), "ERROR")
+                    results[name] = e
+                    del pending[name]
+                    continue
+                
+                elapsed_str = self._format_duration(time.time() - start_time)
+                if response is not None:
+                    self._log(f"{operation_display} completed successfully ({elapsed_str})")
+                    results[name] = response
+                    del pending[name]
+                    continue
+                
+                op['attempt'] += 1
+                delay = check_interval if check_interval else self._get_lro_poll_interval(op['attempt'], retry_after)
+                op['next_poll'] = time.time() + delay
+                self._log(f"{operation_display} still in progress... ({elapsed_str} elapsed)")
+        
+        for name in pending:
+            results[name] = FabricApiError(f"'{name}' timed out after {self._format_duration(max_wait_time)}")
+            self._log(str(results[name]), "ERROR")
+        
+        return results
     
     def _wait_for_lro_completion(self, 
                                    job_url: str, 
                                    operation_name: Optional[str] = None,
-                                   max_wait_time: int = 300, 
+                                   max_wait_time: Optional[int] = None, 
                                    check_interval: Optional[int] = None) -> requests.Response:
         """
         Wait for Long Running Operation to complete.
@@ -288,82 +544,133 @@ class FabricApiClient:
         Args:
             job_url: Full URL for monitoring the operation (including base URL)
             operation_name: Optional name for logging (e.g., notebook name)
-            max_wait_time: Maximum time to wait in seconds
-            check_interval: Check interval in seconds (defaults to Retry-After header or 5s)
+            max_wait_time: Maximum time to wait in seconds (defaults to lro_max_wait_sec)
+            check_interval: Optional fixed check interval in seconds (defaults to Retry-After header or backoff)
             
         Returns:
             Final response object
-        """
-        start_time = time.time()
-        default_interval = check_interval or 5
-        
-        # Log operation start
-        operation_display = f"'{operation_name}'" if operation_name else "operation"
-        self._log(f"Waiting for {operation_display} to complete...")
-        
-        while (time.time() - start_time) < max_wait_time:
-            time.sleep(default_interval)
             
-            try:
-                # Make direct HTTP request to the job URL
-                headers = {'Authorization': f'Bearer {self._get_auth_token()}'}
-                response = requests.get(job_url, headers=headers, timeout=self.timeout_sec)
-                
-                if response.status_code == 200:
-                    # For notebook operations, check if the job status indicates completion
-                    if operation_name:  # This indicates it's likely a notebook job
-                        try:
-                            job_data = response.json()
-                            job_status = job_data.get('status', 'Completed')
-                            
-                            # If job is still running, continue polling
-                            if job_status in ['InProgress', 'Running', 'Queued', 'NotStarted']:
-                                elapsed = time.time() - start_time
-                                elapsed_str = self._format_duration(elapsed)
-                                self._log(f"{operation_display} is {job_status.lower()}... ({elapsed_str} elapsed)")
-                                continue
-                            # If job completed successfully, return response
-                            elif job_status in ['Completed', 'Succeeded']:
-                                self._log(f"{operation_display} completed successfully")
-                                return response
-                            # If job failed or was cancelled, raise an exception
-                            elif job_status == 'Failed':
-                                error_message = f"{operation_display} failed"
-                                # Try to extract error details from the response
-                                try:
-                                    error_details = job_data.get('error', {})
-                                    if error_details:
-                                        error_code = error_details.get('code', 'Unknown')
-                                        error_desc = error_details.get('message', 'No details available')
-                                        error_message = f"{operation_display} failed with error {error_code}: {error_desc}"
-                                except:
-                                    pass
-                                raise FabricApiError(error_message)
-                            elif job_status == 'Cancelled':
-                                raise FabricApiError(f"{operation_display} was cancelled")
-                            else:
-                                # Unknown status - log warning and treat as completed
-                                self._log(f"{operation_display} has unknown status '{job_status}', treating as completed", "WARNING")
-                                return response
-                        except (ValueError, KeyError):
-                            # No JSON or status field - treat as completed
-                            pass
-                    
-                    self._log(f"{operation_display} completed successfully")
-                    return response
-                elif response.status_code == 202:
-                    self._log(f"{operation_display} still in progress...")
-                    # Update check interval from Retry-After header if not explicitly set
-                    if not check_interval:
-                        default_interval = int(response.headers.get('Retry-After', default_interval))
+        Raises:
+            FabricApiError: If the operation fails, is cancelled or times out
+        """
+        name = operation_name or "operation"
+        with profile_span(name, "lro", url=job_url):
+            result = self.wait_for_lros({name: job_url}, max_wait_time=max_wait_time, check_interval=check_interval)[name]
+        if isinstance(result, FabricApiError):
+            raise result
+        return result
+
+    def delete_many(self,
+                    resources: Dict[str, str],
+                    max_parallel: int = 8) -> Dict[str, Union[bool, FabricApiError]]:
+        """
+        Delete several resources concurrently and wait for their LROs together.
+
+        DELETE requests are sent from up to max_parallel threads (paced by the shared rate
+        limiters). Deletions answered with 202 are then awaited from a single wait_for_lros
+        polling loop instead of one blocking wait per resource.
+
+        Args:
+            resources: Dictionary mapping names (for logging) to API URIs, e.g. "workspaces/{id}"
+            max_parallel: Maximum number of DELETE requests in flight
+
+        Returns:
+            Dictionary mapping names to True if deleted, False if not found, or to the
+            FabricApiError raised for deletions that failed
+        """
+        def start_delete(uri: str) -> requests.Response:
+            return self.start_long_running_operation(uri, method="DELETE")
+
+        results: Dict[str, Union[bool, FabricApiError]] = {}
+        operations = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_parallel, len(resources) or 1))) as executor:
+            futures = {name: executor.submit(contextvars.copy_context().run, start_delete, uri)
+                       for name, uri in resources.items()}
+            for name, future in futures.items():
+                try:
+                    response = future.result()
+                except FabricApiError as e:
+                    results[name] = False if e.status_code == 404 else e
                     continue
+                except Exception as e:
+                    results[name] = FabricApiError(f"Error deleting {name}: {e}")
+                    continue
+
+                if response.status_code in [200, 204]:
+                    results[name] = True
+                elif response.status_code == 404:
+                    results[name] = False
+                elif response.status_code == 202 and self._get_lro_url(response):
+                    operations[name] = self._get_lro_url(response)
                 else:
-                    raise FabricApiError(f"{operation_display} failed with status {response.status_code}: {response.text}")
-                    
-            except requests.RequestException as e:
-                raise FabricApiError(f"Error checking {operation_display} status: {str(e)}")
+                    results[name] = FabricApiError(f"Failed to delete {name}: {response.status_code}", response.status_code)
+
+        if operations:
+            for name, result in self.wait_for_lros(operations).items():
+                results[name] = result if isinstance(result, FabricApiError) else True
+
+        deleted = sum(1 for result in results.values() if result is True)
+        self._log(f"Deleted {deleted} of {len(resources)} resource(s)")
+        return results
+
+    def _get_page(self, uri: str, continuation_token: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get a single page of a paginated list endpoint.
+        
+        Args:
+            uri: API endpoint URI (relative to base URL)
+            continuation_token: Optional token for retrieving the next page of results
+            
+        Returns:
+            Raw API response containing value and, if more results exist, continuationToken
+            
+        Raises:
+            FabricApiError: If request fails
+        """
+        if continuation_token:
+            separator = '&' if '?' in uri else '?'
+            uri = f"{uri}{separator}continuationToken={quote(continuation_token, safe='')}"
         
-        raise FabricApiError(f"{operation_display} timed out after {self._format_duration(max_wait_time)}")
+        response = self._make_request(uri)
+        if response.status_code != 200:
+            raise FabricApiError(f"Failed to list {uri.split('?')[0]}: HTTP {response.status_code}", response.status_code)
+        return response.json()
+    
+    def paginate(self, uri: str, continuation_token: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate over all items of a paginated list endpoint.
+        
+        Items are yielded as each page arrives and the next page is only requested
+        once the current one has been consumed, so callers that stop early (e.g.
+        name lookups) do not fetch the remaining pages.
+        
+        Args:
+            uri: API endpoint URI (relative to base URL)
+            continuation_token: Optional token to start from a specific page
+            
+        Yields:
+            Items from the 'value' array of each page
+            
+        Raises:
+            FabricApiError: If a page request fails
+            
+        Example:
+            for eventhouse in client.paginate(f"workspaces/{workspace_id}/eventhouses"):
+                if eventhouse['displayName'] == "my_eventhouse":
+                    break
+        """
+        current_token = continuation_token
+        page_number = 1
+        
+        while True:
+            page = self._get_page(uri, current_token)
+            yield from page.get('value', [])
+            
+            current_token = page.get('continuationToken')
+            if not current_token:
+                return
+            page_number += 1
+            self._log(f"Fetching page {page_number} of {uri}")
     
     def get_capacities(self) -> List[Dict[str, Any]]:
         """
@@ -388,16 +695,9 @@ class FabricApiClient:
         self._log("Getting all capacities accessible to user")
         
         try:
-            response = self._make_request("capacities")
-            
-            if response.status_code == 200:
-                capacities = response.json().get('value', [])
-                self._log(f"Found {len(capacities)} capacity(ies)")
-                return capacities
-            else:
-                error_msg = f"Failed to get capacities: HTTP {response.status_code}"
-                self._log(error_msg, level="error")
-                raise FabricApiError(error_msg)
+            capacities = list(self.paginate("capacities"))
+            self._log(f"Found {len(capacities)} capacity(ies)")
+            return capacities
                 
         except FabricApiError:
             raise
@@ -439,16 +739,9 @@ class FabricApiClient:
             FabricApiError: If request fails
         """
         try:
-            response = self._make_request("workspaces")
-            
-            if response.status_code == 200:
-                workspaces = response.json().get('value', [])
-                self._log(f"Found {len(workspaces)} workspaces")
-                return workspaces
-            else:
-                error_msg = f"Failed to get workspaces: HTTP {response.status_code}"
-                self._log(error_msg, level="error")
-                raise FabricApiError(error_msg)
+            workspaces = list(self.paginate("workspaces"))
+            self._log(f"Found {len(workspaces)} workspaces")
+            return workspaces
                 
         except FabricApiError:
             raise
@@ -668,50 +961,19 @@ class FabricApiClient:
         """
         self._log(f"Getting workspace role assignments for workspace {workspace_id}")
         
-        # Build query parameters
-        params = []
-        if continuation_token:
-            params.append(f"continuationToken={continuation_token}")
+        uri = f"workspaces/{workspace_id}/roleAssignments"
         
-        query_string = f"?{'&'.join(params)}" if params else ""
-        uri = f"workspaces/{workspace_id}/roleAssignments{query_string}"
+        if get_all:
+            # Collect all role assignments across all pages
+            all_role_assignments = list(self.paginate(uri, continuation_token))
+            self._log(f"Retrieved {len(all_role_assignments)} total role assignment(s)")
+            return all_role_assignments
         
-        # Make the API request
-        response = self._make_request(uri)
-        
-        if response.status_code == 200:
-            response_data = response.json()
-            
-            if get_all:
-                # Collect all role assignments across all pages
-                all_role_assignments = response_data.get('value', [])
-                
-                # Continue fetching pages if continuation token exists
-                while 'continuationToken' in response_data:
-                    next_token = response_data['continuationToken']
-                    self._log(f"Fetching next page of role assignments (token: {next_token[:20]}...)")
-                    
-                    next_params = [f"continuationToken={next_token}"]
-                    next_query = f"?{'&'.join(next_params)}"
-                    next_uri = f"workspaces/{workspace_id}/roleAssignments{next_query}"
-                    
-                    next_response = self._make_request(next_uri)
-                    if next_response.status_code == 200:
-                        next_data = next_response.json()
-                        all_role_assignments.extend(next_data.get('value', []))
-                        response_data = next_data
-                    else:
-                        raise FabricApiError(f"Failed to fetch next page of role assignments: {next_response.status_code}")
-                
-                self._log(f"Retrieved {len(all_role_assignments)} total role assignment(s)")
-                return all_role_assignments
-            else:
-                # Return raw response with pagination info
-                role_assignments = response_data.get('value', [])
-                self._log(f"Retrieved {len(role_assignments)} role assignment(s) in current page")
-                return response_data
-        else:
-            raise FabricApiError(f"Failed to get workspace role assignments: {response.status_code}")
+        # Return raw response with pagination info
+        response_data = self._get_page(uri, continuation_token)
+        role_assignments = response_data.get('value', [])
+        self._log(f"Retrieved {len(role_assignments)} role assignment(s) in current page")
+        return response_data
     
     def get_workspace_role_assignment_by_principal(self, 
                                                   workspace_id: str, 
@@ -731,10 +993,8 @@ class FabricApiClient:
         """
         self._log(f"Searching for role assignment for principal {principal_id} in workspace {workspace_id}")
         
-        role_assignments = self.get_workspace_role_assignments(workspace_id, get_all=True)
-        
-        # Search for the specific principal
-        for assignment in role_assignments:
+        # Search for the specific principal, stopping at the first match
+        for assignment in self.paginate(f"workspaces/{workspace_id}/roleAssignments"):
             if assignment.get('principal', {}).get('id') == principal_id:
                 self._log(f"Found role assignment: {assignment.get('role')} for principal {principal_id}")
                 return assignment
@@ -858,14 +1118,9 @@ class FabricApiClient:
             FabricApiError: If request fails
         """
         self._log("Getting all connections")
-        response = self._make_request(f"connections")
-        
-        if response.status_code == 200:
-            connections = response.json().get("value", [])
-            self._log(f"Found {len(connections)} connection(s)")
-            return connections
-        else:
-            raise FabricApiError(f"Failed to list connections: {response.status_code}")
+        connections = list(self.paginate("connections"))
+        self._log(f"Found {len(connections)} connection(s)")
+        return connections
     
     def get_connection(self, connection_id: str) -> Dict[str, Any]:
         """
@@ -964,27 +1219,34 @@ class FabricWorkspaceApiClient(FabricApiClient):
     
     def __init__(self, 
                  workspace_id: str,
-                 api_url: str = "https://api.fabric.microsoft.com/v1",
+                 api_url: Optional[str] = None,
                  resource_url: str = "https://api.fabric.microsoft.com",
                  credential: Optional[Any] = None,
-                 timeout_sec: int = 240):
+                 timeout_sec: int = 240,
+                 lro_max_wait_sec: int = 1800,
+                 item_index_ttl_sec: int = 300):
         """
         Initialize the FabricWorkspaceApiClient.
         
         Args:
             workspace_id: ID of the target workspace
-            api_url: Base URL for Fabric API
+            api_url: Base URL for Fabric API (defaults to FABRIC_API_URL or the public endpoint)
             resource_url: Resource URL for authentication scope
-            credential: Azure credential object (defaults to AzureCliCredential)
+            credential: Azure credential object (defaults to the shared cached AzureCliCredential)
             timeout_sec: Default timeout for API requests
+            lro_max_wait_sec: Maximum time to wait for a long-running operation
+            item_index_ttl_sec: Time after which the cached item index is reloaded
         """
         super().__init__(
             api_url=api_url,
             resource_url=resource_url,
             credential=credential,
-            timeout_sec=timeout_sec
+            timeout_sec=timeout_sec,
+            lro_max_wait_sec=lro_max_wait_sec
         )
         self.workspace_id = workspace_id
+        self.item_index_ttl_sec = item_index_ttl_sec
+        self._indexes = {}
         self._log(f"FabricWorkspaceApiClient initialized for workspace: {workspace_id}")
     
     def get_workspace_info(self) -> Dict[str, Any]:
@@ -1016,14 +1278,166 @@ class FabricWorkspaceApiClient(FabricApiClient):
         Returns:
             List of items
         """
-        response = self._make_request(f"workspaces/{self.workspace_id}/items")
-        items = response.json().get('value', [])
+        items = list(self.paginate(f"workspaces/{self.workspace_id}/items"))
         
         if item_type:
             items = [item for item in items if item.get('type', '').lower() == item_type.lower()]
         
         return items
     
+    def get_item_definition(self, item_id: str, definition_format: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get the public definition of an item in the workspace.
+
+        Args:
+            item_id: ID of the item
+            definition_format: Optional definition format (e.g., "ipynb" for notebooks)
+
+        Returns:
+            Definition object containing the list of parts (path, payload, payloadType)
+
+        Raises:
+            FabricApiError: If request fails
+
+        Required Scopes:
+            Item.ReadWrite.All or the item type specific ReadWrite scope
+
+        Reference:
+            https://learn.microsoft.com/en-us/rest/api/fabric/core/items/get-item-definition
+        """
+        try:
+            self._log(f"Getting definition for item {item_id} in workspace {self.workspace_id}")
+
+            uri = f"workspaces/{self.workspace_id}/items/{item_id}/getDefinition"
+            if definition_format:
+                uri += f"?format={definition_format}"
+
+            response = self._make_request(uri, method="POST", wait_for_lro=False)
+
+            # getDefinition may run as an LRO; the definition is then served from the operation result
+            if response.status_code == 202:
+                location = self._get_lro_url(response)
+                if not location:
+                    raise FabricApiError("getDefinition returned 202 without a Location header")
+                self._wait_for_lro_completion(
+                    job_url=location,
+                    operation_name=f"getDefinition {item_id}"
+                )
+                # Through _make_request, so the result fetch is rate limited and retried like any call
+                response = self._make_request(f"{location.rstrip('/')}/result", wait_for_lro=False)
+                if response.status_code != 200:
+                    raise FabricApiError(f"Failed to get item definition result: HTTP {response.status_code}", response.status_code)
+
+            return response.json().get('definition', {})
+
+        except FabricApiError:
+            raise
+        except Exception as e:
+            raise FabricApiError(f"Unexpected error getting definition for item '{item_id}': {str(e)}")
+
+    # Item index operations
+    def _get_index(self, kind: str) -> Dict[tuple, Dict[str, Any]]:
+        """
+        Get the cached index of workspace items or folders, reloading it once expired.
+        
+        Args:
+            kind: "items" (keyed by type, displayName, folderId) or
+                  "folders" (keyed by "folder", displayName, parentFolderId)
+            
+        Returns:
+            Dictionary mapping lower-cased keys to item objects
+        """
+        cached = self._indexes.get(kind)
+        if cached and time.time() - cached['loaded_at'] < self.item_index_ttl_sec:
+            return cached['index']
+        
+        self._log(f"Loading {kind} index for workspace {self.workspace_id}")
+        index = {}
+        for item in self.paginate(f"workspaces/{self.workspace_id}/{kind}"):
+            index[self._get_index_key(kind, item)] = item
+        self._indexes[kind] = {'index': index, 'loaded_at': time.time()}
+        self._log(f"Indexed {len(index)} {kind}")
+        return index
+    
+    def _get_index_key(self, kind: str, item: Dict[str, Any]) -> tuple:
+        """Build the index key of an item or folder."""
+        if kind == "folders":
+            return ("folder", item.get('displayName', '').lower(), item.get('parentFolderId'))
+        return (item.get('type', '').lower(), item.get('displayName', '').lower(), item.get('folderId'))
+    
+    def _index_item(self, item: Optional[Dict[str, Any]], item_type: Optional[str] = None, kind: str = "items") -> None:
+        """
+        Add a newly created item to the cached index.
+        
+        Responses without an ID or display name (e.g. LRO status payloads) cannot be
+        indexed, so the index is dropped and reloaded on the next lookup instead.
+        """
+        if kind not in self._indexes:
+            return
+        if not isinstance(item, dict) or not item.get('id') or not item.get('displayName'):
+            self.invalidate_item_index(kind)
+            return
+        if item_type and not item.get('type'):
+            item = {**item, 'type': item_type}
+        self._indexes[kind]['index'][self._get_index_key(kind, item)] = item
+    
+    def _unindex_item(self, item_id: str) -> None:
+        """Remove an item or folder from the cached indexes by ID."""
+        for cached in self._indexes.values():
+            index = cached['index']
+            for key in [key for key, item in index.items() if item.get('id') == item_id]:
+                del index[key]
+    
+    def invalidate_item_index(self, kind: Optional[str] = None) -> None:
+        """
+        Drop the cached item index so the next lookup reloads it.
+        
+        Args:
+            kind: Optional index to drop ("items" or "folders"), defaults to all
+        """
+        if kind:
+            self._indexes.pop(kind, None)
+        else:
+            self._indexes.clear()
+    
+    def find_item(self,
+                  item_type: str,
+                  display_name: str,
+                  folder_id: Optional[str] = None,
+                  case_sensitive: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Find an item by type and display name using the cached workspace item index.
+        
+        The index is built from a single workspaces/{id}/items listing and reused for
+        all lookups until it expires (item_index_ttl_sec). Creates and deletes made
+        through this client keep it up to date.
+        
+        Args:
+            item_type: Fabric item type (e.g., "Eventhouse", "Notebook", "Reflex")
+            display_name: Display name of the item
+            folder_id: Optional folder ID to restrict the search to (any folder if None)
+            case_sensitive: Whether the display name must match exactly
+            
+        Returns:
+            Item object (id, displayName, description, type, workspaceId, folderId) if found, None otherwise
+            
+        Raises:
+            FabricApiError: If loading the index fails
+        """
+        index = self._get_index("items")
+        type_key = item_type.lower()
+        name_key = display_name.strip().lower()
+        
+        if folder_id:
+            candidates = [index.get((type_key, name_key, folder_id))]
+        else:
+            candidates = [item for key, item in index.items() if key[0] == type_key and key[1] == name_key]
+        
+        for item in candidates:
+            if item and (not case_sensitive or item.get('displayName', '').strip() == display_name.strip()):
+                return item
+        return None
+    
     def assign_to_capacity(self, capacity_id: str) -> None:
         """
         Assign this workspace to a capacity.
@@ -1189,50 +1603,19 @@ class FabricWorkspaceApiClient(FabricApiClient):
         """
         self._log(f"Getting workspace role assignments for workspace {self.workspace_id}")
         
-        # Build query parameters
-        params = []
-        if continuation_token:
-            params.append(f"continuationToken={continuation_token}")
-        
-        query_string = f"?{'&'.join(params)}" if params else ""
-        uri = f"workspaces/{self.workspace_id}/roleAssignments{query_string}"
+        uri = f"workspaces/{self.workspace_id}/roleAssignments"
         
-        # Make the API request
-        response = self._make_request(uri)
+        if get_all:
+            # Collect all role assignments across all pages
+            all_role_assignments = list(self.paginate(uri, continuation_token))
+            self._log(f"Retrieved {len(all_role_assignments)} total role assignment(s)")
+            return all_role_assignments
         
-        if response.status_code == 200:
-            response_data = response.json()
-            
-            if get_all:
-                # Collect all role assignments across all pages
-                all_role_assignments = response_data.get('value', [])
-                
-                # Continue fetching pages if continuation token exists
-                while 'continuationToken' in response_data:
-                    next_token = response_data['continuationToken']
-                    self._log(f"Fetching next page of role assignments (token: {next_token[:20]}...)")
-                    
-                    next_params = [f"continuationToken={next_token}"]
-                    next_query = f"?{'&'.join(next_params)}"
-                    next_uri = f"workspaces/{self.workspace_id}/roleAssignments{next_query}"
-                    
-                    next_response = self._make_request(next_uri)
-                    if next_response.status_code == 200:
-                        next_data = next_response.json()
-                        all_role_assignments.extend(next_data.get('value', []))
-                        response_data = next_data
-                    else:
-                        raise FabricApiError(f"Failed to fetch next page of role assignments: {next_response.status_code}")
-                
-                self._log(f"Retrieved {len(all_role_assignments)} total role assignment(s)")
-                return all_role_assignments
-            else:
-                # Return raw response with pagination info
-                role_assignments = response_data.get('value', [])
-                self._log(f"Retrieved {len(role_assignments)} role assignment(s) in current page")
-                return response_data
-        else:
-            raise FabricApiError(f"Failed to get workspace role assignments: {response.status_code}")
+        # Return raw response with pagination info
+        response_data = self._get_page(uri, continuation_token)
+        role_assignments = response_data.get('value', [])
+        self._log(f"Retrieved {len(role_assignments)} role assignment(s) in current page")
+        return response_data
     
     def get_role_assignment_by_principal(self, 
                                         principal_id: str) -> Optional[Dict[str, Any]]:
@@ -1250,10 +1633,8 @@ class FabricWorkspaceApiClient(FabricApiClient):
         """
         self._log(f"Searching for role assignment for principal {principal_id} in workspace {self.workspace_id}")
         
-        role_assignments = self.get_role_assignments(get_all=True)
-        
-        # Search for the specific principal
-        for assignment in role_assignments:
+        # Search for the specific principal, stopping at the first match
+        for assignment in self.paginate(f"workspaces/{self.workspace_id}/roleAssignments"):
             if assignment.get('principal', {}).get('id') == principal_id:
                 self._log(f"Found role assignment: {assignment.get('role')} for principal {principal_id}")
                 return assignment
@@ -1281,16 +1662,9 @@ class FabricWorkspaceApiClient(FabricApiClient):
         """
         try:
             self._log(f"Getting folders from workspace {self.workspace_id}")
-            response = self._make_request(f"workspaces/{self.workspace_id}/folders")
-            
-            if response.status_code == 200:
-                folders = response.json().get('value', [])
-                self._log(f"Found {len(folders)} folder(s)")
-                return folders
-            else:
-                error_msg = f"Failed to get folders: HTTP {response.status_code}"
-                self._log(error_msg, level="error")
-                raise FabricApiError(error_msg)
+            folders = list(self.paginate(f"workspaces/{self.workspace_id}/folders"))
+            self._log(f"Found {len(folders)} folder(s)")
+            return folders
                 
         except FabricApiError:
             raise
@@ -1334,6 +1708,12 @@ class FabricWorkspaceApiClient(FabricApiClient):
             
             if response.status_code in [200, 201]:
                 folder_id = response.json()['id']
+                self._index_item({
+                    "id": folder_id,
+                    "displayName": display_name,
+                    "parentFolderId": parent_folder_id,
+                    "workspaceId": self.workspace_id
+                }, kind="folders")
                 self._log(f"Successfully created folder '{display_name}' with ID: {folder_id}")
                 return folder_id
             else:
@@ -1348,13 +1728,14 @@ class FabricWorkspaceApiClient(FabricApiClient):
             self._log(error_msg, level="error")
             raise FabricApiError(error_msg)
     
-    def get_folder_by_name(self, folder_name: str, parent_folder_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    def get_folder_by_name(self, folder_name: str, parent_folder_id: Optional[str] = None, use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """
         Get a folder by name in the workspace.
         
         Args:
             folder_name: Name of the folder to find
             parent_folder_id: Optional parent folder ID to search within (None for root folders)
+            use_cache: Whether to use the cached folder index instead of listing folders
             
         Returns:
             Folder object if found, None otherwise
@@ -1367,6 +1748,15 @@ class FabricWorkspaceApiClient(FabricApiClient):
         """
         try:
             self._log(f"Searching for folder '{folder_name}' in workspace {self.workspace_id}")
+            
+            if use_cache:
+                folder = self._get_index("folders").get(("folder", folder_name.lower(), parent_folder_id))
+                if folder:
+                    self._log(f"Found folder '{folder_name}' with ID: {folder['id']}")
+                else:
+                    self._log(f"Folder '{folder_name}' not found")
+                return folder
+            
             folders = self.get_folders()
             
             # Filter folders by parent_folder_id and name
@@ -1450,6 +1840,8 @@ class FabricWorkspaceApiClient(FabricApiClient):
         if response.status_code in [201, 202]:
             eventhouse = response.json()
             eventhouse_id = eventhouse.get('id', 'N/A')
+            # The eventhouse also creates a default KQL database, so reload the index on next lookup
+            self.invalidate_item_index("items")
             self._log(f"Successfully created Eventhouse '{display_name}' with ID: {eventhouse_id}")
             return eventhouse
         else:
@@ -1497,55 +1889,27 @@ class FabricWorkspaceApiClient(FabricApiClient):
         """
         self._log(f"Getting Eventhouses for workspace {self.workspace_id}")
         
-        # Build query parameters
-        params = []
-        if continuation_token:
-            params.append(f"continuationToken={continuation_token}")
+        uri = f"workspaces/{self.workspace_id}/eventhouses"
         
-        query_string = f"?{'&'.join(params)}" if params else ""
-        uri = f"workspaces/{self.workspace_id}/eventhouses{query_string}"
+        if get_all:
+            # Collect all eventhouses across all pages
+            all_eventhouses = list(self.paginate(uri, continuation_token))
+            self._log(f"Retrieved {len(all_eventhouses)} total Eventhouse(s)")
+            return all_eventhouses
         
-        # Make the API request
-        response = self._make_request(uri)
-        
-        if response.status_code == 200:
-            response_data = response.json()
-            
-            if get_all:
-                # Collect all eventhouses across all pages
-                all_eventhouses = response_data.get('value', [])
-                
-                # Continue fetching pages if continuation token exists
-                while 'continuationToken' in response_data:
-                    next_token = response_data['continuationToken']
-                    self._log(f"Fetching next page with token: {next_token[:20]}...")
-                    
-                    # Make request for next page
-                    next_uri = f"workspaces/{self.workspace_id}/eventhouses?continuationToken={next_token}"
-                    next_response = self._make_request(next_uri)
-                    
-                    if next_response.status_code == 200:
-                        response_data = next_response.json()
-                        all_eventhouses.extend(response_data.get('value', []))
-                    else:
-                        raise FabricApiError(f"Failed to get next page of Eventhouses: {next_response.status_code}")
-                
-                self._log(f"Retrieved {len(all_eventhouses)} total Eventhouse(s)")
-                return all_eventhouses
-            else:
-                # Return raw response with pagination info
-                eventhouses = response_data.get('value', [])
-                self._log(f"Retrieved {len(eventhouses)} Eventhouse(s) in current page")
-                return response_data
-        else:
-            raise FabricApiError(f"Failed to get Eventhouses: {response.status_code}")
+        # Return raw response with pagination info
+        response_data = self._get_page(uri, continuation_token)
+        eventhouses = response_data.get('value', [])
+        self._log(f"Retrieved {len(eventhouses)} Eventhouse(s) in current page")
+        return response_data
     
-    def get_eventhouse_by_name(self, eventhouse_name: str) -> Optional[Dict[str, Any]]:
+    def get_eventhouse_by_name(self, eventhouse_name: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """
         Get an Eventhouse by name from the workspace.
         
         Args:
             eventhouse_name: Name of the Eventhouse to find
+            use_cache: Whether to resolve the name through the cached item index
             
         Returns:
             Eventhouse object if found, None otherwise
@@ -1555,10 +1919,16 @@ class FabricWorkspaceApiClient(FabricApiClient):
         """
         self._log(f"Searching for Eventhouse '{eventhouse_name}' in workspace {self.workspace_id}")
         
-        eventhouses = self.list_eventhouses(get_all=True)
+        if use_cache:
+            item = self.find_item("Eventhouse", eventhouse_name)
+            if not item:
+                self._log(f"Eventhouse '{eventhouse_name}' not found")
+                return None
+            # The item index has no eventhouse properties (query URIs), so fetch the full object
+            return self.get_eventhouse_by_id(item['id'])
         
-        # Search for the eventhouse by name (case-insensitive)
-        for eventhouse in eventhouses:
+        # Search for the eventhouse by name (case-insensitive), stopping at the first match
+        for eventhouse in self.paginate(f"workspaces/{self.workspace_id}/eventhouses"):
             if eventhouse.get('displayName', '').lower() == eventhouse_name.lower():
                 self._log(f"Found Eventhouse '{eventhouse_name}' with ID: {eventhouse.get('id')}")
                 return eventhouse
@@ -1598,6 +1968,8 @@ class FabricWorkspaceApiClient(FabricApiClient):
         response = self._make_request(f"workspaces/{self.workspace_id}/eventhouses/{eventhouse_id}", method="DELETE")
         
         if response.status_code in [200, 204]:
+            # Child KQL databases are deleted with the eventhouse
+            self.invalidate_item_index("items")
             self._log(f"Successfully deleted Eventhouse")
             return True
         else:
@@ -1690,57 +2062,27 @@ class FabricWorkspaceApiClient(FabricApiClient):
         """
         self._log(f"Getting KQL dashboards for workspace {self.workspace_id}")
         
-        # Build query parameters
-        params = []
-        if continuation_token:
-            params.append(f"continuationToken={continuation_token}")
+        uri = f"workspaces/{self.workspace_id}/kqlDashboards"
         
-        query_string = f"?{'&'.join(params)}" if params else ""
-        uri = f"workspaces/{self.workspace_id}/kqlDashboards{query_string}"
+        if get_all:
+            # Collect all KQL dashboards across all pages
+            all_dashboards = list(self.paginate(uri, continuation_token))
+            self._log(f"Retrieved {len(all_dashboards)} total KQL dashboard(s)")
+            return all_dashboards
         
-        # Make the API request
-        response = self._make_request(uri)
-        
-        if response.status_code == 200:
-            response_data = response.json()
-            
-            if get_all:
-                # Collect all KQL dashboards across all pages
-                all_dashboards = response_data.get('value', [])
-                
-                # Continue fetching pages if continuation token exists
-                while 'continuationToken' in response_data:
-                    next_token = response_data['continuationToken']
-                    self._log(f"Fetching next page of KQL dashboards (token: {next_token[:20]}...)")
-                    
-                    next_params = [f"continuationToken={next_token}"]
-                    next_query = f"?{'&'.join(next_params)}"
-                    next_uri = f"workspaces/{self.workspace_id}/kqlDashboards{next_query}"
-                    
-                    next_response = self._make_request(next_uri)
-                    if next_response.status_code == 200:
-                        next_data = next_response.json()
-                        all_dashboards.extend(next_data.get('value', []))
-                        response_data = next_data
-                    else:
-                        raise FabricApiError(f"Failed to fetch next page of KQL dashboards: {next_response.status_code}")
-                
-                self._log(f"Retrieved {len(all_dashboards)} total KQL dashboard(s)")
-                return all_dashboards
-            else:
-                # Return raw response with pagination info
-                dashboards = response_data.get('value', [])
-                self._log(f"Retrieved {len(dashboards)} KQL dashboard(s) in current page")
-                return response_data
-        else:
-            raise FabricApiError(f"Failed to get KQL dashboards: {response.status_code}")
+        # Return raw response with pagination info
+        response_data = self._get_page(uri, continuation_token)
+        dashboards = response_data.get('value', [])
+        self._log(f"Retrieved {len(dashboards)} KQL dashboard(s) in current page")
+        return response_data
     
-    def get_kql_dashboard_by_name(self, dashboard_name: str) -> Optional[Dict[str, Any]]:
+    def get_kql_dashboard_by_name(self, dashboard_name: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """
         Get a KQL dashboard by name from the workspace.
         
         Args:
             dashboard_name: Name of the KQL dashboard to find
+            use_cache: Whether to use the cached item index instead of listing dashboards
             
         Returns:
             KQL Dashboard object if found, None otherwise
@@ -1750,10 +2092,16 @@ class FabricWorkspaceApiClient(FabricApiClient):
         """
         self._log(f"Searching for KQL dashboard '{dashboard_name}' in workspace {self.workspace_id}")
         
-        dashboards = self.list_kql_dashboards(get_all=True)
+        if use_cache:
+            dashboard = self.find_item("KQLDashboard", dashboard_name)
+            if dashboard:
+                self._log(f"Found KQL dashboard: {dashboard.get('id')}")
+            else:
+                self._log(f"KQL dashboard '{dashboard_name}' not found")
+            return dashboard
         
-        # Search for the dashboard by name (case-insensitive)
-        for dashboard in dashboards:
+        # Search for the dashboard by name (case-insensitive), stopping at the first match
+        for dashboard in self.paginate(f"workspaces/{self.workspace_id}/kqlDashboards"):
             if dashboard.get('displayName', '').lower() == dashboard_name.lower():
                 self._log(f"Found KQL dashboard: {dashboard.get('id')}")
                 return dashboard
@@ -1883,6 +2231,7 @@ class FabricWorkspaceApiClient(FabricApiClient):
         if response.status_code in [201, 202]:
             dashboard = response.json()
             dashboard_id = dashboard.get('id', 'N/A')
+            self._index_item(dashboard, "KQLDashboard")
             self._log(f"Successfully created KQL dashboard '{display_name}' with ID: {dashboard_id}")
             return dashboard
         else:
@@ -1915,6 +2264,7 @@ class FabricWorkspaceApiClient(FabricApiClient):
         )
         
         if response.status_code in [200, 204]:
+            self._unindex_item(dashboard_id)
             self._log(f"Successfully deleted KQL dashboard")
             return True
         else:
@@ -2051,52 +2401,27 @@ class FabricWorkspaceApiClient(FabricApiClient):
         """
         self._log(f"Getting Eventstreams for workspace {self.workspace_id}")
         
-        # Build query parameters
-        params = []
-        if continuation_token:
-            params.append(f"continuationToken={continuation_token}")
-        
-        query_string = f"?{'&'.join(params)}" if params else ""
-        uri = f"workspaces/{self.workspace_id}/eventstreams{query_string}"
+        uri = f"workspaces/{self.workspace_id}/eventstreams"
         
-        # Make the API request
-        response = self._make_request(uri)
+        if get_all:
+            # Collect all eventstreams across all pages
+            all_eventstreams = list(self.paginate(uri, continuation_token))
+            self._log(f"Retrieved {len(all_eventstreams)} total eventstream(s)")
+            return all_eventstreams
         
-        if response.status_code == 200:
-            response_data = response.json()
-            
-            if get_all:
-                all_eventstreams = response_data.get('value', [])
-                current_token = response_data.get('continuationToken')
-                
-                # Continue fetching pages if continuation token exists
-                while current_token:
-                    next_uri = f"workspaces/{self.workspace_id}/eventstreams?continuationToken={current_token}"
-                    next_response = self._make_request(next_uri)
-                    
-                    if next_response.status_code == 200:
-                        next_data = next_response.json()
-                        next_eventstreams = next_data.get('value', [])
-                        all_eventstreams.extend(next_eventstreams)
-                        current_token = next_data.get('continuationToken')
-                    else:
-                        raise FabricApiError(f"Failed to get additional eventstreams page: {next_response.status_code}")
-                
-                self._log(f"Retrieved {len(all_eventstreams)} eventstream(s)")
-                return all_eventstreams
-            else:
-                eventstreams = response_data.get('value', [])
-                self._log(f"Retrieved {len(eventstreams)} eventstream(s) (single page)")
-                return response_data
-        else:
-            raise FabricApiError(f"Failed to get eventstreams: {response.status_code}")
+        # Return raw response with pagination info
+        response_data = self._get_page(uri, continuation_token)
+        eventstreams = response_data.get('value', [])
+        self._log(f"Retrieved {len(eventstreams)} eventstream(s) in current page")
+        return response_data
     
-    def get_eventstream_by_name(self, eventstream_name: str) -> Optional[Dict[str, Any]]:
+    def get_eventstream_by_name(self, eventstream_name: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """
         Get an Eventstream by name from the workspace.
         
         Args:
             eventstream_name: Name of the Eventstream to find
+            use_cache: Whether to use the cached item index instead of listing eventstreams
             
         Returns:
             Eventstream object if found, None otherwise
@@ -2115,10 +2440,16 @@ class FabricWorkspaceApiClient(FabricApiClient):
         """
         self._log(f"Searching for Eventstream '{eventstream_name}' in workspace {self.workspace_id}")
         
-        eventstreams = self.list_eventstreams(get_all=True)
+        if use_cache:
+            eventstream = self.find_item("Eventstream", eventstream_name)
+            if eventstream:
+                self._log(f"Found Eventstream '{eventstream_name}' with ID: {eventstream.get('id', 'N/A')}")
+            else:
+                self._log(f"Eventstream '{eventstream_name}' not found")
+            return eventstream
         
-        # Search for the eventstream by name (case-insensitive)
-        for eventstream in eventstreams:
+        # Search for the eventstream by name (case-insensitive), stopping at the first match
+        for eventstream in self.paginate(f"workspaces/{self.workspace_id}/eventstreams"):
             if eventstream.get('displayName', '').lower() == eventstream_name.lower():
                 eventstream_id = eventstream.get('id', 'N/A')
                 self._log(f"Found Eventstream '{eventstream_name}' with ID: {eventstream_id}")
@@ -2293,8 +2624,9 @@ class FabricWorkspaceApiClient(FabricApiClient):
             # HTTP 200 responses don't provide ID, so find the eventstream by name
             self._log(f"Eventstream creation returned HTTP 200, searching for '{display_name}' by name")
             try:
-                found_eventstream = self.get_eventstream_by_name(display_name)
+                found_eventstream = self.get_eventstream_by_name(display_name, use_cache=False)
                 if found_eventstream:
+                    self._index_item(found_eventstream, "Eventstream")
                     eventstream_id = found_eventstream.get('id', 'N/A')
                     self._log(f"Found created eventstream '{display_name}' with ID {eventstream_id}")
                     return found_eventstream
@@ -2349,6 +2681,7 @@ class FabricWorkspaceApiClient(FabricApiClient):
             )
             
             if response.status_code in [200, 204]:
+                self._unindex_item(eventstream_id)
                 self._log(f"Successfully deleted eventstream {eventstream_id}")
                 return True
             else:
@@ -2524,6 +2857,7 @@ class FabricWorkspaceApiClient(FabricApiClient):
             
             if response.status_code in [200, 201]:
                 result = response.json()
+                self._index_item(result, "KQLDatabase")
                 self._log(f"Successfully created KQL database '{display_name}' with ID: {result.get('id')}")
                 return result
             else:
@@ -2564,49 +2898,19 @@ class FabricWorkspaceApiClient(FabricApiClient):
         try:
             self._log("Listing KQL databases in workspace")
             
+            uri = f"workspaces/{self.workspace_id}/kqlDatabases"
+            
             if get_all:
                 # Get all databases across multiple pages
-                all_databases = []
-                current_token = continuation_token
-                
-                while True:
-                    # Build URI with continuation token if provided
-                    uri = f"workspaces/{self.workspace_id}/kqlDatabases"
-                    if current_token:
-                        uri += f"?continuationToken={current_token}"
-                    
-                    # Make the API request
-                    response = self._make_request(uri, method="GET")
-                    
-                    if response.status_code == 200:
-                        result = response.json()
-                        databases = result.get('value', [])
-                        all_databases.extend(databases)
-                        
-                        # Check if there are more pages
-                        current_token = result.get('continuationToken')
-                        if not current_token:
-                            break
-                    else:
-                        raise FabricApiError(f"Failed to list KQL databases: HTTP {response.status_code}")
-                
+                all_databases = list(self.paginate(uri, continuation_token))
                 self._log(f"Found {len(all_databases)} KQL database(s)")
                 return all_databases
             else:
                 # Get single page response
-                uri = f"workspaces/{self.workspace_id}/kqlDatabases"
-                if continuation_token:
-                    uri += f"?continuationToken={continuation_token}"
-                
-                response = self._make_request(uri, method="GET")
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    databases = result.get('value', [])
-                    self._log(f"Found {len(databases)} KQL database(s) in current page")
-                    return result
-                else:
-                    raise FabricApiError(f"Failed to list KQL databases: HTTP {response.status_code}")
+                result = self._get_page(uri, continuation_token)
+                databases = result.get('value', [])
+                self._log(f"Found {len(databases)} KQL database(s) in current page")
+                return result
                     
         except FabricApiError:
             # Re-raise FabricApiError as-is
@@ -2614,12 +2918,13 @@ class FabricWorkspaceApiClient(FabricApiClient):
         except Exception as e:
             raise FabricApiError(f"Unexpected error listing KQL databases: {str(e)}")
     
-    def get_kql_database_by_name(self, database_name: str) -> Optional[Dict[str, Any]]:
+    def get_kql_database_by_name(self, database_name: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """
         Get a KQL database by name from the workspace.
         
         Args:
             database_name: Name of the KQL database to find
+            use_cache: Whether to use the cached item index instead of listing databases
             
         Returns:
             KQL database object if found, None otherwise
@@ -2637,9 +2942,12 @@ class FabricWorkspaceApiClient(FabricApiClient):
             if not database_name or not database_name.strip():
                 raise FabricApiError("database_name is required and cannot be empty")
             
-            # Get all databases and search for the one with matching name
-            databases = self.list_kql_databases(get_all=True)
-            database = next((d for d in databases if d['displayName'].lower() == database_name.lower()), None)
+            if use_cache:
+                database = self.find_item("KQLDatabase", database_name)
+            else:
+                # Search databases page by page, stopping at the first match
+                databases = self.paginate(f"workspaces/{self.workspace_id}/kqlDatabases")
+                database = next((d for d in databases if d['displayName'].lower() == database_name.lower()), None)
             
             if database:
                 self._log(f"Found KQL database '{database_name}' with ID: {database.get('id')}")
@@ -2705,6 +3013,8 @@ class FabricWorkspaceApiClient(FabricApiClient):
             
             if response.status_code == 200:
                 result = response.json()
+                self._unindex_item(database_id)
+                self._index_item(result, "KQLDatabase")
                 self._log(f"Successfully updated KQL database '{database_id}'")
                 return result
             else:
@@ -2751,6 +3061,7 @@ class FabricWorkspaceApiClient(FabricApiClient):
             response = self._make_request(uri, method="DELETE")
             
             if response.status_code == 200:
+                self._unindex_item(database_id)
                 self._log(f"Successfully deleted KQL database '{database_id}'")
                 return True
             else:
@@ -2810,6 +3121,7 @@ class FabricWorkspaceApiClient(FabricApiClient):
             
             response = self._make_request(f"workspaces/{self.workspace_id}/items", method="POST", data=payload)
             activator_info = response.json()
+            self._index_item(activator_info, "Reflex")
             
             self._log(f"✅ Successfully created activator '{display_name}' with ID: {activator_info.get('id')}")
             return activator_info
@@ -2862,52 +3174,27 @@ class FabricWorkspaceApiClient(FabricApiClient):
         """
         self._log(f"Getting Activators for workspace {self.workspace_id}")
         
-        # Build query parameters
-        params = []
-        if continuation_token:
-            params.append(f"continuationToken={continuation_token}")
+        uri = f"workspaces/{self.workspace_id}/reflexes"
         
-        query_string = f"?{'&'.join(params)}" if params else ""
-        uri = f"workspaces/{self.workspace_id}/reflexes{query_string}"
+        if get_all:
+            # Collect all activators across all pages
+            all_activators = list(self.paginate(uri, continuation_token))
+            self._log(f"Retrieved {len(all_activators)} total activator(s)")
+            return all_activators
         
-        # Make the API request
-        response = self._make_request(uri)
-        
-        if response.status_code == 200:
-            response_data = response.json()
-            
-            if get_all:
-                all_activators = response_data.get('value', [])
-                current_token = response_data.get('continuationToken')
-                
-                # Continue fetching pages if continuation token exists
-                while current_token:
-                    next_uri = f"workspaces/{self.workspace_id}/reflexes?continuationToken={current_token}"
-                    next_response = self._make_request(next_uri)
-                    
-                    if next_response.status_code == 200:
-                        next_data = next_response.json()
-                        next_activators = next_data.get('value', [])
-                        all_activators.extend(next_activators)
-                        current_token = next_data.get('continuationToken')
-                    else:
-                        raise FabricApiError(f"Failed to get additional activators page: {next_response.status_code}")
-                
-                self._log(f"Retrieved {len(all_activators)} activator(s)")
-                return all_activators
-            else:
-                activators = response_data.get('value', [])
-                self._log(f"Retrieved {len(activators)} activator(s) (single page)")
-                return response_data
-        else:
-            raise FabricApiError(f"Failed to get activators: {response.status_code}")
+        # Return raw response with pagination info
+        response_data = self._get_page(uri, continuation_token)
+        activators = response_data.get('value', [])
+        self._log(f"Retrieved {len(activators)} activator(s) in current page")
+        return response_data
     
-    def get_activator_by_name(self, activator_name: str) -> Optional[Dict[str, Any]]:
+    def get_activator_by_name(self, activator_name: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """
         Get an activator (reflex) by name.
         
         Args:
             activator_name: Name of the activator to find
+            use_cache: Whether to use the cached item index instead of listing activators
             
         Returns:
             Activator dictionary if found, None otherwise
@@ -2918,9 +3205,16 @@ class FabricWorkspaceApiClient(FabricApiClient):
         try:
             self._log(f"Searching for activator named '{activator_name}'")
             
-            activators = self.list_activators(get_all=True)
+            if use_cache:
+                activator = self.find_item("Reflex", activator_name, case_sensitive=True)
+                if activator:
+                    self._log(f"✅ Found activator '{activator_name}' with ID: {activator.get('id')}")
+                else:
+                    self._log(f"❌ Activator '{activator_name}' not found")
+                return activator
             
-            for activator in activators:
+            # Search activators page by page, stopping at the first match
+            for activator in self.paginate(f"workspaces/{self.workspace_id}/reflexes"):
                 if activator.get('displayName') == activator_name:
                     self._log(f"✅ Found activator '{activator_name}' with ID: {activator.get('id')}")
                     return activator
@@ -3001,6 +3295,7 @@ class FabricWorkspaceApiClient(FabricApiClient):
         try:
             self._log(f"Deleting activator with ID '{activator_id}'")
             response = self._make_request(f"workspaces/{self.workspace_id}/reflexes/{activator_id}", method="DELETE")
+            self._unindex_item(activator_id)
             self._log(f"✅ Successfully deleted activator")
             return True
             
@@ -3122,13 +3417,14 @@ class FabricWorkspaceApiClient(FabricApiClient):
                 # If ID is not returned in response, get it by searching by name
                 if not data_agent_id:
                     self._log(f"Data Agent ID not returned in response, searching by name")
-                    found_agent = self.get_data_agent_by_name(data_agent_name.strip())
+                    found_agent = self.get_data_agent_by_name(data_agent_name.strip(), use_cache=False)
                     if found_agent and found_agent.get('id'):
                         data_agent = found_agent
                         data_agent_id = found_agent['id']
                     else:
                         raise FabricApiError(f"Data Agent '{data_agent_name}' was created but could not be found or retrieved")
                 
+                self._index_item(data_agent, "DataAgent")
                 self._log(f"Successfully created Data Agent '{data_agent_name}' with ID: {data_agent_id}")
                 return data_agent
             else:
@@ -3160,18 +3456,9 @@ class FabricWorkspaceApiClient(FabricApiClient):
             self._log(f"Getting Data Agents in workspace {self.workspace_id}")
             
             # Make the API request to list dataagents
-            response = self._make_request(
-                f"workspaces/{self.workspace_id}/dataagents", 
-                method="GET"
-            )
-            
-            # Check response status
-            if response.status_code == 200:
-                data_agents = response.json().get('value', [])
-                self._log(f"Found {len(data_agents)} Data Agent(s)")
-                return data_agents
-            else:
-                raise FabricApiError(f"Failed to list Data Agents: HTTP {response.status_code}")
+            data_agents = list(self.paginate(f"workspaces/{self.workspace_id}/dataagents"))
+            self._log(f"Found {len(data_agents)} Data Agent(s)")
+            return data_agents
                 
         except FabricApiError:
             # Re-raise FabricApiError as-is
@@ -3179,12 +3466,13 @@ class FabricWorkspaceApiClient(FabricApiClient):
         except Exception as e:
             raise FabricApiError(f"Unexpected error listing Data Agents: {str(e)}")
     
-    def get_data_agent_by_name(self, data_agent_name: str) -> Optional[Dict[str, Any]]:
+    def get_data_agent_by_name(self, data_agent_name: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """
         Get a Data Agent by name from the workspace.
         
         Args:
             data_agent_name: The name of the Data Agent to find.
+            use_cache: Whether to use the cached item index instead of listing data agents
             
         Returns:
             Dictionary with data agent information if found, None otherwise
@@ -3205,6 +3493,14 @@ class FabricWorkspaceApiClient(FabricApiClient):
             
             self._log(f"Searching for Data Agent '{data_agent_name}' in workspace {self.workspace_id}")
             
+            if use_cache:
+                agent = self.find_item("DataAgent", data_agent_name, case_sensitive=True)
+                if agent:
+                    self._log(f"Found Data Agent '{data_agent_name}' with ID: {agent.get('id', 'N/A')}")
+                else:
+                    self._log(f"Data Agent '{data_agent_name}' not found")
+                return agent
+            
             # Get all data agents
             data_agents = self.get_data_agents()
             
@@ -3236,15 +3532,10 @@ class FabricWorkspaceApiClient(FabricApiClient):
         """
         try:
             self._log(f"Getting notebooks from workspace {self.workspace_id}")
-            response = self._make_request(f"workspaces/{self.workspace_id}/notebooks")
-            
-            if response.status_code == 200:
-                notebooks = response.json().get('value', [])
-                notebook_dict = {notebook['displayName']: notebook['id'] for notebook in notebooks}
-                self._log(f"Found {len(notebooks)} notebook(s)")
-                return notebook_dict
-            else:
-                raise FabricApiError(f"Failed to list notebooks: HTTP {response.status_code}")
+            notebooks = list(self.paginate(f"workspaces/{self.workspace_id}/notebooks"))
+            notebook_dict = {notebook['displayName']: notebook['id'] for notebook in notebooks}
+            self._log(f"Found {len(notebooks)} notebook(s)")
+            return notebook_dict
                 
         except FabricApiError:
             raise
@@ -3304,12 +3595,14 @@ class FabricWorkspaceApiClient(FabricApiClient):
                 
                 # If no ID in response, get notebook by name
                 if not notebook_obj or 'id' not in notebook_obj:
-                    notebook_obj = self.get_notebook_by_name(notebook_name)
+                    notebook_obj = self.get_notebook_by_name(notebook_name, use_cache=False)
                 
                 # Ensure we have a notebook object with ID
                 if not notebook_obj or 'id' not in notebook_obj:
                     raise FabricApiError(f"Failed to retrieve notebook ID after creation for '{notebook_name}'")
                 
+                self._index_item(notebook_obj, "Notebook")
+                
                 return notebook_obj
             else:
                 raise FabricApiError(f"Failed to create notebook: HTTP {response.status_code}")
@@ -3368,12 +3661,13 @@ class FabricWorkspaceApiClient(FabricApiClient):
         except Exception as e:
             raise FabricApiError(f"Unexpected error updating notebook: {str(e)}")
 
-    def get_notebook_by_name(self, notebook_name: str) -> Optional[Dict[str, Any]]:
+    def get_notebook_by_name(self, notebook_name: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """
         Get a notebook by name from the workspace.
         
         Args:
             notebook_name: The name of the notebook to find
+            use_cache: Whether to use the cached item index instead of listing notebooks
             
         Returns:
             Dictionary with notebook information if found, None otherwise
@@ -3388,32 +3682,76 @@ class FabricWorkspaceApiClient(FabricApiClient):
             
             self._log(f"Searching for notebook '{notebook_name}' in workspace {self.workspace_id}")
             
+            if use_cache:
+                notebook = self.find_item("Notebook", notebook_name, case_sensitive=True)
+                if notebook:
+                    self._log(f"Found notebook '{notebook_name}' with ID: {notebook.get('id', 'N/A')}")
+                else:
+                    self._log(f"Notebook '{notebook_name}' not found")
+                return notebook
+            
             # Get all notebooks (raw list)
-            response = self._make_request(f"workspaces/{self.workspace_id}/notebooks")
+            # Find the notebook by name, stopping at the page that contains it
+            for notebook in self.paginate(f"workspaces/{self.workspace_id}/notebooks"):
+                if notebook.get('displayName', '').strip() == notebook_name.strip():
+                    self._log(f"Found notebook '{notebook_name}' with ID: {notebook.get('id', 'N/A')}")
+                    return notebook
             
-            if response.status_code == 200:
-                notebooks = response.json().get('value', [])
-                
-                # Find the notebook by name
-                for notebook in notebooks:
-                    if notebook.get('displayName', '').strip() == notebook_name.strip():
-                        self._log(f"Found notebook '{notebook_name}' with ID: {notebook.get('id', 'N/A')}")
-                        return notebook
-                
-                self._log(f"Notebook '{notebook_name}' not found")
-                return None
-            else:
-                raise FabricApiError(f"Failed to list notebooks: HTTP {response.status_code}")
+            self._log(f"Notebook '{notebook_name}' not found")
+            return None
                 
         except FabricApiError:
             raise
         except Exception as e:
             raise FabricApiError(f"Unexpected error searching for notebook '{notebook_name}': {str(e)}")
 
+    def start_item_job(self, item_id: str, job_type: str = "RunNotebook", execution_data: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Start an on-demand job of an item (e.g., a notebook run) without waiting for it.
+        
+        Args:
+            item_id: ID of the item to run
+            job_type: Job type (e.g., "RunNotebook", "Pipeline")
+            execution_data: Optional execution data (e.g., notebook parameters)
+            
+        Returns:
+            URL of the job instance, for polling with poll_operation()
+            
+        Raises:
+            FabricApiError: If the job cannot be started
+        """
+        self._log(f"Starting {job_type} job of item {item_id}")
+        data = {"executionData": execution_data} if execution_data else None
+        response = self._make_request(f"workspaces/{self.workspace_id}/items/{item_id}/jobs/{job_type}/instances",
+                                      method="POST", data=data, wait_for_lro=False)
+        job_url = self._get_lro_url(response) if response.status_code == 202 else None
+        if not job_url:
+            raise FabricApiError(f"Failed to start {job_type} job of item {item_id}: no job instance location in {response.status_code} response",
+                                 response.status_code)
+        return job_url
+    
+    def cancel_item_job(self, item_id: str, job_instance_id: str) -> None:
+        """
+        Request cancellation of a running job instance.
+        
+        Args:
+            item_id: ID of the item the job runs for
+            job_instance_id: ID of the job instance to cancel
+            
+        Raises:
+            FabricApiError: If the cancellation request fails
+        """
+        self._log(f"Cancelling job instance {job_instance_id} of item {item_id}")
+        self._make_request(f"workspaces/{self.workspace_id}/items/{item_id}/jobs/instances/{job_instance_id}/cancel",
+                           method="POST", wait_for_lro=False)
+    
     def schedule_notebook_job(self, notebook_id: str) -> Dict[str, Any]:
         """
         Schedule a single notebook job and monitor its completion.
         
+        To run several notebooks or jobs at once, or to reattach to jobs started by an
+        interrupted run, use fabric_job_runner.JobRunner instead.
+        
         Args:
             notebook_id: Notebook ID to execute
             
@@ -3440,7 +3778,7 @@ class FabricWorkspaceApiClient(FabricApiClient):
             
             # Handle Long Running Operation (HTTP 202)
             if response.status_code == 202:
-                job_monitoring_url = response.headers.get('location')
+                job_monitoring_url = self._get_lro_url(response)
                 if not job_monitoring_url:
                     error_msg = 'No location header in 202 response'
                     self._log(f"Failed to start notebook {notebook_id}: {error_msg}", "ERROR")
@@ -3450,9 +3788,7 @@ class FabricWorkspaceApiClient(FabricApiClient):
                 try:
                     lro_response = self._wait_for_lro_completion(
                         job_url=job_monitoring_url,
-                        operation_name=f"notebook-{notebook_id}",
-                        max_wait_time=1800,  # 30 minutes for notebook execution
-                        check_interval=20   # 20 seconds between checks
+                        operation_name=f"notebook-{notebook_id}"
                     )
                     
                     # Calculate duration
@@ -3558,7 +3894,9 @@ class FabricWorkspaceApiClient(FabricApiClient):
         
         if response.status_code in [201, 202]:
             self._log(f"Successfully created environment '{display_name}'")
-            return response.json()
+            environment = response.json()
+            self._index_item(environment, "Environment")
+            return environment
         else:
             self._log(f"Failed to create environment '{display_name}': {response.status_code} - {response.text}", "ERROR")
             raise FabricApiError(f"Failed to create environment: {response.text}", response.status_code, response.json() if response.content else None)
@@ -3578,55 +3916,26 @@ class FabricWorkspaceApiClient(FabricApiClient):
         """
         self._log(f"Listing environments in workspace {self.workspace_id}")
         
+        uri = f"workspaces/{self.workspace_id}/environments"
+        
         if not get_all:
             # Single page request
-            uri = f"workspaces/{self.workspace_id}/environments"
-            if continuation_token:
-                uri += f"?continuationToken={continuation_token}"
-                
-            response = self._make_request(uri=uri, method="GET", wait_for_lro=False)
-            
-            if response.status_code == 200:
-                result = response.json()
-                self._log(f"Successfully retrieved {len(result.get('value', []))} environments")
-                return result
-            else:
-                self._log(f"Failed to list environments: {response.status_code} - {response.text}", "ERROR")
-                raise FabricApiError(f"Failed to list environments: {response.text}", response.status_code, response.json() if response.content else None)
+            result = self._get_page(uri, continuation_token)
+            self._log(f"Successfully retrieved {len(result.get('value', []))} environments")
+            return result
         else:
             # Get all environments with automatic pagination
-            all_environments = []
-            current_token = continuation_token
-            
-            while True:
-                uri = f"workspaces/{self.workspace_id}/environments"
-                if current_token:
-                    uri += f"?continuationToken={current_token}"
-                    
-                response = self._make_request(uri=uri, method="GET", wait_for_lro=False)
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    environments = result.get('value', [])
-                    all_environments.extend(environments)
-                    
-                    # Check if there are more pages
-                    current_token = result.get('continuationToken')
-                    if not current_token:
-                        break
-                else:
-                    self._log(f"Failed to list environments: {response.status_code} - {response.text}", "ERROR")
-                    raise FabricApiError(f"Failed to list environments: {response.text}", response.status_code, response.json() if response.content else None)
-            
+            all_environments = list(self.paginate(uri, continuation_token))
             self._log(f"Successfully retrieved {len(all_environments)} environments")
             return all_environments
 
-    def get_environment_by_name(self, environment_name: str) -> Optional[Dict[str, Any]]:
+    def get_environment_by_name(self, environment_name: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """
         Get an environment by its display name.
         
         Args:
             environment_name: Display name of the environment to find
+            use_cache: Whether to use the cached item index instead of listing environments
             
         Returns:
             Dictionary containing the environment details if found, None otherwise
@@ -3634,9 +3943,16 @@ class FabricWorkspaceApiClient(FabricApiClient):
         self._log(f"Getting environment by name: '{environment_name}'")
         
         try:
-            environments = self.list_environments(get_all=True)
+            if use_cache:
+                env = self.find_item("Environment", environment_name, case_sensitive=True)
+                if env:
+                    self._log(f"Found environment '{environment_name}' with ID: {env.get('id')}")
+                else:
+                    self._log(f"Environment '{environment_name}' not found")
+                return env
             
-            for env in environments:
+            # Search environments page by page, stopping at the first match
+            for env in self.paginate(f"workspaces/{self.workspace_id}/environments"):
                 if env.get('displayName') == environment_name:
                     self._log(f"Found environment '{environment_name}' with ID: {env.get('id')}")
                     return env
@@ -3668,6 +3984,7 @@ class FabricWorkspaceApiClient(FabricApiClient):
             )
             
             if response.status_code == 200:
+                self._unindex_item(environment_id)
                 self._log(f"Successfully deleted environment {environment_id}")
                 return True
             else:
@@ -3778,4 +4095,75 @@ class FabricWorkspaceApiClient(FabricApiClient):
             return True
         else:
             self._log(f"Failed to update environment definition {environment_id}: {response.status_code} - {response.text}", "ERROR")
-            return False
\ No newline at end of file
+            return False
+
+    def create_lakehouse(self, display_name: str, folder_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Create a new lakehouse in the workspace.
+        
+        Args:
+            display_name: Display name for the lakehouse
+            folder_id: Optional folder ID where to create the lakehouse
+            
+        Returns:
+            Dictionary containing the created lakehouse details
+        """
+        self._log(f"Creating lakehouse '{display_name}' in workspace {self.workspace_id}")
+        
+        request_body = {
+            "displayName": display_name
+        }
+        
+        if folder_id:
+            request_body["folderId"] = folder_id
+        
+        response = self._make_request(
+            uri=f"workspaces/{self.workspace_id}/lakehouses",
+            method="POST",
+            data=json.dumps(request_body),
+            wait_for_lro=True
+        )
+        
+        if response.status_code in [201, 202]:
+            self._log(f"Successfully created lakehouse '{display_name}'")
+            lakehouse = response.json()
+            self._index_item(lakehouse, "Lakehouse")
+            return lakehouse
+        else:
+            self._log(f"Failed to create lakehouse '{display_name}': {response.status_code} - {response.text}", "ERROR")
+            raise FabricApiError(f"Failed to create lakehouse: {response.text}", response.status_code, response.json() if response.content else None)
+
+    def get_lakehouse_by_name(self, lakehouse_name: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Get a lakehouse by its display name.
+        
+        Args:
+            lakehouse_name: Display name of the lakehouse to find
+            use_cache: Whether to use the cached item index instead of listing lakehouses
+            
+        Returns:
+            Dictionary containing the lakehouse details if found, None otherwise
+        """
+        self._log(f"Getting lakehouse by name: '{lakehouse_name}'")
+        
+        try:
+            if use_cache:
+                lakehouse = self.find_item("Lakehouse", lakehouse_name, case_sensitive=True)
+                if lakehouse:
+                    self._log(f"Found lakehouse '{lakehouse_name}' with ID: {lakehouse.get('id')}")
+                else:
+                    self._log(f"Lakehouse '{lakehouse_name}' not found")
+                return lakehouse
+            
+            # Search lakehouses page by page, stopping at the first match
+            for lakehouse in self.paginate(f"workspaces/{self.workspace_id}/lakehouses"):
+                if lakehouse.get('displayName') == lakehouse_name:
+                    self._log(f"Found lakehouse '{lakehouse_name}' with ID: {lakehouse.get('id')}")
+                    return lakehouse
+                    
+            self._log(f"Lakehouse '{lakehouse_name}' not found")
+            return None
+            
+        except Exception as e:
+            self._log(f"Error getting lakehouse by name '{lakehouse_name}': {str(e)}", "ERROR")
+            return None
@@ -15,12 +15,15 @@ import os
 import sys
 import argparse
 from datetime import datetime
+from typing import Mapping, Optional
+from fabric_profiler import begin_profile_step
 
-def get_required_env_var(var_name: str) -> str:
+def get_required_env_var(var_name: str, env: Optional[Mapping[str, str]] = None) -> str:
     """Get a required environment variable or exit with error.
     
     Args:
         var_name: Name of the environment variable to retrieve
+        env: Optional mapping to read the variable from instead of the process environment
         
     Returns:
         Value of the environment variable
@@ -28,7 +31,7 @@ def get_required_env_var(var_name: str) -> str:
     Raises:
         SystemExit: If the environment variable is not set
     """
-    value = os.getenv(var_name)
+    value = (env if env is not None else os.environ).get(var_name)
     if not value:
         print(f"❌ Missing environment variable: {var_name}")
         sys.exit(1)
@@ -44,6 +47,9 @@ def print_step(step_num: int = None, total_steps: int = None, description: str =
         description: Optional description of what this step does
         **kwargs: Arguments for display purposes
     """
+    if description:
+        begin_profile_step(description, step=step_num)
+    
     if step_num is not None and total_steps is not None and description:
         print(f"\n📋 Step {step_num}/{total_steps}: {description}")
     elif description:
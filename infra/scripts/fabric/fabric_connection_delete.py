@@ -16,6 +16,7 @@ Requirements:
 
 import argparse
 import sys
+from typing import Dict, List
 from fabric_api import FabricApiClient, FabricApiError
 
 def delete_connection(fabric_client: FabricApiClient, connection_name: str):
@@ -66,6 +67,35 @@ def delete_connection(fabric_client: FabricApiClient, connection_name: str):
         print(f"❌ Error: {e}")
         raise
 
+def lookup_connections(fabric_client: FabricApiClient, connection_names: List[str]) -> Dict[str, str]:
+    """
+    Look up several connections by name with a single scan of the connection list.
+    
+    Args:
+        fabric_client: Authenticated FabricApiClient instance
+        connection_names: Connection names to look up
+        
+    Returns:
+        Dictionary mapping each found name to the connection ID
+        
+    Raises:
+        FabricApiError: If listing the connections fails
+    """
+    print(f"Looking up {len(connection_names)} connection(s)")
+    targets = {name.lower(): name for name in connection_names}
+    found = {}
+    for conn in fabric_client.paginate("connections"):
+        name = targets.get(conn.get('displayName', '').lower())
+        if name and name not in found:
+            found[name] = conn.get('id')
+    
+    for name in connection_names:
+        if name in found:
+            print(f"Found connection: '{name}' (ID: {found[name]})")
+        else:
+            print(f"Connection '{name}' not found")
+    return found
+
 def delete_connection_by_id(fabric_client: FabricApiClient, connection_id: str):
     """
     Delete connection by ID directly.
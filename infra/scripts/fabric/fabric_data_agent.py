@@ -6,6 +6,10 @@ This module provides Data Agent creation functionality for Microsoft Fabric oper
 It creates a new Data Agent in the specified workspace, configures it with AI instructions,
 and creates/runs a configuration notebook.
 
+The configuration notebook runs as a Fabric job tracked by fabric_job_runner.JobRunner. Callers
+passing their own JobRunner get control back as soon as the job is submitted and wait for it
+where they need the result; a restarted deployment reattaches to a still running job.
+
 Usage:
     python fabric_data_agent.py --workspace-id "workspace-guid" --data-agent-name "MyDataAgent" --kusto-db-id "kusto-db-id" --kusto-db-workspace-id "kusto-db-workspace-id"
 
@@ -22,6 +26,8 @@ import json
 import base64
 from typing import Optional
 from fabric_api import FabricWorkspaceApiClient, FabricApiError
+from fabric_definition_state import is_definition_unchanged, record_definition_hash
+from fabric_job_runner import JobRunner, TrackedJob
 
 
 def read_file_content(file_path: str) -> str:
@@ -69,6 +75,27 @@ def replace_tokens_in_content(content: str, tokens: dict) -> str:
     return content
 
 
+def report_notebook_job(job: TrackedJob) -> None:
+    """
+    Print the result of a configuration notebook run.
+    
+    Args:
+        job: Finished notebook job
+        
+    Raises:
+        FabricApiError: If the notebook run did not complete successfully
+    """
+    minutes, seconds = divmod(int(job.duration_sec), 60)
+    print(f"📊 Notebook execution completed:")
+    print(f"   Status: {job.status}")
+    print(f"   Duration: {minutes}m {seconds}s")
+    
+    if not job.succeeded:
+        if job.error:
+            print(f"   Error: {job.error}")
+        raise FabricApiError(f"Notebook execution failed with status: {job.status}")
+
+
 def setup_data_agent(workspace_client: FabricWorkspaceApiClient, 
                                    data_agent_name: str,
                                    kusto_db_id: str,
@@ -76,7 +103,8 @@ def setup_data_agent(workspace_client: FabricWorkspaceApiClient,
                                    environment_id: str,
                                    notebook_name: str,
                                    notebook_folder_id: Optional[str] = None,
-                                   data_agent_folder_id: Optional[str] = None) -> dict:
+                                   data_agent_folder_id: Optional[str] = None,
+                                   job_runner: Optional[JobRunner] = None) -> dict:
     """
     Create a Data Agent and configure it with a notebook.
     
@@ -89,6 +117,9 @@ def setup_data_agent(workspace_client: FabricWorkspaceApiClient,
         notebook_name: Name of the configuration notebook to create
         notebook_folder_id: Optional folder ID where to create the notebook
         data_agent_folder_id: Optional folder ID where to create the data agent
+        job_runner: Optional JobRunner to submit the configuration notebook to without waiting
+            for it (the caller waits with job_runner.wait() and report_notebook_job());
+            by default the notebook run is awaited before returning
         
     Returns:
         dict: Data Agent information if successful
@@ -169,36 +200,40 @@ def setup_data_agent(workspace_client: FabricWorkspaceApiClient,
         notebook_base64 = base64.b64encode(
             json.dumps(notebook_json).encode('utf-8')
         ).decode('utf-8')
+        definition_parts = {"notebook-content.ipynb": notebook_base64}
         
         if notebook:
             # Update existing notebook
             notebook_id = notebook.get('id')
             if not notebook_id:
                 raise FabricApiError(f"Failed to retrieve notebook ID for existing notebook '{notebook_name}'")
-            print(f"ℹ️  Notebook '{notebook_name}' already exists, updating...")
-            workspace_client.update_notebook(notebook_id, notebook_name, notebook_base64, notebook_folder_id)
-            print(f"✅ Successfully updated notebook: {notebook_name} ({notebook_id})")
+            notebook_unchanged = is_definition_unchanged(workspace_client, notebook_id, definition_parts, definition_format="ipynb")
+            if notebook_unchanged:
+                print(f"⏭️  Notebook '{notebook_name}' already exists with unchanged content, skipping update")
+            else:
+                print(f"ℹ️  Notebook '{notebook_name}' already exists, updating...")
+                workspace_client.update_notebook(notebook_id, notebook_name, notebook_base64, notebook_folder_id)
+                record_definition_hash(workspace_client, notebook_id, definition_parts)
+                print(f"✅ Successfully updated notebook: {notebook_name} ({notebook_id})")
         else:
             # Create new notebook
+            notebook_unchanged = False
             notebook = workspace_client.create_notebook(notebook_name, notebook_base64, notebook_folder_id)
             notebook_id = notebook.get('id')
             if not notebook_id:
                 raise FabricApiError(f"Failed to retrieve notebook ID for created notebook '{notebook_name}'")
+            record_definition_hash(workspace_client, notebook_id, definition_parts)
             print(f"✅ Successfully created notebook: {notebook_name} ({notebook_id})")
         
-        # Run the notebook
+        # Run the notebook, reattaching to a run of an interrupted deployment if the notebook is unchanged
         print(f"▶️  Running configuration notebook...")
-        job_result = workspace_client.schedule_notebook_job(notebook_id)
-        
-        print(f"📊 Notebook execution completed:")
-        print(f"   Status: {job_result.get('status')}")
-        print(f"   Duration: {job_result.get('duration')}")
-        
-        if job_result.get('status') != 'Completed':
-            if 'error' in job_result:
-                print(f"   Error: {job_result.get('error')}")
-            raise FabricApiError(f"Notebook execution failed with status: {job_result.get('status')}")
+        runner = job_runner or JobRunner(workspace_client)
+        job = runner.submit(notebook_id, name=notebook_name, reattach=notebook_unchanged)
+        if job_runner is not None:
+            print(f"⏩ Configuration notebook '{notebook_name}' is running in the background")
+            return data_agent
         
+        report_notebook_job(runner.wait([job])[0])
         print(f"✅ Data Agent configuration completed successfully!")
         
         return data_agent
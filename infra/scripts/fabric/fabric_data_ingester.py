@@ -1,6 +1,7 @@
 from datetime import datetime, timezone
+import json
 import os
-from azure.identity import AzureCliCredential
+from fabric_token_cache import get_shared_credential
 from azure.kusto.data import KustoConnectionStringBuilder, KustoClient
 from azure.kusto.data.exceptions import KustoServiceError
 from azure.kusto.ingest import QueuedIngestClient, IngestionProperties
@@ -10,7 +11,7 @@ import pandas as pd
 
 def create_kusto_client(cluster_uri: str):
     try:
-        credential = AzureCliCredential()
+        credential = get_shared_credential()
         kcsb = KustoConnectionStringBuilder.with_azure_token_credential(cluster_uri, credential)
         client = KustoClient(kcsb)
         return client
@@ -23,7 +24,7 @@ def create_kusto_client(cluster_uri: str):
 def create_ingestion_client(cluster_uri: str):
     try:
         print(f"Connecting to Fabric cluster: {cluster_uri}")
-        credential = AzureCliCredential()
+        credential = get_shared_credential()
         
         # Create ingestion client using the ingestion endpoint
         # The ingestion URI is typically the cluster URI with 'ingest-' prefix
@@ -57,8 +58,25 @@ def clear_table_data(kusto_client: KustoClient, database_name: str, table_name:
     try:
         command = f".clear table ['{table_name}'] data"
         kusto_client.execute_mgmt(database_name, command)
-        
+
         print(f"✓ Cleared all data from table {table_name}")
+
+        # Materialized views keep their aggregates when the source is cleared, so clear them too
+        response = kusto_client.execute_mgmt(database_name, ".show materialized-views")
+        for row in response.primary_results[0]:
+            if row["SourceTable"] == table_name:
+                kusto_client.execute_mgmt(database_name, f".clear materialized-view ['{row['Name']}'] data")
+                print(f"✓ Cleared materialized view {row['Name']}")
+
+        # Tables filled by an update policy on this table would otherwise keep stale copies
+        response = kusto_client.execute_mgmt(database_name, ".show table * policy update")
+        for row in response.primary_results[0]:
+            if not row["Policy"] or row["Policy"] == "null":
+                continue
+            if any(policy.get("Source") == table_name for policy in json.loads(row["Policy"])):
+                target_table = row["EntityName"].rsplit(".", 1)[-1].strip("[]")
+                kusto_client.execute_mgmt(database_name, f".clear table ['{target_table}'] data")
+                print(f"✓ Cleared table {target_table} (update policy target)")
         return True
     
     except Exception as e:
@@ -3,7 +3,11 @@
 Fabric Database Setup Module
 
 This module provides database setup functionality for Microsoft Fabric operations.
-It creates and manages database tables and schemas for manufacturing data.
+It creates and manages database tables and schemas for manufacturing data, their caching,
+retention, ingestion batching and partitioning policies, and the materialized views that
+pre-aggregate sensor metrics at 1-hour and 1-day grain for the dashboard and KQL queries. It also deploys the stored functions in src/kql/functions that the dashboard tiles
+share. Optionally, it deploys an events_enriched table fed by an update policy that
+pre-computes z-scores and anomaly flags at ingestion time.
 
 Usage:
     python fabric_database.py --cluster-uri "https://cluster.kusto.windows.net" --database "database_name"
@@ -15,18 +19,37 @@ Requirements:
 """
 
 import argparse
+import json
 import os
+import re
 import sys
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 
-# Add the parent scripts directory to Python path for imports
+# Add the parent scripts directory and the src directory to Python path for imports
 script_dir = Path(__file__).parent
 scripts_dir = script_dir.parent
 sys.path.insert(0, str(scripts_dir))
+sys.path.insert(0, str(scripts_dir.parent.parent / "src"))
+kql_functions_dir = scripts_dir.parent.parent / "src" / "kql" / "functions"
 
-from azure.identity import AzureCliCredential
+from fabric_token_cache import get_shared_credential
 from azure.kusto.data import KustoClient, KustoConnectionStringBuilder, ClientRequestProperties
 from azure.kusto.data.exceptions import KustoServiceError
+from entities.asset import Asset
+from entities.event import Event
+from entities.location import Location
+from entities.product import Product
+from entities.schema import get_kql_columns
+from entities.site import Site
+
+# States of `.show operations` that mean an async operation is still running
+RUNNING_OPERATION_STATES = {"InProgress", "Scheduled", "Throttled"}
+# Maximum time to wait for materialized view backfills before moving on
+VIEW_BACKFILL_TIMEOUT_SEC = 3600
+# Materialized views created by earlier versions, dropped from databases that still have them
+RETIRED_MATERIALIZED_VIEWS = ["events_minute_stats"]
 
 def create_kusto_client(cluster_uri) -> KustoClient:
     """
@@ -45,7 +68,7 @@ def create_kusto_client(cluster_uri) -> KustoClient:
     try:
         
         print(f"Connecting to Fabric cluster: {cluster_uri}")
-        credential = AzureCliCredential()
+        credential = get_shared_credential()
         kcsb = KustoConnectionStringBuilder.with_azure_token_credential(cluster_uri, credential)
         client = KustoClient(kcsb)
         print(f"✅ Connected to Fabric cluster")
@@ -56,48 +79,384 @@ def create_kusto_client(cluster_uri) -> KustoClient:
         raise
 
 
-def check_database_exists(client: KustoClient, database_name: str):
+def build_materialized_view_command(view_name: str, source_table: str, query: str):
+    """
+    Build the command that creates a materialized view, backfilling it from existing data.
+    
+    The command is async so backfilling a large source table does not hit the command timeout.
+    It cannot run inside `.execute database script` and returns an operation ID to poll with
+    wait_for_operations().
+    
+    Parameters:
+    -----------
+    view_name : str
+        Name of the materialized view to create
+    source_table : str
+        Name of the table the view aggregates
+    query : str
+        KQL aggregation query over the source table
+    
+    Returns:
+    --------
+    str
+        KQL management command
+    """
+    return f".create async ifnotexists materialized-view with (backfill=true) ['{view_name}'] on table ['{source_table}'] {{ {query} }}"
+
+
+def wait_for_operations(client: KustoClient, database_name: str, operation_ids: list,
+                        timeout_sec: int = 3600, poll_interval_sec: float = 10):
+    """
+    Wait for asynchronous management operations, polling all of them with one command.
+    
+    Parameters:
+    -----------
+    client : KustoClient
+        Connected Kusto client
+    database_name : str
+        Name of the database
+    operation_ids : list
+        Operation IDs returned by async commands
+    timeout_sec : int
+        Maximum time to wait
+    poll_interval_sec : float
+        Time between status polls
+    
+    Returns:
+    --------
+    dict
+        Dictionary mapping operation IDs to {"State", "Status"}, for finished operations only.
+        Operations still running after timeout_sec are missing.
+    """
+    finished = {}
+    remaining = list(operation_ids)
+    deadline = time.time() + timeout_sec
+    while remaining:
+        response = client.execute_mgmt(database_name, f".show operations ({', '.join(remaining)})")
+        for row in response.primary_results[0]:
+            if row["State"] not in RUNNING_OPERATION_STATES:
+                finished[str(row["OperationId"])] = {"State": row["State"], "Status": row["Status"]}
+        remaining = [operation_id for operation_id in remaining if operation_id not in finished]
+        if not remaining or time.time() >= deadline:
+            break
+        print(f"  ⏳ {len(finished)}/{len(operation_ids)} operations finished")
+        time.sleep(poll_interval_sec)
+    return finished
+
+
+def _parse_timespan(value: str):
+    """Convert a Kusto timespan string ("d.hh:mm:ss[.fffffff]" or "hh:mm:ss") to seconds."""
+    days = 0
+    if "." in value.split(":")[0]:
+        day_part, value = value.split(".", 1)
+        days = int(day_part)
+    hours, minutes, seconds = value.split(":")
+    return days * 86400 + int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def _parse_datetime(value: str):
+    """Convert an ISO 8601 datetime string (as written or as normalized by the service, e.g.
+    "1970-01-01T00:00:00" or "1970-01-01T00:00:00.0000000Z") to a UTC datetime."""
+    match = re.fullmatch(r"(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2})?)(?:\.(\d+))?(Z|[+-]\d{2}:\d{2})?", value.strip())
+    if not match:
+        raise ValueError(f"Not a datetime: {value}")
+    base, fraction, offset = match.groups()
+    parsed = datetime.fromisoformat(base + (f".{fraction[:6].ljust(6, '0')}" if fraction else "")
+                                    + ("+00:00" if offset in (None, "Z") else offset))
+    return parsed.astimezone(timezone.utc)
+
+
+def _format_timespan_literal(value: str):
+    """Convert a Kusto timespan string to a KQL timespan literal (e.g., "31.00:00:00" -> "31d")."""
+    seconds = _parse_timespan(value)
+    for unit, unit_seconds in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds % unit_seconds == 0:
+            return f"{int(seconds // unit_seconds)}{unit}"
+    return f"{int(seconds)}s"
+
+
+def _policy_matches(desired, current):
+    """
+    Check whether the current policy satisfies the desired one.
+    
+    Only keys present in the desired policy are compared, timespans and datetimes are compared
+    by value and strings case-insensitively, so defaults filled in and values normalized by the
+    service do not count as drift.
+    """
+    if isinstance(current, dict) and set(current.keys()) == {"Value"} and not isinstance(desired, dict):
+        current = current["Value"]
+    if isinstance(desired, dict):
+        return isinstance(current, dict) and all(
+            _policy_matches(value, current.get(key)) for key, value in desired.items()
+        )
+    if isinstance(desired, list):
+        return isinstance(current, list) and len(desired) == len(current) and all(
+            _policy_matches(d, c) for d, c in zip(desired, current)
+        )
+    if isinstance(desired, str) and isinstance(current, str):
+        for parse in (_parse_timespan, _parse_datetime):
+            try:
+                return parse(desired) == parse(current)
+            except ValueError:
+                continue
+        return desired.lower() == current.lower()
+    return desired == current
+
+
+def get_deployed_table_policies(client: KustoClient, database_name: str, policy_kinds: list):
+    """
+    Get the table-level policies of all tables, with one command per policy kind.
+    
+    Parameters:
+    -----------
+    client : KustoClient
+        Connected Kusto client
+    database_name : str
+        Name of the database
+    policy_kinds : list
+        Policy kinds to fetch (e.g., "caching", "retention", "ingestionbatching", "partitioning")
+    
+    Returns:
+    --------
+    dict
+        Dictionary mapping table names to {policy kind: policy document}
+    """
+    policies = {}
+    for policy_kind in policy_kinds:
+        response = client.execute_mgmt(database_name, f".show table * policy {policy_kind}")
+        for row in response.primary_results[0]:
+            if not row["Policy"] or row["Policy"] == "null":
+                continue
+            # EntityName is "[database].[table]"
+            table_name = row["EntityName"].rsplit(".", 1)[-1].strip("[]")
+            policies.setdefault(table_name, {})[policy_kind] = json.loads(row["Policy"])
+    return policies
+
+
+def build_table_policy_command(table_name: str, policy_kind: str, policy: dict):
+    """
+    Build the command that sets a table policy.
+    
+    Parameters:
+    -----------
+    table_name : str
+        Name of the table
+    policy_kind : str
+        Policy kind (e.g., "caching", "retention", "ingestionbatching", "partitioning")
+    policy : dict
+        Policy document in the format returned by .show table policy
+    
+    Returns:
+    --------
+    str
+        KQL management command
+    """
+    if policy_kind == "caching":
+        return f".alter table ['{table_name}'] policy caching hot = {_format_timespan_literal(policy['DataHotSpan'])}"
+    if policy_kind == "retention":
+        return (f".alter-merge table ['{table_name}'] policy retention "
+                f"softdelete = {_format_timespan_literal(policy['SoftDeletePeriod'])} "
+                f"recoverability = {policy.get('Recoverability', 'Enabled').lower()}")
+    return f".alter table ['{table_name}'] policy {policy_kind} ```{json.dumps(policy)}```"
+
+
+def plan_table_policies(policies: dict, deployed_policies: dict):
+    """
+    Compare the declared table policies with the deployed ones and plan the commands to apply.
+    
+    Parameters:
+    -----------
+    policies : dict
+        Declared policies as returned by get_table_policies()
+    deployed_policies : dict
+        Dictionary mapping table names to {policy kind: policy document}
+    
+    Returns:
+    --------
+    dict
+        Dictionary mapping (table name, policy kind) to the command to run, for differing policies only
+    """
+    commands = {}
+    for table_name, table_policies in policies.items():
+        for policy_kind, policy in table_policies.items():
+            current = deployed_policies.get(table_name, {}).get(policy_kind)
+            if current is None or not _policy_matches(policy, current):
+                commands[(table_name, policy_kind)] = build_table_policy_command(table_name, policy_kind, policy)
+    return commands
+
+
+def get_table_entities():
+    """
+    Define the entity dataclasses backing the manufacturing data tables.
+    
+    Returns:
+    --------
+    dict
+        Dictionary mapping table names to entity dataclasses in src/entities
+    """
+    return {
+        "locations": Location,
+        "sites": Site,
+        "assets": Asset,
+        "products": Product,
+        "events": Event
+    }
+
+
+def get_event_enrichment_columns():
+    """
+    Define the columns the EnrichEvents() update policy function adds to the event columns.
+    
+    Returns:
+    --------
+    list
+        List of (column name, KQL type) in the order projected by EnrichEvents()
+    """
+    return [
+        ("AssetName", "string"),
+        ("AssetType", "string"),
+        ("AssetMaintenanceStatus", "string"),
+        ("SiteId", "int"),
+        ("SiteName", "string"),
+        ("SpeedZScore", "real"),
+        ("TemperatureZScore", "real"),
+        ("VibrationZScore", "real"),
+        ("HumidityZScore", "real"),
+        ("DefectProbabilityZScore", "real"),
+        ("SpeedAnomaly", "bool"),
+        ("TemperatureAnomaly", "bool"),
+        ("VibrationAnomaly", "bool"),
+        ("HumidityAnomaly", "bool"),
+        ("QualityAnomaly", "bool"),
+        ("SpeedWarning", "bool"),
+        ("TemperatureWarning", "bool"),
+        ("VibrationWarning", "bool"),
+        ("QualityWarning", "bool"),
+        ("IsAnomaly", "bool"),
+        ("EnrichedAt", "datetime")
+    ]
+
+
+def get_table_columns(enable_event_enrichment: bool = False):
+    """
+    Define the columns of all declared tables.
+    
+    Parameters:
+    -----------
+    enable_event_enrichment : bool
+        Whether to include the events_enriched table
+    
+    Returns:
+    --------
+    dict
+        Dictionary mapping table names to lists of (column name, KQL type)
+    """
+    tables = {table_name: get_kql_columns(entity) for table_name, entity in get_table_entities().items()}
+    if enable_event_enrichment:
+        tables["events_enriched"] = get_kql_columns(Event) + get_event_enrichment_columns()
+    return tables
+
+
+def get_database_schema(client: KustoClient, database_name: str):
     """
-    Check if a database exists in the Fabric cluster.
+    Get the schema of the database (tables, materialized views and functions) with a single command.
     
     Parameters:
     -----------
     client : KustoClient
         Connected Kusto client
     database_name : str
-        Name of the database to check
+        Name of the database
     
     Returns:
     --------
-    bool
-        True if database exists
+    dict
+        Database schema as returned by `.show database schema as json`
         
     Raises:
     -------
     Exception
-        If database does not exist or error checking database existence
+        If the database does not exist or cannot be accessed
     """
     try:
-        query = ".show databases"
-        response = client.execute("NetDefaultDB", query)
-        
-        databases = [row.to_dict()["PrettyName"] for row in response.primary_results[0]]
-        database_exists = database_name in databases
-        
-        if not database_exists:
-            raise Exception(f"Database '{database_name}' does not exist in the Fabric cluster. Please ensure the database exists before running this script.")
-        
-        return True
-    
+        response = client.execute_mgmt(database_name, f".show database ['{database_name}'] schema as json")
+        rows = list(response.primary_results[0])
+        return json.loads(rows[0]["DatabaseSchema"])["Databases"][database_name]
     except Exception as e:
-        if "does not exist" in str(e):
-            raise  # Re-raise our custom error message
-        print(f"Error checking database existence: {e}")
-        raise
+        raise Exception(f"Database '{database_name}' does not exist in the Fabric cluster or is not accessible. Please ensure the database exists before running this script. ({e})")
 
-def check_table_exists(client: KustoClient, database_name: str, table_name: str):
+
+def get_deployed_table_columns(database_schema: dict):
     """
-    Check if a table exists in the database.
+    Get the columns of all tables from the database schema.
+    
+    Parameters:
+    -----------
+    database_schema : dict
+        Database schema as returned by get_database_schema()
+    
+    Returns:
+    --------
+    dict
+        Dictionary mapping table names to lists of (column name, KQL type)
+    """
+    return {
+        table_name: [(column["Name"], column["CslType"]) for column in table.get("OrderedColumns", [])]
+        for table_name, table in (database_schema.get("Tables") or {}).items()
+    }
+
+
+def plan_table_migrations(tables: dict, deployed_tables: dict):
+    """
+    Compare the declared table schemas with the deployed tables and plan the DDL to reconcile them.
+    
+    Missing tables and columns are handled with `.create-merge table`, which creates the table
+    or appends the missing columns without touching data. Column type changes and columns that
+    only exist in the deployed table are reported as drift but never applied automatically.
+    
+    Parameters:
+    -----------
+    tables : dict
+        Declared tables as returned by get_table_columns()
+    deployed_tables : dict
+        Dictionary mapping table names to lists of (column name, KQL type)
+    
+    Returns:
+    --------
+    tuple
+        (dict mapping table names to `.create-merge table` commands,
+         dict mapping table names to migration details)
+    """
+    commands = {}
+    plan = {}
+    for table_name, desired in tables.items():
+        deployed = dict(deployed_tables.get(table_name, []))
+        missing_columns = [name for name, _ in desired if name not in deployed]
+        drift = [
+            f"{name}: deployed {deployed[name]}, expected {kql_type}"
+            for name, kql_type in desired
+            if name in deployed and deployed[name] != kql_type
+        ]
+        drift += [
+            f"{name}: not in declared schema"
+            for name in deployed if name not in dict(desired)
+        ]
+        
+        plan[table_name] = {
+            "exists": table_name in deployed_tables,
+            "added_columns": missing_columns if table_name in deployed_tables else [],
+            "drift": drift
+        }
+        if missing_columns:
+            # Keep deployed types so a drifted column does not make .create-merge fail
+            columns = ", ".join(f"['{name}']: {deployed.get(name, kql_type)}" for name, kql_type in desired)
+            commands[table_name] = f".create-merge table ['{table_name}'] ({columns})"
+    return commands, plan
+
+
+def execute_database_script(client: KustoClient, database_name: str, commands: list):
+    """
+    Run management commands in a single `.execute database script` round trip.
     
     Parameters:
     -----------
@@ -105,29 +464,124 @@ def check_table_exists(client: KustoClient, database_name: str, table_name: str)
         Connected Kusto client
     database_name : str
         Name of the database
-    table_name : str
-        Name of the table to check
+    commands : list
+        Management commands to run in order
     
     Returns:
     --------
-    bool
-        True if table exists
+    list
+        One dictionary per command with CommandText, Result ("Completed" or "Failed") and Reason
     """
-    try:
-        query = ".show tables"
-        response = client.execute(database_name, query)
-        
-        tables = [row["TableName"] for row in response.primary_results[0]]
-        return table_name in tables
+    script = "\n\n".join(commands)
+    response = client.execute_mgmt(database_name, f".execute database script with (ContinueOnErrors=true) <|\n{script}")
+    return [
+        {"CommandText": row["CommandText"], "Result": row["Result"], "Reason": row["Reason"]}
+        for row in response.primary_results[0]
+    ]
+
+
+def _get_script_error(script_results: dict, key):
+    """Get the failure reason of a command run by execute_database_script(), or None if it succeeded or did not run."""
+    result = script_results.get(key)
+    if result is not None and result["Result"] != "Completed":
+        return result["Reason"] or result["Result"]
+    return None
+
+
+def load_function_definition(file_path):
+    """
+    Load a stored function definition from a `.create-or-alter function` KQL file.
     
-    except Exception as e:
-        print(f"Error checking table existence: {e}")
-        return False
+    Parameters:
+    -----------
+    file_path : str or Path
+        Path to the KQL file, which may start with `//` comment lines
+    
+    Returns:
+    --------
+    dict
+        Dictionary with the function name, folder, docstring, body and the command to run
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    # Drop the header comments so the command can be embedded in a database script
+    while lines and (not lines[0].strip() or lines[0].lstrip().startswith("//")):
+        lines.pop(0)
+    # Blank lines separate commands in a database script, so they cannot appear inside one
+    command = "\n".join(line for line in lines if line.strip())
+    
+    match = re.match(r"\.create-or-alter\s+function\s+(?:with\s*\((.*?)\)\s*)?(\w+)\s*\(.*?\)\s*(\{.*\})$", command, re.DOTALL)
+    if not match:
+        raise ValueError(f"{file_path} does not contain a .create-or-alter function command")
+    properties = dict(re.findall(r'(\w+)\s*=\s*"([^"]*)"', match.group(1) or ""))
+    return {
+        "name": match.group(2),
+        "folder": properties.get("folder", ""),
+        "docstring": properties.get("docstring", ""),
+        "body": match.group(3),
+        "command": command
+    }
 
 
-def create_table(client: KustoClient, database_name: str, table_name: str, schema: str):
+def _normalize_kql(text: str):
+    """Collapse whitespace so formatting differences in a function body do not count as changes."""
+    return " ".join((text or "").split())
+
+
+def plan_functions(database_schema: dict, functions: list):
     """
-    Create a table in the database with the specified schema.
+    Plan the stored functions that are missing or differ from the deployed ones.
+    
+    Parameters:
+    -----------
+    database_schema : dict
+        Database schema as returned by get_database_schema()
+    functions : list
+        Function definitions as returned by load_function_definition()
+    
+    Returns:
+    --------
+    dict
+        Dictionary mapping function names to the command to run, for changed functions only
+    """
+    deployed_functions = database_schema.get("Functions") or {}
+    commands = {}
+    for function in functions:
+        deployed = deployed_functions.get(function["name"])
+        if (deployed is None
+                or _normalize_kql(deployed.get("Body")) != _normalize_kql(function["body"])
+                or (deployed.get("Folder") or "") != function["folder"]
+                or (deployed.get("DocString") or "") != function["docstring"]):
+            commands[function["name"]] = function["command"]
+    return commands
+
+
+def plan_materialized_views(database_schema: dict):
+    """
+    Plan the creation of materialized views that do not exist yet.
+    
+    Parameters:
+    -----------
+    database_schema : dict
+        Database schema as returned by get_database_schema()
+    
+    Returns:
+    --------
+    dict
+        Dictionary mapping view names to the command that creates them, for missing views only
+    """
+    deployed_views = database_schema.get("MaterializedViews") or {}
+    return {
+        view_name: build_materialized_view_command(view_name, view["source"], view["query"])
+        for view_name, view in get_materialized_view_definitions().items()
+        if view_name not in deployed_views
+    }
+
+
+def create_materialized_views(client: KustoClient, database_name: str, view_commands: dict,
+                              timeout_sec: int = VIEW_BACKFILL_TIMEOUT_SEC):
+    """
+    Run the async commands that create materialized views and wait for their backfills.
     
     Parameters:
     -----------
@@ -135,102 +589,235 @@ def create_table(client: KustoClient, database_name: str, table_name: str, schem
         Connected Kusto client
     database_name : str
         Name of the database
-    table_name : str
-        Name of the table to create
-    schema : str
-        KQL schema definition for the table
+    view_commands : dict
+        Dictionary mapping view names to the command that creates them
+    timeout_sec : int
+        Maximum time to wait for the backfills
     
     Returns:
     --------
-    bool
-        True if successful
+    dict
+        Dictionary mapping view names to their failure reason, for failed views only.
+        Views still backfilling after timeout_sec are not failures; Kusto keeps backfilling them.
     """
-    try:
-        print(f"Creating table: {database_name}.{table_name}")
-        query = f".create table ['{table_name}'] {schema}"
-        client.execute(database_name, query)
-        print(f"✅ Table '{table_name}' created successfully")
-        return True
-    
-    except KustoServiceError as e:
-        if "already exists" in str(e).lower():
-            print(f"✅ Table '{table_name}' already exists")
-            return True
-        else:
-            print(f"Error creating table: {e}")
-            raise
-    except Exception as e:
-        print(f"Error creating table: {e}")
-        raise
+    errors = {}
+    operations = {}
+    print(f"\nCreating {len(view_commands)} materialized view(s) with backfill...")
+    for view_name, command in view_commands.items():
+        try:
+            response = client.execute_mgmt(database_name, command)
+            operations[str(response.primary_results[0][0]["OperationId"])] = view_name
+        except KustoServiceError as e:
+            errors[view_name] = str(e)
+    
+    finished = wait_for_operations(client, database_name, list(operations), timeout_sec)
+    for operation_id, view_name in operations.items():
+        if operation_id not in finished:
+            print(f"⚠️  Materialized view '{view_name}' is still backfilling after {timeout_sec}s (operation {operation_id})")
+        elif finished[operation_id]["State"] != "Completed":
+            errors[view_name] = finished[operation_id]["Status"] or finished[operation_id]["State"]
+    return errors
 
 
-def get_table_schemas():
+def get_table_policies(enable_event_enrichment: bool = False):
     """
-    Define the schemas for the manufacturing data tables.
+    Define the policies for the manufacturing data tables.
+    
+    Policies use the document format returned by `.show table <table> policy <kind>`, and
+    only the keys listed here are compared against the deployed policy. Tables without an
+    entry keep the database defaults.
+    
+    Parameters:
+    -----------
+    enable_event_enrichment : bool
+        Whether to include the update policy of the events_enriched table
     
     Returns:
     --------
     dict
-        Dictionary containing table schemas
+        Dictionary mapping table names to {policy kind: policy document}
+    """
+    policies = {
+        "events": {
+            # Keep the 30-day dashboard baseline window plus the excluded last 24h in hot cache
+            "caching": {
+                "DataHotSpan": "31.00:00:00"
+            },
+            "retention": {
+                "SoftDeletePeriod": "365.00:00:00",
+                "Recoverability": "Enabled"
+            },
+            # Seal batches after 10 seconds (the minimum) instead of the 5 minute default
+            "ingestionbatching": {
+                "MaximumBatchingTimeSpan": "00:00:10",
+                "MaximumNumberOfItems": 500,
+                "MaximumRawDataSizeMB": 1024
+            },
+            # Group extents by event day so time filters prune extents even for backfilled
+            # history, and let retention/caching follow event time instead of ingestion time
+            "partitioning": {
+                "PartitionKeys": [
+                    {
+                        "ColumnName": "Timestamp",
+                        "Kind": "UniformRange",
+                        "Properties": {
+                            "Reference": "1970-01-01T00:00:00",
+                            "RangeSize": "1.00:00:00",
+                            "OverrideCreationTime": True
+                        }
+                    }
+                ]
+            }
+        }
+    }
+    
+    # Dimension tables are small and read by every lookup, so keep them in hot cache for good
+    for table_name in ("locations", "sites", "assets", "products"):
+        policies[table_name] = {
+            "caching": {
+                "DataHotSpan": "3650.00:00:00"
+            }
+        }
+    
+    if enable_event_enrichment:
+        policies["events_enriched"] = {
+            # Non-transactional, so a failing enrichment never blocks ingestion into events
+            "update": [
+                {
+                    "IsEnabled": True,
+                    "Source": "events",
+                    "Query": "EnrichEvents()",
+                    "IsTransactional": False,
+                    "PropagateIngestionProperties": False
+                }
+            ],
+            "caching": {
+                "DataHotSpan": "31.00:00:00"
+            },
+            "retention": {
+                "SoftDeletePeriod": "365.00:00:00",
+                "Recoverability": "Enabled"
+            }
+        }
+    return policies
+
+
+def get_function_definitions(enable_event_enrichment: bool = False):
+    """
+    Define the stored functions deployed from src/kql/functions.
+    
+    Functions are listed in dependency order, since `.create-or-alter function` validates the
+    body against the functions that already exist.
+    
+    Parameters:
+    -----------
+    enable_event_enrichment : bool
+        Whether to include the EnrichEvents() update policy function
+    
+    Returns:
+    --------
+    list
+        Function definitions as returned by load_function_definition()
+    """
+    function_files = ["AssetMapping.kql", "SensorBaseline.kql", "ZScoredEvents.kql", "RollupGrain.kql", "SensorRollup.kql"]
+    if enable_event_enrichment:
+        function_files.append("EnrichEvents.kql")
+    return [load_function_definition(kql_functions_dir / file_name) for file_name in function_files]
+
+
+def build_sensor_stats_query(grain: str):
+    """
+    Build the aggregation query of a sensor statistics rollup at the given time grain.
+    
+    Parameters:
+    -----------
+    grain : str
+        KQL timespan literal of the time bin, e.g. "1h" or "1d"
+    
+    Returns:
+    --------
+    str
+        Query summarizing per-asset count/sum/sum-of-squares/min/max of every sensor metric
+    """
+    # NOTE: metric columns here match against entity Event class in src/entities/event.py
+    return f"""events
+            | extend
+                SpeedSq = Speed * Speed,
+                TemperatureSq = Temperature * Temperature,
+                VibrationSq = Vibration * Vibration,
+                HumiditySq = Humidity * Humidity,
+                DefectProbabilitySq = DefectProbability * DefectProbability
+            | summarize
+                EventCount = count(),
+                SpeedCount = countif(isnotnull(Speed)), SpeedSum = sum(Speed), SpeedSumSq = sum(SpeedSq),
+                SpeedMin = min(Speed), SpeedMax = max(Speed),
+                TemperatureCount = countif(isnotnull(Temperature)), TemperatureSum = sum(Temperature), TemperatureSumSq = sum(TemperatureSq),
+                TemperatureMin = min(Temperature), TemperatureMax = max(Temperature),
+                VibrationCount = countif(isnotnull(Vibration)), VibrationSum = sum(Vibration), VibrationSumSq = sum(VibrationSq),
+                VibrationMin = min(Vibration), VibrationMax = max(Vibration),
+                HumidityCount = countif(isnotnull(Humidity)), HumiditySum = sum(Humidity), HumiditySumSq = sum(HumiditySq),
+                HumidityMin = min(Humidity), HumidityMax = max(Humidity),
+                DefectProbabilityCount = countif(isnotnull(DefectProbability)), DefectProbabilitySum = sum(DefectProbability), DefectProbabilitySumSq = sum(DefectProbabilitySq),
+                DefectProbabilityMin = min(DefectProbability), DefectProbabilityMax = max(DefectProbability),
+                DefectProbabilityNonZeroCount = countif(DefectProbability > 0)
+              by AssetId, Timestamp = bin(Timestamp, {grain})"""
+
+
+def get_materialized_view_definitions():
+    """
+    Define the materialized views that pre-aggregate sensor metrics from the events table.
+    
+    events_hourly_stats and events_daily_stats are rollups of the same per-asset
+    count/sum/sum-of-squares/min/max for each sensor metric at 1-hour and 1-day grain. Mean and
+    standard deviation over any window can be recombined from them instead of scanning raw
+    events; the SensorRollup() function picks the coarsest grain that still resolves the
+    dashboard time range. There is no 1-minute rollup: sensors report about once a minute, so
+    it would hold as many rows as the events table. events_daily_percentiles keeps per-asset
+    daily t-digests that can be merged with merge_tdigest() and queried with
+    percentile_tdigest().
+    events_latest_by_asset keeps the latest event of each asset, so "current state" queries
+    read one row per asset however large the events table grows.
+    
+    Returns:
+    --------
+    dict
+        Dictionary mapping view names to their source table and aggregation query
     """
     return {
-        "locations": """(
-            Id: int,
-            City: string,
-            Country: string
-        )""",
-
-        "sites": """(
-            Id: int,
-            Name: string,
-            LocationId: int,
-            PlantType: string
-        )""",
-
-        # NOTE: schema here matches against entity Asset class in src/entities/asset.py
-        "assets": """(
-            Id: string,
-            Name: string,
-            SiteId: int,
-            Type: string,
-            SerialNumber: string,
-            MaintenanceStatus: string
-        )""",
+        "events_hourly_stats": {
+            "source": "events",
+            "query": build_sensor_stats_query("1h")
+        },
+        
+        "events_daily_stats": {
+            "source": "events",
+            "query": build_sensor_stats_query("1d")
+        },
+
+        "events_daily_percentiles": {
+            "source": "events",
+            "query": """events
+            | summarize
+                SpeedDigest = tdigest(Speed),
+                TemperatureDigest = tdigest(Temperature),
+                VibrationDigest = tdigest(Vibration),
+                HumidityDigest = tdigest(Humidity),
+                DefectProbabilityDigest = tdigest(DefectProbability)
+              by AssetId, Timestamp = bin(Timestamp, 1d)"""
+        },
         
-        "products": """(
-            Id: string,
-            CategoryId: int,
-            CategoryName: string,
-            Name: string,
-            Description: string,
-            BrandName: string,
-            Number: string,
-            Status: string,
-            Color: string,
-            ListPrice: real,
-            UnitCost: real,
-            IsoCurrencyCode: string
-        )""",
-
-        # NOTE: schema here matches against entity Event class in src/entities/event.py
-        "events": """(
-            Id: string,
-            AssetId: string,
-            ProductId: string,
-            Timestamp: datetime,
-            BatchId: string,
-            Vibration: real,
-            Temperature: real,
-            Humidity: real,
-            Speed: real,
-            DefectProbability: real
-        )"""
+        "events_latest_by_asset": {
+            "source": "events",
+            "query": """events
+            | summarize arg_max(Timestamp, *) by AssetId"""
+        }
     }
 
 
 def setup_fabric_database(
     cluster_uri,
-    database_name
+    database_name,
+    enable_event_enrichment: bool = False
 ):
     """
     Set up the Microsoft Fabric database tables for manufacturing data.
@@ -242,6 +829,9 @@ def setup_fabric_database(
         The URI of the Fabric cluster
     database_name : str
         Name of the existing database
+    enable_event_enrichment : bool
+        Whether to deploy the events_enriched table and the update policy that fills it from
+        events at ingestion time. Existing events are backfilled when the table is created.
     
     Returns:
     --------
@@ -259,46 +849,177 @@ def setup_fabric_database(
         # Create Kusto client
         client = create_kusto_client(cluster_uri)
         
-        # Check database exists (will raise error if not found)
+        # Fetch the whole database schema once (will raise error if the database is not found)
         print(f"\nVerifying database: {database_name}")
-        check_database_exists(client, database_name)
+        database_schema = get_database_schema(client, database_name)
         print(f"✅ Database '{database_name}' verified and exists")
         
         # Get table schemas
-        schemas = get_table_schemas()
+        schemas = get_table_columns(enable_event_enrichment)
+        policies = get_table_policies(enable_event_enrichment)
+        views = get_materialized_view_definitions()
+        functions = get_function_definitions(enable_event_enrichment)
+        policy_kinds = sorted({kind for table_policies in policies.values() for kind in table_policies})
+        deployed_policies = get_deployed_table_policies(client, database_name, policy_kinds)
+        deployed_tables = get_deployed_table_columns(database_schema)
+        
+        # Compute the delta locally. Order matters: views and functions need the tables, and
+        # the update policy query needs the EnrichEvents() function
+        table_commands, table_plan = plan_table_migrations(schemas, deployed_tables)
+        view_commands = plan_materialized_views(database_schema)
+        function_commands = plan_functions(database_schema, functions)
+        policy_commands = plan_table_policies(policies, deployed_policies)
+        
+        table_keyed_commands = [(("table", table_name), command) for table_name, command in table_commands.items()]
+        keyed_commands = (
+            [(("function", function_name), command) for function_name, command in function_commands.items()]
+            + [(("policy", key), command) for key, command in policy_commands.items()]
+        )
+        if enable_event_enrichment and "events_enriched" not in deployed_tables:
+            # The update policy only sees new ingestions, so enrich the events already in the table
+            keyed_commands.append((("backfill", "events_enriched"), ".append events_enriched <| EnrichEvents()"))
+        # Retired views are dropped after the functions that read them were updated
+        retired_views = [view_name for view_name in RETIRED_MATERIALIZED_VIEWS
+                         if view_name in (database_schema.get("MaterializedViews") or {})]
+        keyed_commands += [(("drop_view", view_name), f".drop materialized-view {view_name} ifexists")
+                           for view_name in retired_views]
         
-        # Check and create tables
-        print(f"\nChecking tables...")
+        # Async view creation cannot run in a database script, and the functions read the views,
+        # so missing views split the script in two: tables first, everything else after the views
+        scripts = [table_keyed_commands, keyed_commands] if view_commands else [table_keyed_commands + keyed_commands]
+        script_results = {}
+        view_errors = {}
+        if not (view_commands or table_keyed_commands or keyed_commands):
+            print(f"\nDatabase schema is up to date, nothing to apply")
+        for index, script_commands in enumerate(scripts):
+            if index == 1:
+                view_errors = create_materialized_views(client, database_name, view_commands)
+            if script_commands:
+                print(f"\nApplying {len(script_commands)} schema change(s) in one database script...")
+                results = execute_database_script(client, database_name, [command for _, command in script_commands])
+                script_results.update({key: result for (key, _), result in zip(script_commands, results)})
+        
+        # Tables
+        print(f"\nTables:")
         table_results = {}
-        for table_name, schema in schemas.items():
-            try:
-                if not check_table_exists(client, database_name, table_name):
-                    success = create_table(client, database_name, table_name, schema)
-                    table_results[table_name] = {"created": True, "success": success}
+        for table_name, details in table_plan.items():
+            error = _get_script_error(script_results, ("table", table_name))
+            table_results[table_name] = {
+                "created": not details["exists"] and error is None,
+                "added_columns": details["added_columns"] if error is None else [],
+                "drift": details["drift"],
+                "success": error is None
+            }
+            if error:
+                table_results[table_name]["error"] = error
+                print(f"Failed to migrate table {table_name}: {error}")
+            elif not details["exists"]:
+                print(f"✅ Table '{table_name}' created successfully")
+            elif details["added_columns"]:
+                print(f"✅ Table '{table_name}' updated with new columns: {', '.join(details['added_columns'])}")
+            else:
+                print(f"✅ Table '{table_name}' is up to date")
+            for drift in details["drift"]:
+                print(f"⚠️  Table '{table_name}' schema drift (not applied automatically) - {drift}")
+        
+        # Policies
+        print(f"\nTable policies:")
+        policy_results = {}
+        for table_name, table_policies in policies.items():
+            policy_results[table_name] = {}
+            for policy_kind in table_policies:
+                key = ("policy", (table_name, policy_kind))
+                error = _get_script_error(script_results, key)
+                if error:
+                    policy_results[table_name][policy_kind] = "failed"
+                    print(f"Error applying {policy_kind} policy to table {table_name}: {error}")
+                elif key in script_results:
+                    policy_results[table_name][policy_kind] = "applied"
+                    print(f"✅ Table '{table_name}' {policy_kind} policy applied")
                 else:
-                    print(f"✅ Table '{table_name}' already exists")
-                    table_results[table_name] = {"created": False, "success": True}
-            except Exception as e:
-                table_results[table_name] = {"created": False, "success": False, "error": str(e)}
-                print(f"Failed to create table {table_name}: {e}")
+                    policy_results[table_name][policy_kind] = "unchanged"
+                    print(f"✅ Table '{table_name}' {policy_kind} policy is up to date")
+        
+        # Materialized views
+        print(f"\nMaterialized views:")
+        view_results = {}
+        for view_name in views:
+            error = view_errors.get(view_name)
+            view_results[view_name] = {"created": view_name in view_commands and error is None, "success": error is None}
+            if error:
+                view_results[view_name]["error"] = error
+                print(f"Failed to create materialized view {view_name}: {error}")
+            elif view_name in view_commands:
+                print(f"✅ Materialized view '{view_name}' created successfully")
+            else:
+                print(f"✅ Materialized view '{view_name}' already exists")
+        for view_name in retired_views:
+            error = _get_script_error(script_results, ("drop_view", view_name))
+            if error:
+                print(f"⚠️  Could not drop retired materialized view {view_name}: {error}")
+            elif ("drop_view", view_name) in script_results:
+                print(f"🗑️  Dropped retired materialized view '{view_name}'")
+        
+        # Functions
+        function_results = {}
+        if functions:
+            print(f"\nFunctions:")
+        for function in functions:
+            key = ("function", function["name"])
+            error = _get_script_error(script_results, key)
+            function_results[function["name"]] = {"updated": key in script_results and error is None, "success": error is None}
+            if error:
+                function_results[function["name"]]["error"] = error
+                print(f"Failed to create function {function['name']}: {error}")
+            elif key in script_results:
+                print(f"✅ Function '{function['name']}' created or updated")
+            else:
+                print(f"✅ Function '{function['name']}' is up to date")
+        
+        backfill_error = _get_script_error(script_results, ("backfill", "events_enriched"))
+        if backfill_error:
+            print(f"⚠️  Could not backfill existing events into events_enriched: {backfill_error}")
+        elif ("backfill", "events_enriched") in script_results:
+            print(f"✅ Existing events backfilled into events_enriched")
         
         # Summary
         successful_tables = sum(1 for r in table_results.values() if r.get("success", False))
         created_tables = sum(1 for r in table_results.values() if r.get("created", False))
+        migrated_tables = sum(1 for r in table_results.values() if r.get("added_columns"))
+        drifted_tables = sum(1 for r in table_results.values() if r.get("drift"))
+        successful_views = sum(1 for r in view_results.values() if r.get("success", False))
+        created_views = sum(1 for r in view_results.values() if r.get("created", False))
+        applied_policies = sum(1 for r in policy_results.values() for status in r.values() if status == "applied")
+        failed_policies = sum(1 for r in policy_results.values() for status in r.values() if status == "failed")
         
         print(f"\n✅ Database table setup complete!")
         print(f"   Database: {database_name}")
         print(f"   Tables: {successful_tables}/{len(schemas)} ready")
         print(f"   Created: {created_tables} new tables")
+        print(f"   Migrated: {migrated_tables} tables with new columns")
+        if drifted_tables:
+            print(f"   ⚠️  Schema drift: {drifted_tables} tables (see warnings above)")
+        print(f"   Materialized views: {successful_views}/{len(views)} ready ({created_views} created)")
+        print(f"   Policies: {applied_policies} applied, {failed_policies} failed")
         
         return {
             "database": database_name,
             "database_verified": True,
             "tables": table_results,
+            "policies": policy_results,
+            "materialized_views": view_results,
+            "functions": function_results,
             "summary": {
                 "total_tables": len(schemas),
                 "successful_tables": successful_tables,
-                "created_tables": created_tables
+                "created_tables": created_tables,
+                "migrated_tables": migrated_tables,
+                "drifted_tables": drifted_tables,
+                "total_materialized_views": len(views),
+                "successful_materialized_views": successful_views,
+                "created_materialized_views": created_views,
+                "applied_policies": applied_policies,
+                "failed_policies": failed_policies
             }
         }
     
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Fabric Definition State Module
+
+This module provides content-hash based change detection for Fabric item definitions.
+Each setup step hashes the transformed definition parts it is about to upload and compares
+the hash with the last deployed one, so unchanged definitions skip the updateDefinition
+long-running operation entirely.
+
+The last deployed hash is looked up in a local state file first. When no local record
+exists (first run on a new machine, deleted state file), the current definition is fetched
+from Fabric via getDefinition and hashed the same way.
+
+Usage:
+    python fabric_definition_state.py --show
+    python fabric_definition_state.py --clear
+
+Environment Variables:
+    FABRIC_DEFINITION_STATE_PATH - Custom path of the state file
+        (defaults to ".azure/{AZURE_ENV_NAME}/fabric_definition_state.json" in the repository root)
+    FABRIC_FORCE_DEFINITION_UPDATE - Set to "true" to always upload definitions
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+from fabric_api import FabricWorkspaceApiClient, FabricApiError
+
+# Serializes read-modify-write of the state file by concurrently deployed environments
+_state_lock = threading.Lock()
+
+
+def get_definition_state_path() -> str:
+    """Get the path of the local definition state file.
+
+    Returns:
+        Absolute path of the state file
+    """
+    custom_path = os.getenv("FABRIC_DEFINITION_STATE_PATH")
+    if custom_path:
+        return os.path.abspath(custom_path)
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    repo_dir = os.path.abspath(os.path.join(script_dir, "..", "..", ".."))
+    env_name = os.getenv("AZURE_ENV_NAME", "default")
+    return os.path.join(repo_dir, ".azure", env_name, "fabric_definition_state.json")
+
+
+def _canonicalize_payload(path: str, payload_base64: str) -> bytes:
+    """Decode a definition part and normalize JSON content so formatting does not affect the hash."""
+    content = base64.b64decode(payload_base64)
+    if path.endswith((".json", ".ipynb")):
+        try:
+            parsed = json.loads(content.decode("utf-8"))
+            return json.dumps(parsed, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        except (ValueError, UnicodeDecodeError):
+            pass
+    return content.replace(b"\r\n", b"\n")
+
+
+def compute_definition_hash(parts: Dict[str, str]) -> str:
+    """Compute a SHA-256 hash over definition parts.
+
+    Args:
+        parts: Dictionary mapping definition part paths to Base64 encoded payloads
+
+    Returns:
+        Hex digest of the canonicalized definition parts
+    """
+    digest = hashlib.sha256()
+    for path in sorted(parts):
+        digest.update(path.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(_canonicalize_payload(path, parts[path]))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def load_definition_state(state_path: Optional[str] = None) -> Dict[str, Dict[str, str]]:
+    """Load the local definition state file.
+
+    Args:
+        state_path: Optional path of the state file (defaults to get_definition_state_path())
+
+    Returns:
+        Dictionary mapping "{workspace_id}/{item_id}" to the recorded state
+    """
+    state_path = state_path or get_definition_state_path()
+    if not os.path.exists(state_path):
+        return {}
+    try:
+        with open(state_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Ignoring unreadable definition state file {state_path}: {e}")
+        return {}
+
+
+def save_definition_state(state: Dict[str, Dict[str, str]], state_path: Optional[str] = None) -> None:
+    """Save the local definition state file.
+
+    Args:
+        state: Dictionary mapping "{workspace_id}/{item_id}" to the recorded state
+        state_path: Optional path of the state file (defaults to get_definition_state_path())
+    """
+    state_path = state_path or get_definition_state_path()
+    os.makedirs(os.path.dirname(state_path), exist_ok=True)
+    temp_path = f"{state_path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(temp_path, state_path)
+
+
+def _get_remote_definition_hash(workspace_client: FabricWorkspaceApiClient,
+                                item_id: str,
+                                part_paths: list,
+                                definition_format: Optional[str] = None) -> Optional[str]:
+    """Fetch the deployed definition and hash the same parts that would be uploaded."""
+    try:
+        definition = workspace_client.get_item_definition(item_id, definition_format=definition_format)
+    except FabricApiError as e:
+        print(f"⚠️  Could not fetch deployed definition for comparison: {e}")
+        return None
+
+    remote_parts = {part.get("path"): part.get("payload", "") for part in definition.get("parts", [])}
+    if not all(path in remote_parts for path in part_paths):
+        return None
+    return compute_definition_hash({path: remote_parts[path] for path in part_paths})
+
+
+def is_definition_unchanged(workspace_client: FabricWorkspaceApiClient,
+                            item_id: str,
+                            parts: Dict[str, str],
+                            definition_format: Optional[str] = None,
+                            state_path: Optional[str] = None) -> bool:
+    """Check whether the definition about to be uploaded matches the deployed one.
+
+    Args:
+        workspace_client: Authenticated FabricWorkspaceApiClient instance
+        item_id: ID of the item whose definition is being uploaded
+        parts: Dictionary mapping definition part paths to Base64 encoded payloads
+        definition_format: Optional definition format passed to getDefinition (e.g., "ipynb")
+        state_path: Optional path of the state file (defaults to get_definition_state_path())
+
+    Returns:
+        True if the definition is unchanged and the upload can be skipped, False otherwise
+    """
+    if os.getenv("FABRIC_FORCE_DEFINITION_UPDATE", "").lower() == "true":
+        return False
+
+    definition_hash = compute_definition_hash(parts)
+    state_key = f"{workspace_client.workspace_id}/{item_id}"
+    recorded = load_definition_state(state_path).get(state_key)
+
+    if recorded:
+        if recorded.get("hash") == definition_hash:
+            print(f"ℹ️  Definition unchanged since last deployment (hash {definition_hash[:12]})")
+            return True
+        return False
+
+    remote_hash = _get_remote_definition_hash(workspace_client, item_id, list(parts), definition_format)
+    if remote_hash == definition_hash:
+        print(f"ℹ️  Deployed definition already matches (hash {definition_hash[:12]})")
+        record_definition_hash(workspace_client, item_id, parts, state_path)
+        return True
+    return False
+
+
+def record_definition_hash(workspace_client: FabricWorkspaceApiClient,
+                           item_id: str,
+                           parts: Dict[str, str],
+                           state_path: Optional[str] = None) -> None:
+    """Record the hash of a successfully deployed definition.
+
+    Args:
+        workspace_client: Authenticated FabricWorkspaceApiClient instance
+        item_id: ID of the item whose definition was uploaded
+        parts: Dictionary mapping definition part paths to Base64 encoded payloads
+        state_path: Optional path of the state file (defaults to get_definition_state_path())
+    """
+    try:
+        with _state_lock:
+            state = load_definition_state(state_path)
+            state[f"{workspace_client.workspace_id}/{item_id}"] = {
+                "hash": compute_definition_hash(parts),
+                "deployed_at": datetime.now().isoformat(timespec="seconds")
+            }
+            save_definition_state(state, state_path)
+    except OSError as e:
+        # State is only an optimization - a failed write just means the next run uploads again
+        print(f"⚠️  Could not record definition state: {e}")
+
+
+def main():
+    """Main function to inspect or clear the local definition state."""
+    parser = argparse.ArgumentParser(
+        description="Inspect or clear the local Fabric definition state used to skip unchanged uploads"
+    )
+    parser.add_argument("--show", action="store_true", help="Print the recorded definition hashes")
+    parser.add_argument("--clear", action="store_true", help="Delete the state file so all definitions are uploaded on the next run")
+    args = parser.parse_args()
+
+    state_path = get_definition_state_path()
+    if args.clear:
+        if os.path.exists(state_path):
+            os.remove(state_path)
+            print(f"✅ Removed definition state file: {state_path}")
+        else:
+            print(f"ℹ️  No definition state file found at: {state_path}")
+        return
+
+    state = load_definition_state(state_path)
+    print(f"📄 Definition state file: {state_path}")
+    for key, entry in sorted(state.items()):
+        print(f"   {key}: {entry.get('hash', '')[:12]} (deployed {entry.get('deployed_at', 'unknown')})")
+    if not state:
+        print("   (empty)")
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,7 @@ import os
 import base64
 from typing import Optional, Dict, Any
 from fabric_api import FabricApiClient, FabricWorkspaceApiClient, FabricApiError
+from fabric_definition_state import is_definition_unchanged, record_definition_hash
 
 
 def read_environment_yml(file_path: str) -> str:
@@ -98,6 +99,12 @@ def setup_environment(workspace_client: FabricWorkspaceApiClient,
             # Read environment.yml content
             yml_content = read_environment_yml(environment_yml_path)
             yml_base64 = base64.b64encode(yml_content.encode('utf-8')).decode('utf-8')
+            definition_parts = {"Libraries/PublicLibraries/environment.yml": yml_base64}
+            
+            # Unchanged libraries skip both the update and the (slow) publish
+            if is_definition_unchanged(workspace_client, environment_id, definition_parts):
+                print(f"⏭️  Skipping Environment update and publish: '{environment_name}', definition unchanged")
+                return environment_info
             
             # Update environment definition
             success = workspace_client.update_environment_definition(
@@ -111,6 +118,7 @@ def setup_environment(workspace_client: FabricWorkspaceApiClient,
                 # Publish the environment to make it available
                 print(f"📤 Publishing Environment: '{environment_name}'")
                 workspace_client.publish_environment(environment_id)
+                record_definition_hash(workspace_client, environment_id, definition_parts)
                 print(f"✅ Successfully published Environment: '{environment_name}'")
             else:
                 print(f"⚠️  Failed to update Environment definition: '{environment_name}'")
@@ -51,7 +51,8 @@ def _rename_default_database(workspace_client: FabricWorkspaceApiClient,
     for attempt in range(max_retries):
         try:
             # Find the default database (should have the same name as the eventhouse)
-            default_database = workspace_client.get_kql_database_by_name(eventhouse_name)
+            # Bypass the cached item index on retries so a late-appearing database is found
+            default_database = workspace_client.get_kql_database_by_name(eventhouse_name, use_cache=(attempt == 0))
             
             if default_database:
                 current_name = default_database.get('displayName', '')
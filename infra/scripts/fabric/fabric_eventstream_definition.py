@@ -26,6 +26,7 @@ import os
 import sys
 from typing import Dict, Any, Optional
 from fabric_api import FabricApiClient, FabricWorkspaceApiClient, FabricApiError
+from fabric_definition_state import is_definition_unchanged, record_definition_hash
 
 def transform_eventstream_config(eventstream_config: dict,
                                eventhouse_database_id: str = None,
@@ -241,6 +242,12 @@ def setup_eventstream_definition(workspace_client: FabricWorkspaceApiClient,
         eventstream_json_str = json.dumps(eventstream_config)
         eventstream_base64 = base64.b64encode(eventstream_json_str.encode('utf-8')).decode('utf-8')
         print(f"✅ Eventstream configuration encoded ({len(eventstream_base64)} characters)")
+        definition_parts = {"eventstream.json": eventstream_base64}
+
+        # Skip the update LRO when the deployed definition already matches
+        if is_definition_unchanged(workspace_client, eventstream_id, definition_parts):
+            print(f"⏭️  Skipping eventstream definition update (ID: {eventstream_id}), definition unchanged")
+            return existing_eventstream
 
         # Update the existing eventstream
         print(f"🔄 Updating eventstream definition (ID: {eventstream_id})...")
@@ -251,6 +258,7 @@ def setup_eventstream_definition(workspace_client: FabricWorkspaceApiClient,
         )
         
         if update_success:
+            record_definition_hash(workspace_client, eventstream_id, definition_parts)
             print(f"✅ Successfully updated eventstream definition (ID: {eventstream_id})")
             
             # Get updated eventstream information
@@ -58,8 +58,9 @@ def setup_folder(workspace_client: FabricWorkspaceApiClient,
             folder_id = workspace_client.create_folder(folder_name, parent_folder_id)
             
             # Get the created folder information
-            folders = workspace_client.get_folders()
-            created_folder = next((f for f in folders if f['id'] == folder_id), None)
+            created_folder = workspace_client.get_folder_by_name(folder_name, parent_folder_id)
+            if created_folder and created_folder['id'] != folder_id:
+                created_folder = None
             
             if not created_folder:
                 raise FabricApiError(f"Failed to retrieve created folder information for '{folder_name}'")
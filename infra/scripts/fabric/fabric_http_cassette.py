@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Fabric HTTP Cassette Module
+
+This module provides record/replay of the HTTP traffic of FabricApiClient and GraphApiClient.
+A deployment is run once against the real services while every request is recorded to a
+cassette file, and later replayed deterministically without network access or credentials,
+either with the recorded per-request latency or with zero latency. This allows regression
+benchmarking of the deployment orchestration and shows which calls dominate wall-clock time.
+
+Cassettes are JSON Lines files with one entry per HTTP request: method, URL, redacted request
+body, response status, headers and body, start offset and duration. Authorization headers are
+never written, and values of secret-like JSON keys (keys, passwords, tokens, connection
+strings) are replaced with "REDACTED"; pagination continuation tokens are kept so paginated
+listings replay. Base64 payloads of uploaded definitions are replaced with their size, since
+only responses are needed for replay.
+
+Replay serves the recorded responses of each method and URL in recorded order, so polling of
+long-running operations and paginated listings replay as recorded. A request that was not
+recorded, or was recorded fewer times, fails with CassetteMissError. Replays must use the same
+environment variables as the recording (they determine item names), and a fresh definition
+state (FABRIC_FORCE_DEFINITION_UPDATE=true) so the same definitions are uploaded.
+
+Only traffic sent through the Fabric and Graph REST clients is recorded. Kusto, Event Hub
+management and OneLake calls use their own SDK transports and still need real services.
+
+Usage:
+    # Record a deployment, then replay it at zero latency
+    FABRIC_HTTP_CASSETTE=deploy.jsonl FABRIC_HTTP_CASSETTE_MODE=record python deploy_fabric_rti.py
+    FABRIC_HTTP_CASSETTE=deploy.jsonl FABRIC_HTTP_CASSETTE_MODE=replay FABRIC_HTTP_REPLAY_LATENCY=zero python deploy_fabric_rti.py
+
+    # Show which calls dominate wall-clock time
+    python fabric_http_cassette.py deploy.jsonl --top 20
+
+    from fabric_http_cassette import http_request
+    response = http_request("GET", url, headers=headers, timeout=60)
+
+Environment Variables:
+    FABRIC_HTTP_CASSETTE - Path of the cassette file (recording/replay is disabled when unset)
+    FABRIC_HTTP_CASSETTE_MODE - "record" (default) or "replay"
+    FABRIC_HTTP_REPLAY_LATENCY - "recorded" (default) to sleep for each recorded request
+        duration, or "zero" to answer immediately and zero all Retry-After headers. Waits the
+        clients schedule themselves (e.g. the first poll of a long-running operation) are kept,
+        so a zero-latency replay measures the time the orchestration spends waiting on its own
+    FABRIC_HTTP_POOL_SIZE - Maximum number of pooled connections per host of the shared HTTP
+        session (default: 32). Live requests reuse connections instead of opening a new TLS
+        connection per request, also across the environments of a fleet deployment
+"""
+
+import argparse
+import json
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+import requests.adapters
+from requests.structures import CaseInsensitiveDict
+
+# JSON keys whose values are replaced in recorded request and response bodies
+SECRET_KEY_PATTERN = re.compile(r"(password|secret|token|sharedaccesskey|accesskey|apikey|api_key|connectionstring|credentials?$|^key$)", re.IGNORECASE)
+# JSON keys matching SECRET_KEY_PATTERN that are not secrets; pagination tokens must replay verbatim
+NON_SECRET_KEYS = {"continuationtoken", "continuationuri"}
+# Query string parameters whose values are replaced in recorded URLs
+SECRET_QUERY_PARAMS = {"sig", "code", "api-key", "access_token"}
+# Response headers kept in the cassette (all others are dropped)
+RECORDED_HEADERS = ("Content-Type", "Location", "Retry-After", "x-ms-operation-id", "requestId", "request-id")
+# Route segments replaced with a placeholder when grouping requests in summaries
+ID_PATTERN = re.compile(r"/([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|[^/]+@[^/]+)(?=/|$)")
+
+REDACTED = "REDACTED"
+
+
+class CassetteMissError(requests.RequestException):
+    """Raised when a replayed request has no recorded response left."""
+
+
+def _redact_json(value: Any, keep_payloads: bool = False) -> Any:
+    """Replace secret values and, unless kept, definition payloads in a parsed JSON document."""
+    if isinstance(value, dict):
+        redacted = {}
+        for key, item in value.items():
+            if (SECRET_KEY_PATTERN.search(key) and key.lower() not in NON_SECRET_KEYS
+                    and isinstance(item, (str, int, float)) and item != ""):
+                redacted[key] = REDACTED
+            elif key == "payload" and isinstance(item, str) and not keep_payloads:
+                redacted[key] = f"<{len(item)} base64 chars>"
+            else:
+                redacted[key] = _redact_json(item, keep_payloads)
+        return redacted
+    if isinstance(value, list):
+        return [_redact_json(item, keep_payloads) for item in value]
+    return value
+
+
+def _redact_body(body: Optional[Union[str, bytes]], keep_payloads: bool = False) -> Optional[str]:
+    """Redact a request or response body, keeping non-JSON bodies as text.
+
+    Response payloads (e.g. of getDefinition) are kept since replay needs them.
+    """
+    if body is None or body == b"" or body == "":
+        return None
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", errors="replace")
+    try:
+        parsed = json.loads(body)
+    except ValueError:
+        return body
+    return json.dumps(_redact_json(parsed, keep_payloads))
+
+
+def redact_url(url: str) -> str:
+    """Replace secret query string parameters of a URL."""
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    query = [(key, REDACTED if key.lower() in SECRET_QUERY_PARAMS else value) for key, value in parse_qsl(parts.query, keep_blank_values=True)]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), parts.fragment))
+
+
+def get_route(method: str, url: str) -> str:
+    """Get the route template of a request, e.g. "GET /v1/workspaces/{id}/items"."""
+    return f"{method.upper()} {ID_PATTERN.sub('/{id}', urlsplit(url).path)}"
+
+
+class HttpCassette:
+    """
+    Recorder and player of HTTP requests made through http_request().
+
+    In record mode requests are sent with the requests library and appended to the cassette
+    file as they complete. In replay mode the cassette is loaded once and responses are served
+    per method and URL in recorded order.
+    """
+
+    def __init__(self, path: str, mode: str = "record", replay_latency: str = "recorded"):
+        """
+        Initialize the HttpCassette.
+
+        Args:
+            path: Path of the JSON Lines cassette file
+            mode: "record" to send and record requests, "replay" to serve recorded responses
+            replay_latency: "recorded" to replay request durations, "zero" to answer immediately
+
+        Raises:
+            ValueError: If mode or replay_latency is not supported
+            FileNotFoundError: If the cassette to replay does not exist
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unsupported cassette mode '{mode}' (expected 'record' or 'replay')")
+        if replay_latency not in ("recorded", "zero"):
+            raise ValueError(f"Unsupported replay latency '{replay_latency}' (expected 'recorded' or 'zero')")
+        self.path = os.path.abspath(path)
+        self.mode = mode
+        self.replay_latency = replay_latency
+        self._lock = threading.Lock()
+        self._started_at = time.time()
+        self._sequence = 0
+        self._recorded: Dict[tuple, List[Dict[str, Any]]] = defaultdict(list)
+
+        if mode == "record":
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            # A recording always starts a new cassette
+            open(self.path, "w", encoding="utf-8").close()
+        else:
+            for entry in load_cassette(self.path):
+                self._recorded[(entry["method"], entry["url"])].append(entry)
+
+    def request(self,
+                method: str,
+                url: str,
+                headers: Optional[Dict[str, str]] = None,
+                data: Optional[Union[str, bytes]] = None,
+                timeout: Optional[float] = None) -> requests.Response:
+        """
+        Send or replay an HTTP request.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            headers: Request headers (never recorded)
+            data: Request body
+            timeout: Request timeout in seconds (only used when recording)
+
+        Returns:
+            Live or replayed response
+
+        Raises:
+            CassetteMissError: If a replayed request has no recorded response left
+            requests.RequestException: If a recorded request fails
+        """
+        method = method.upper()
+        if self.mode == "replay":
+            return self._replay(method, url)
+
+        started = time.time()
+        response = get_http_session().request(method=method, url=url, headers=headers, data=data, timeout=timeout)
+        elapsed_sec = time.time() - started
+
+        entry = {
+            "method": method,
+            "url": redact_url(url),
+            "request_body": _redact_body(data),
+            "status": response.status_code,
+            "headers": {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers},
+            "body": _redact_body(response.content, keep_payloads=True),
+            "started_sec": round(started - self._started_at, 4),
+            "elapsed_sec": round(elapsed_sec, 4),
+        }
+        with self._lock:
+            self._sequence += 1
+            entry = {"seq": self._sequence, **entry}
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+        return response
+
+    def _replay(self, method: str, url: str) -> requests.Response:
+        with self._lock:
+            queue = self._recorded.get((method, redact_url(url)))
+            if not queue:
+                raise CassetteMissError(f"No recorded response left for {method} {url} in cassette {self.path}")
+            entry = queue.pop(0)
+
+        if self.replay_latency == "recorded" and entry["elapsed_sec"] > 0:
+            time.sleep(entry["elapsed_sec"])
+
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.url = url
+        response.encoding = "utf-8"
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        if self.replay_latency == "zero" and "Retry-After" in response.headers:
+            response.headers["Retry-After"] = "0"
+        response._content = entry["body"].encode("utf-8") if entry["body"] is not None else b""
+        return response
+
+    def remaining(self) -> int:
+        """Get the number of recorded responses not replayed yet."""
+        with self._lock:
+            return sum(len(queue) for queue in self._recorded.values())
+
+
+def load_cassette(path: str) -> List[Dict[str, Any]]:
+    """Load the entries of a cassette file.
+
+    Args:
+        path: Path of the JSON Lines cassette file
+
+    Returns:
+        Cassette entries in recorded order
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+DEFAULT_POOL_SIZE = 32
+
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+_active_cassette = None
+_active_cassette_loaded = False
+_active_cassette_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """Get the process-wide HTTP session with a connection pool sized by FABRIC_HTTP_POOL_SIZE.
+
+    Returns:
+        Shared requests.Session
+    """
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            pool_size = int(os.getenv("FABRIC_HTTP_POOL_SIZE", DEFAULT_POOL_SIZE))
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _http_session = session
+        return _http_session
+
+
+def get_active_cassette() -> Optional[HttpCassette]:
+    """Get the process-wide cassette configured by FABRIC_HTTP_CASSETTE, creating it on first use.
+
+    Returns:
+        HttpCassette, or None if recording/replay is disabled
+    """
+    global _active_cassette, _active_cassette_loaded
+    with _active_cassette_lock:
+        if not _active_cassette_loaded:
+            path = os.getenv("FABRIC_HTTP_CASSETTE")
+            if path:
+                mode = os.getenv("FABRIC_HTTP_CASSETTE_MODE", "record").lower()
+                replay_latency = os.getenv("FABRIC_HTTP_REPLAY_LATENCY", "recorded").lower()
+                _active_cassette = HttpCassette(path, mode=mode, replay_latency=replay_latency)
+                print(f"📼 HTTP cassette {mode} mode: {_active_cassette.path}")
+            _active_cassette_loaded = True
+        return _active_cassette
+
+
+def set_active_cassette(cassette: Optional[HttpCassette]) -> None:
+    """Replace the process-wide cassette (None disables recording/replay)."""
+    global _active_cassette, _active_cassette_loaded
+    with _active_cassette_lock:
+        _active_cassette = cassette
+        _active_cassette_loaded = True
+
+
+def http_request(method: str,
+                 url: str,
+                 headers: Optional[Dict[str, str]] = None,
+                 data: Optional[Union[str, bytes]] = None,
+                 timeout: Optional[float] = None) -> requests.Response:
+    """Send an HTTP request through the active cassette, or the shared HTTP session when none is configured.
+
+    Args:
+        method: HTTP method
+        url: Full request URL
+        headers: Request headers
+        data: Request body
+        timeout: Request timeout in seconds
+
+    Returns:
+        Live or replayed response
+    """
+    cassette = get_active_cassette()
+    if cassette:
+        return cassette.request(method, url, headers=headers, data=data, timeout=timeout)
+    return get_http_session().request(method=method.upper(), url=url, headers=headers, data=data, timeout=timeout)
+
+
+def summarize_cassette(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate the request durations of a cassette per route.
+
+    Args:
+        entries: Cassette entries
+
+    Returns:
+        Dictionary with wall-clock and request time totals, and per-route statistics
+        sorted by total request time
+    """
+    routes: Dict[str, Dict[str, Any]] = {}
+    for entry in entries:
+        route = routes.setdefault(get_route(entry["method"], entry["url"]), {"count": 0, "total_sec": 0.0, "max_sec": 0.0, "statuses": defaultdict(int)})
+        route["count"] += 1
+        route["total_sec"] += entry["elapsed_sec"]
+        route["max_sec"] = max(route["max_sec"], entry["elapsed_sec"])
+        route["statuses"][str(entry["status"])] += 1
+
+    wall_clock_sec = max((e["started_sec"] + e["elapsed_sec"] for e in entries), default=0.0)
+    return {
+        "requests": len(entries),
+        "wall_clock_sec": wall_clock_sec,
+        "request_sec": sum(e["elapsed_sec"] for e in entries),
+        "routes": sorted(({"route": name, **stats, "statuses": dict(stats["statuses"])} for name, stats in routes.items()),
+                         key=lambda r: -r["total_sec"]),
+    }
+
+
+def main():
+    """Main function to summarize a recorded cassette."""
+    parser = argparse.ArgumentParser(description="Summarize the HTTP traffic recorded in a Fabric HTTP cassette")
+    parser.add_argument("cassette", help="Path of the cassette file")
+    parser.add_argument("--top", type=int, default=0, help="Only show the N routes with the most request time")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    args = parser.parse_args()
+
+    summary = summarize_cassette(load_cassette(args.cassette))
+    if args.top:
+        summary["routes"] = summary["routes"][:args.top]
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+
+    print(f"📼 {args.cassette}: {summary['requests']} request(s)")
+    print(f"   Wall clock: {summary['wall_clock_sec']:.1f}s, time in requests: {summary['request_sec']:.1f}s")
+    print(f"   {'Count':>5}  {'Total':>8}  {'Share':>6}  {'Max':>7}  Route")
+    for route in summary["routes"]:
+        share = route["total_sec"] / summary["request_sec"] * 100 if summary["request_sec"] else 0.0
+        statuses = ", ".join(f"{status}: {count}" for status, count in sorted(route["statuses"].items()))
+        print(f"   {route['count']:>5}  {route['total_sec']:>7.2f}s  {share:>5.1f}%  {route['max_sec']:>6.2f}s  {route['route']}  ({statuses})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Fabric Job Runner Module
+
+This module provides concurrent, resumable execution of Fabric item jobs (e.g., notebook runs).
+FabricWorkspaceApiClient.schedule_notebook_job() blocks its caller while it polls a single job
+for up to the LRO timeout. JobRunner instead submits any number of jobs at once and tracks them
+all from one background poller thread, so callers continue with other work and only wait where
+they need the results.
+
+Submitted job instance URLs are persisted to a local state file until the job finishes. When a
+deployment is interrupted and restarted, submitting the same job again reattaches to the job
+that is still running (or already finished) instead of starting a second run. Jobs that time
+out stay in the state file for the same reason.
+
+Usage:
+    from fabric_job_runner import JobRunner
+    runner = JobRunner(workspace_client)
+    job = runner.submit(notebook_id, name="configure_data_agent", on_complete=lambda job: print(job.status))
+    ...
+    runner.wait([job])
+
+    python fabric_job_runner.py --show
+    python fabric_job_runner.py --clear
+
+Environment Variables:
+    FABRIC_JOB_STATE_PATH - Custom path of the job state file
+        (defaults to ".azure/{AZURE_ENV_NAME}/fabric_job_state.json" in the repository root)
+"""
+
+import argparse
+import contextvars
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+from fabric_api import FabricWorkspaceApiClient, FabricApiError, FabricOperationCancelledError
+from fabric_profiler import profile_span
+
+# Statuses of finished jobs
+FINAL_STATUSES = ("Completed", "Failed", "Cancelled", "Timeout")
+
+# Serializes read-modify-write of the state file by the runners of concurrently deployed environments
+_state_lock = threading.Lock()
+
+
+def get_job_state_path() -> str:
+    """Get the path of the local job state file.
+
+    Returns:
+        Absolute path of the state file
+    """
+    custom_path = os.getenv("FABRIC_JOB_STATE_PATH")
+    if custom_path:
+        return os.path.abspath(custom_path)
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    repo_dir = os.path.abspath(os.path.join(script_dir, "..", "..", ".."))
+    env_name = os.getenv("AZURE_ENV_NAME", "default")
+    return os.path.join(repo_dir, ".azure", env_name, "fabric_job_state.json")
+
+
+def load_job_state(state_path: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Load the local job state file.
+
+    Args:
+        state_path: Optional path of the state file (defaults to get_job_state_path())
+
+    Returns:
+        Dictionary mapping "{workspace_id}/{item_id}/{job_type}" to the in-flight job
+    """
+    state_path = state_path or get_job_state_path()
+    if not os.path.exists(state_path):
+        return {}
+    try:
+        with open(state_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Ignoring unreadable job state file {state_path}: {e}")
+        return {}
+
+
+def _update_job_state(key: str, entry: Optional[Dict[str, Any]], state_path: Optional[str] = None) -> None:
+    """Record (or with entry None, remove) an in-flight job in the state file."""
+    state_path = state_path or get_job_state_path()
+    try:
+        with _state_lock:
+            state = load_job_state(state_path)
+            if entry is None:
+                if key not in state:
+                    return
+                state.pop(key)
+            else:
+                state[key] = entry
+            os.makedirs(os.path.dirname(state_path), exist_ok=True)
+            temp_path = f"{state_path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f, indent=2, sort_keys=True)
+            os.replace(temp_path, state_path)
+    except OSError as e:
+        # State is only needed to reattach after an interruption
+        print(f"⚠️  Could not update job state: {e}")
+
+
+@dataclass
+class TrackedJob:
+    """A submitted job and its latest known status."""
+    name: str
+    item_id: str
+    job_type: str
+    url: str
+    state_key: str
+    reattached: bool = False
+    execution_data: Optional[Dict[str, Any]] = None
+    cancel_requested: bool = False
+    status: str = "NotStarted"
+    submitted_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    details: Dict[str, Any] = field(default_factory=dict)
+    on_complete: Optional[Callable[["TrackedJob"], None]] = None
+    attempt: int = 0
+    next_poll: float = 0.0
+    done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def job_instance_id(self) -> str:
+        """ID of the job instance (the last segment of its URL)."""
+        return self.url.rstrip("/").split("/")[-1]
+
+    @property
+    def duration_sec(self) -> float:
+        """Seconds from submission until the job finished (or until now)."""
+        return (self.finished_at or time.time()) - self.submitted_at
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status == "Completed"
+
+
+class JobRunner:
+    """
+    Submits item jobs of one workspace and tracks them all from a single poller thread.
+
+    The poller thread runs while jobs are pending and polls each job on its own schedule
+    (Retry-After or exponential backoff, like FabricApiClient.wait_for_lros).
+    """
+
+    def __init__(self,
+                 workspace_client: FabricWorkspaceApiClient,
+                 state_path: Optional[str] = None,
+                 max_wait_sec: Optional[int] = None):
+        """
+        Initialize the JobRunner.
+
+        Args:
+            workspace_client: Authenticated FabricWorkspaceApiClient instance
+            state_path: Optional path of the job state file (defaults to get_job_state_path())
+            max_wait_sec: Maximum run time of a job before it is reported as timed out
+                (defaults to the client's lro_max_wait_sec)
+        """
+        self.workspace_client = workspace_client
+        self.state_path = state_path
+        self.max_wait_sec = max_wait_sec or workspace_client.lro_max_wait_sec
+        self._jobs: Dict[str, TrackedJob] = {}
+        self._condition = threading.Condition()
+        self._poller: Optional[threading.Thread] = None
+
+    def submit(self,
+               item_id: str,
+               name: Optional[str] = None,
+               job_type: str = "RunNotebook",
+               execution_data: Optional[Dict[str, Any]] = None,
+               on_complete: Optional[Callable[[TrackedJob], None]] = None,
+               reattach: bool = True) -> TrackedJob:
+        """
+        Submit a job, or reattach to the same job still tracked or started by an interrupted run.
+
+        Args:
+            item_id: ID of the item to run
+            name: Job name for logging (defaults to the item ID)
+            job_type: Job type (e.g., "RunNotebook")
+            execution_data: Optional execution data (e.g., notebook parameters)
+            on_complete: Optional callback called with the TrackedJob once it finished,
+                on the poller thread
+            reattach: Whether to reattach to a persisted in-flight job (False always starts a
+                new run, e.g. after the item definition changed)
+
+        Returns:
+            TrackedJob (wait for it with wait())
+
+        Raises:
+            FabricApiError: If the job cannot be started
+        """
+        name = name or item_id
+        state_key = f"{self.workspace_client.workspace_id}/{item_id}/{job_type}"
+        with self._condition:
+            existing = self._jobs.get(state_key)
+            if existing and not existing.done.is_set():
+                return existing
+
+        entry = load_job_state(self.state_path).get(state_key) if reattach else None
+        if entry:
+            print(f"🔗 Reattaching to job '{name}' started at {entry.get('submitted_at')} (instance {entry['url'].rstrip('/').split('/')[-1]})")
+            job = TrackedJob(name, item_id, job_type, entry["url"], state_key, reattached=True,
+                             execution_data=execution_data, on_complete=on_complete)
+        else:
+            url = self.workspace_client.start_item_job(item_id, job_type=job_type, execution_data=execution_data)
+            job = TrackedJob(name, item_id, job_type, url, state_key, execution_data=execution_data, on_complete=on_complete)
+            _update_job_state(state_key, {
+                "name": name,
+                "url": url,
+                "submitted_at": datetime.now().isoformat(timespec="seconds")
+            }, self.state_path)
+            print(f"▶️  Submitted job '{name}' (instance {job.job_instance_id})")
+
+        job.next_poll = time.time() + self.workspace_client.lro_initial_interval_sec
+        with self._condition:
+            self._jobs[state_key] = job
+            if self._poller is None or not self._poller.is_alive():
+                self._poller = threading.Thread(target=contextvars.copy_context().run, args=(self._poll_jobs,),
+                                                name="fabric-job-poller", daemon=True)
+                self._poller.start()
+            self._condition.notify()
+        return job
+
+    def cancel(self, job: TrackedJob) -> None:
+        """Request cancellation of a job; it finishes as "Cancelled" once Fabric confirms it.
+
+        Args:
+            job: Job returned by submit()
+        """
+        if job.done.is_set():
+            return
+        self.workspace_client.cancel_item_job(job.item_id, job.job_instance_id)
+        print(f"⏹️  Requested cancellation of job '{job.name}'")
+        with self._condition:
+            job.cancel_requested = True
+            job.next_poll = time.time()
+            self._condition.notify()
+
+    def wait(self, jobs: Optional[List[TrackedJob]] = None, timeout: Optional[float] = None) -> List[TrackedJob]:
+        """Wait for jobs to finish.
+
+        Args:
+            jobs: Jobs to wait for (defaults to all submitted jobs)
+            timeout: Optional maximum time to wait in seconds
+
+        Returns:
+            The jobs, with their final status (or their latest status if the timeout elapsed)
+        """
+        if jobs is None:
+            with self._condition:
+                jobs = list(self._jobs.values())
+        deadline = time.time() + timeout if timeout is not None else None
+        pending = [job.name for job in jobs if not job.done.is_set()]
+        with profile_span(", ".join(pending) or "jobs", "lro_wait", pending=len(pending)):
+            for job in jobs:
+                remaining = deadline - time.time() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    break
+                job.done.wait(remaining)
+        return jobs
+
+    def pending(self) -> List[TrackedJob]:
+        """Get the submitted jobs that have not finished yet."""
+        with self._condition:
+            return [job for job in self._jobs.values() if not job.done.is_set()]
+
+    def _poll_jobs(self) -> None:
+        """Poll all pending jobs until none is left."""
+        while True:
+            with self._condition:
+                pending = [job for job in self._jobs.values() if not job.done.is_set()]
+                if not pending:
+                    self._poller = None
+                    return
+                now = time.time()
+                due = [job for job in pending if job.next_poll <= now]
+                if not due:
+                    self._condition.wait(min(job.next_poll for job in pending) - now)
+                    continue
+            for job in due:
+                try:
+                    self._poll_job(job)
+                except Exception as e:
+                    # Any error must finish the job, or the poller dies and wait() never returns
+                    self._finish(job, "Failed", error=f"Error polling '{job.name}': {e}")
+
+    def _poll_job(self, job: TrackedJob) -> None:
+        """Poll one job once and finish it if it completed, failed or timed out."""
+        try:
+            response, delay = self.workspace_client.poll_operation(job.url, job.name, job.attempt)
+        except FabricApiError as e:
+            cancelled = isinstance(e, FabricOperationCancelledError)
+            if job.reattached and e.status_code == 404:
+                # The persisted job instance no longer exists - start a new run instead
+                self._restart(job, "not found")
+                return
+            if job.reattached and job.attempt == 0 and not job.cancel_requested and (cancelled or e.status_code == 200):
+                # The persisted job instance had already failed before this run - start a new run
+                # instead of reporting the old failure
+                self._restart(job, "already cancelled" if cancelled else "already failed")
+                return
+            self._finish(job, "Cancelled" if cancelled else "Failed", error=str(e))
+            return
+
+        if response is not None:
+            try:
+                details = response.json() if response.content else {}
+            except ValueError:
+                details = {}
+            self._finish(job, "Completed", details=details)
+            return
+
+        if time.time() - job.submitted_at >= self.max_wait_sec:
+            # Keep the persisted job, so a later run reattaches to it instead of starting another one
+            self._finish(job, "Timeout", error=f"'{job.name}' timed out after {self.max_wait_sec}s", keep_state=True)
+            return
+        job.status = "InProgress"
+        job.attempt += 1
+        job.next_poll = time.time() + delay
+
+    def _restart(self, job: TrackedJob, reason: str) -> None:
+        """Start a new run of a reattached job whose persisted job instance cannot be resumed."""
+        print(f"⚠️  Job instance of '{job.name}' {reason}, starting a new run")
+        _update_job_state(job.state_key, None, self.state_path)
+        try:
+            job.url = self.workspace_client.start_item_job(job.item_id, job_type=job.job_type,
+                                                           execution_data=job.execution_data)
+        except FabricApiError as e:
+            self._finish(job, "Failed", error=str(e))
+            return
+        job.reattached = False
+        job.submitted_at = time.time()
+        job.attempt = 0
+        job.next_poll = time.time() + self.workspace_client.lro_initial_interval_sec
+        _update_job_state(job.state_key, {
+            "name": job.name,
+            "url": job.url,
+            "submitted_at": datetime.now().isoformat(timespec="seconds")
+        }, self.state_path)
+
+    def _finish(self, job: TrackedJob, status: str, error: Optional[str] = None,
+                details: Optional[Dict[str, Any]] = None, keep_state: bool = False) -> None:
+        """Record the final status of a job, forget its persisted state and call its callback."""
+        job.status = status
+        job.error = error
+        job.details = details or {}
+        job.finished_at = time.time()
+        try:
+            if not keep_state:
+                _update_job_state(job.state_key, None, self.state_path)
+            icon = "✅" if status == "Completed" else "❌"
+            print(f"{icon} Job '{job.name}' {status.lower()} after {job.duration_sec:.0f}s" + (f": {error}" if error else ""))
+            if job.on_complete:
+                try:
+                    job.on_complete(job)
+                except Exception as e:
+                    print(f"⚠️  Completion callback of job '{job.name}' failed: {e}")
+        finally:
+            job.done.set()
+
+
+def main():
+    """Main function to inspect or clear the local job state."""
+    parser = argparse.ArgumentParser(description="Manage the state of Fabric jobs started by the deployment scripts")
+    parser.add_argument("--show", action="store_true", help="Show the jobs a restarted deployment would reattach to")
+    parser.add_argument("--clear", action="store_true", help="Delete the job state file, so the next deployment starts new runs")
+    args = parser.parse_args()
+
+    state_path = get_job_state_path()
+    if args.clear:
+        if os.path.exists(state_path):
+            os.remove(state_path)
+            print(f"✅ Removed job state file: {state_path}")
+        else:
+            print(f"ℹ️  No job state file found at: {state_path}")
+        return
+
+    state = load_job_state(state_path)
+    print(f"📄 Job state file: {state_path}")
+    print(f"   In-flight jobs: {len(state)}")
+    if args.show:
+        for key, entry in sorted(state.items()):
+            print(f"   {key}: '{entry.get('name')}' submitted at {entry.get('submitted_at')}")
+            print(f"      {entry.get('url')}")
+
+
+if __name__ == "__main__":
+    main()
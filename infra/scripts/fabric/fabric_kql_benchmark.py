@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+"""
+Fabric KQL Benchmark Module
+
+This module benchmarks the KQL queries shipped in src/kql against a target database.
+Each query is run N times with the dashboard parameters (_startTime, _endTime, AssetFilter,
+DisplayMode) and the dashboard base queries (e.g., ZScored) declared as let statements,
+and the resource consumption statistics Kusto returns with every query (CPU time, memory
+peak, scanned extents, shard cache hits, execution time) are collected into a JSON and a
+Markdown report. A previous JSON report can be passed to compare the runs.
+
+Management command files (e.g., `.create-or-alter function`) are skipped.
+
+Usage:
+    python fabric_kql_benchmark.py --cluster-uri "https://cluster.kusto.fabric.microsoft.com" --database "database_name"
+    python fabric_kql_benchmark.py --cluster-uri "http://localhost:8080" --database "NetDefaultDB" --emulator --iterations 10
+    python fabric_kql_benchmark.py --cluster-uri "..." --database "..." --queries "real_time_dashboard/*.kql" --compare previous.json
+
+Requirements:
+    - Kusto client libraries installed
+    - Azure CLI authentication (not needed with --emulator)
+    - The database tables, materialized views and functions set up by fabric_database.py
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from azure.kusto.data import KustoClient, KustoConnectionStringBuilder, ClientRequestProperties
+from fabric_token_cache import get_shared_credential
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+repo_dir = os.path.abspath(os.path.join(script_dir, "..", "..", ".."))
+KQL_DIR = os.path.join(repo_dir, "src", "kql")
+DASHBOARD_FILE = os.path.join(repo_dir, "src", "definitions", "realTimeDashboard", "RealTimeDashboard.json")
+
+# Metrics summarized in the report, in report column order
+METRICS = [
+    ("duration_ms", "Duration (ms)"),
+    ("execution_time_ms", "Execution (ms)"),
+    ("cpu_ms", "CPU (ms)"),
+    ("memory_peak_mb", "Memory peak (MB)"),
+    ("extents_scanned", "Extents scanned"),
+    ("extents_total", "Extents total"),
+    ("cache_hit_ratio", "Cache hit %"),
+    ("rows_returned", "Rows")
+]
+
+
+def create_benchmark_client(cluster_uri: str, emulator: bool = False) -> KustoClient:
+    """Create a Kusto client for Fabric, or an unauthenticated one for the Kusto emulator.
+
+    Args:
+        cluster_uri: Query URI of the cluster (e.g., "http://localhost:8080" for the emulator)
+        emulator: Whether the cluster is a local Kusto emulator container without authentication
+
+    Returns:
+        Connected Kusto client instance
+    """
+    if emulator:
+        kcsb = KustoConnectionStringBuilder.with_no_authentication(cluster_uri)
+    else:
+        kcsb = KustoConnectionStringBuilder.with_azure_token_credential(cluster_uri, get_shared_credential())
+    return KustoClient(kcsb)
+
+
+def _parse_duration(value: str) -> timedelta:
+    """Convert a duration such as "30d", "24h" or "15m" to a timedelta."""
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)([dhms])", value.strip())
+    if not match:
+        raise argparse.ArgumentTypeError(f"Invalid duration '{value}', expected e.g. 30d, 24h, 15m")
+    amount, unit = float(match.group(1)), match.group(2)
+    unit_name = {"d": "days", "h": "hours", "m": "minutes", "s": "seconds"}[unit]
+    return timedelta(**{unit_name: amount})
+
+
+def _parse_timespan_ms(value: Any) -> Optional[float]:
+    """Convert a Kusto timespan string ("[d.]hh:mm:ss[.fffffff]") to milliseconds."""
+    if value is None:
+        return None
+    days = 0
+    if "." in value.split(":")[0]:
+        day_part, value = value.split(".", 1)
+        days = int(day_part)
+    hours, minutes, seconds = value.split(":")
+    return (days * 86400 + int(hours) * 3600 + int(minutes) * 60 + float(seconds)) * 1000
+
+
+def discover_queries(patterns: Optional[List[str]] = None) -> List[str]:
+    """Find the KQL files to benchmark.
+
+    Args:
+        patterns: Glob patterns relative to src/kql (defaults to all .kql files)
+
+    Returns:
+        Sorted list of absolute file paths
+    """
+    files = set()
+    for pattern in patterns or ["**/*.kql"]:
+        files.update(glob.glob(os.path.join(KQL_DIR, pattern), recursive=True))
+    return sorted(files)
+
+
+def is_management_script(query_text: str) -> bool:
+    """Check whether a KQL file contains management commands instead of a single query."""
+    return any(line.lstrip().startswith(".") for line in query_text.splitlines())
+
+
+def load_base_queries(dashboard_file: str = DASHBOARD_FILE) -> Dict[str, str]:
+    """Load the dashboard base queries, which tile queries reference by variable name.
+
+    Args:
+        dashboard_file: Path of the real-time dashboard definition
+
+    Returns:
+        Dictionary mapping base query variable names to their query text
+    """
+    if not os.path.exists(dashboard_file):
+        return {}
+    with open(dashboard_file, "r", encoding="utf-8") as f:
+        dashboard = json.load(f)
+    query_texts = {query["id"]: query["text"] for query in dashboard.get("queries", [])}
+    return {
+        base_query["variableName"]: query_texts[base_query["queryId"]]
+        for base_query in dashboard.get("baseQueries", [])
+        if base_query.get("queryId") in query_texts
+    }
+
+
+def _strip_comments(query_text: str) -> str:
+    """Drop full-line comments and blank lines so a query can be embedded in a let statement."""
+    lines = [line for line in query_text.splitlines() if line.strip() and not line.lstrip().startswith("//")]
+    return "\n".join(lines)
+
+
+def build_query(query_text: str, parameters: Dict[str, Any], base_queries: Dict[str, str]) -> str:
+    """Declare the dashboard parameters and base queries used by a query as let statements.
+
+    Args:
+        query_text: KQL query text, as used in a dashboard tile
+        parameters: Dictionary mapping parameter names to values (datetime or str)
+        base_queries: Dictionary mapping base query variable names to their query text
+
+    Returns:
+        Self-contained KQL query
+    """
+    def is_referenced(name: str, text: str) -> bool:
+        return re.search(rf"(?<![\w']){re.escape(name)}(?![\w'])|\['{re.escape(name)}'\]", text) is not None
+
+    used_base_queries = {name: _strip_comments(text) for name, text in base_queries.items() if is_referenced(name, query_text)}
+    referenced_text = "\n".join([query_text] + list(used_base_queries.values()))
+
+    statements = []
+    for name, value in parameters.items():
+        if not is_referenced(name, referenced_text):
+            continue
+        if isinstance(value, datetime):
+            statements.append(f"let {name} = datetime({value.strftime('%Y-%m-%dT%H:%M:%SZ')});")
+        else:
+            statements.append(f"let {name} = {json.dumps(str(value))};")
+    for name, text in used_base_queries.items():
+        statements.append(f"let {name} = {text};")
+    return "\n".join(statements + [query_text])
+
+
+def extract_query_statistics(response) -> Dict[str, Any]:
+    """Extract the resource consumption statistics Kusto returns with a query.
+
+    Args:
+        response: KustoResponseDataSet returned by KustoClient.execute()
+
+    Returns:
+        Dictionary with cpu_ms, memory_peak_mb, execution_time_ms, extents, rows and cache statistics
+        (keys are missing when the service did not report them, e.g., on the emulator)
+    """
+    stats = {}
+    for table in response.tables:
+        table_kind = getattr(table.table_kind, "value", table.table_kind)
+        if table_kind != "QueryCompletionInformation" and table.table_name != "QueryCompletionInformation":
+            continue
+        for row in table:
+            if row["EventTypeName"] != "QueryResourceConsumption":
+                continue
+            payload = json.loads(row["Payload"]) if isinstance(row["Payload"], str) else row["Payload"]
+            resource_usage = payload.get("resource_usage", {})
+            dataset = payload.get("input_dataset_statistics", {})
+
+            if payload.get("ExecutionTime") is not None:
+                stats["execution_time_ms"] = payload["ExecutionTime"] * 1000
+            cpu_total = resource_usage.get("cpu", {}).get("total cpu")
+            if cpu_total:
+                stats["cpu_ms"] = _parse_timespan_ms(cpu_total)
+            memory_peak = resource_usage.get("memory", {}).get("peak_per_node")
+            if memory_peak is not None:
+                stats["memory_peak_mb"] = memory_peak / (1024 * 1024)
+            extents = dataset.get("extents", {})
+            if "scanned" in extents:
+                stats["extents_scanned"] = extents["scanned"]
+                stats["extents_total"] = extents.get("total")
+            rows = dataset.get("rows", {})
+            if "scanned" in rows:
+                stats["rows_scanned"] = rows["scanned"]
+
+            # Hot shard cache hit/miss bytes, falling back to the older memory cache counters
+            cache = resource_usage.get("cache", {})
+            hot = cache.get("shards", {}).get("hot", {})
+            hits, misses = hot.get("hitbytes"), hot.get("missbytes")
+            if hits is None:
+                hits, misses = cache.get("memory", {}).get("hits"), cache.get("memory", {}).get("misses")
+            if hits is not None:
+                stats["cache_hits"] = hits
+                stats["cache_misses"] = misses or 0
+                total = hits + (misses or 0)
+                stats["cache_hit_ratio"] = hits * 100.0 / total if total else None
+    return stats
+
+
+def run_query(client: KustoClient, database_name: str, query: str, timeout_sec: int) -> Dict[str, Any]:
+    """Run a query once and measure it.
+
+    Returns:
+        Dictionary with duration_ms, rows_returned and the statistics from extract_query_statistics()
+    """
+    properties = ClientRequestProperties()
+    properties.client_request_id = f"KqlBenchmark;{uuid.uuid4()}"
+    properties.set_option(ClientRequestProperties.request_timeout_option_name, timedelta(seconds=timeout_sec))
+
+    started = time.perf_counter()
+    response = client.execute(database_name, query, properties)
+    duration_ms = (time.perf_counter() - started) * 1000
+
+    result = {"duration_ms": duration_ms, "rows_returned": len(response.primary_results[0]) if response.primary_results else 0}
+    result.update(extract_query_statistics(response))
+    return result
+
+
+def _summarize(values: List[float]) -> Optional[Dict[str, float]]:
+    """Summarize iteration values with median, min, max and p95 (nearest rank)."""
+    values = sorted(v for v in values if v is not None)
+    if not values:
+        return None
+    p95_index = max(0, int(round(0.95 * len(values) + 0.5)) - 1)
+    return {
+        "median": statistics.median(values),
+        "min": values[0],
+        "max": values[-1],
+        "p95": values[min(p95_index, len(values) - 1)]
+    }
+
+
+def benchmark_queries(client: KustoClient,
+                      database_name: str,
+                      query_files: List[str],
+                      parameters: Dict[str, Any],
+                      iterations: int = 5,
+                      warmup: int = 1,
+                      timeout_sec: int = 300) -> List[Dict[str, Any]]:
+    """Run every query file the requested number of times and summarize the statistics.
+
+    Args:
+        client: Connected Kusto client
+        database_name: Name of the database to query
+        query_files: KQL files to benchmark
+        parameters: Dashboard parameter values declared for each query
+        iterations: Number of measured runs per query
+        warmup: Number of unmeasured runs per query before measuring
+        timeout_sec: Server timeout per query run
+
+    Returns:
+        One result dictionary per query file with its status, iterations and summary
+    """
+    base_queries = load_base_queries()
+    results = []
+    for file_path in query_files:
+        name = os.path.relpath(file_path, KQL_DIR).replace(os.sep, "/")
+        with open(file_path, "r", encoding="utf-8") as f:
+            query_text = f.read()
+
+        if is_management_script(query_text):
+            print(f"⏭️  Skipping {name} (management commands)")
+            results.append({"query": name, "status": "skipped", "reason": "management commands"})
+            continue
+
+        print(f"⏱️  Benchmarking {name} ({warmup} warmup + {iterations} runs)...")
+        query = build_query(query_text, parameters, base_queries)
+        runs = []
+        try:
+            for _ in range(warmup):
+                run_query(client, database_name, query, timeout_sec)
+            for _ in range(iterations):
+                runs.append(run_query(client, database_name, query, timeout_sec))
+        except Exception as e:
+            print(f"❌ {name} failed: {e}")
+            results.append({"query": name, "status": "failed", "error": str(e), "iterations": runs})
+            continue
+
+        summary = {key: _summarize([run.get(key) for run in runs]) for key, _ in METRICS}
+        results.append({"query": name, "status": "completed", "iterations": runs, "summary": summary})
+        median_duration = summary["duration_ms"]["median"]
+        median_cpu = (summary["cpu_ms"] or {}).get("median")
+        print(f"✅ {name}: median {median_duration:.0f} ms" + (f", CPU {median_cpu:.0f} ms" if median_cpu is not None else ""))
+    return results
+
+
+def _format_value(value: Optional[float]) -> str:
+    if value is None:
+        return "-"
+    if float(value).is_integer():
+        return f"{int(value):,}"
+    return f"{value:,.1f}"
+
+
+def _format_change(current: Optional[float], previous: Optional[float]) -> str:
+    if current is None or not previous:
+        return "-"
+    return f"{(current - previous) * 100.0 / previous:+.0f}%"
+
+
+def build_markdown_report(report: Dict[str, Any], previous_report: Optional[Dict[str, Any]] = None) -> str:
+    """Render a benchmark report as Markdown, with changes against a previous report if given.
+
+    Args:
+        report: Benchmark report as written to JSON
+        previous_report: Optional earlier report to compare medians against
+
+    Returns:
+        Markdown text
+    """
+    run = report["run"]
+    lines = [
+        "# KQL Query Benchmark",
+        "",
+        f"- Cluster: `{run['cluster_uri']}`",
+        f"- Database: `{run['database']}`",
+        f"- Started: {run['started_at']}",
+        f"- Iterations: {run['iterations']} (+{run['warmup']} warmup)",
+        f"- Parameters: " + ", ".join(f"`{k}` = `{v}`" for k, v in run["parameters"].items()),
+        "",
+        "Values are medians over the measured iterations."
+    ]
+    previous = {}
+    if previous_report:
+        previous = {r["query"]: r for r in previous_report.get("results", []) if r.get("status") == "completed"}
+        lines.append(f"Changes are relative to the run started at {previous_report['run']['started_at']}.")
+    lines.append("")
+
+    headers = ["Query"] + [label for _, label in METRICS]
+    if previous:
+        headers += ["Δ Duration", "Δ CPU"]
+    lines.append("| " + " | ".join(headers) + " |")
+    lines.append("|" + "---|" * len(headers))
+
+    for result in report["results"]:
+        if result["status"] != "completed":
+            detail = result.get("reason") or result.get("error", "")
+            lines.append(f"| {result['query']} | {result['status']}: {detail.splitlines()[0] if detail else ''} |" + " |" * (len(headers) - 2))
+            continue
+        medians = {key: (result["summary"].get(key) or {}).get("median") for key, _ in METRICS}
+        cells = [result["query"]] + [_format_value(medians[key]) for key, _ in METRICS]
+        if previous:
+            before = previous.get(result["query"], {}).get("summary", {})
+            cells.append(_format_change(medians["duration_ms"], (before.get("duration_ms") or {}).get("median")))
+            cells.append(_format_change(medians["cpu_ms"], (before.get("cpu_ms") or {}).get("median")))
+        lines.append("| " + " | ".join(cells) + " |")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    """Main function to run the KQL benchmark from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the KQL queries in src/kql against a Fabric KQL database or a local Kusto emulator",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python fabric_kql_benchmark.py --cluster-uri "https://<eventhouse>.kusto.fabric.microsoft.com" --database "rti_kqldb_abc123"
+  python fabric_kql_benchmark.py --cluster-uri "http://localhost:8080" --database "NetDefaultDB" --emulator --iterations 10
+  python fabric_kql_benchmark.py --cluster-uri "..." --database "..." --queries "real_time_dashboard/*.kql" --compare kql_benchmark_results/kql_benchmark_20260101T000000Z.json
+        """
+    )
+    parser.add_argument("--cluster-uri", required=True, help="Query URI of the Fabric Eventhouse or the Kusto emulator")
+    parser.add_argument("--database", required=True, help="Name of the database to query")
+    parser.add_argument("--emulator", action="store_true", help="Connect without authentication to a local Kusto emulator container")
+    parser.add_argument("--queries", nargs="+", help="Glob patterns relative to src/kql (default: all .kql files)")
+    parser.add_argument("--iterations", type=int, default=5, help="Measured runs per query (default: 5)")
+    parser.add_argument("--warmup", type=int, default=1, help="Unmeasured runs per query before measuring (default: 1)")
+    parser.add_argument("--timeout", type=int, default=300, help="Server timeout per query run in seconds (default: 300)")
+    parser.add_argument("--time-range", type=_parse_duration, default=timedelta(days=30), help="Value of _startTime relative to _endTime (default: 30d, like the dashboard)")
+    parser.add_argument("--end-time", help="Value of _endTime as ISO 8601 UTC timestamp (default: now)")
+    parser.add_argument("--asset-filter", default="", help="Value of AssetFilter (default: empty, all assets)")
+    parser.add_argument("--display-mode", default="Show All", help="Value of DisplayMode (default: \"Show All\")")
+    parser.add_argument("--output-dir", default="kql_benchmark_results", help="Directory for the JSON and Markdown reports (default: kql_benchmark_results)")
+    parser.add_argument("--compare", help="Previous JSON report to compare the results against")
+    args = parser.parse_args()
+
+    if args.end_time:
+        end_time = datetime.fromisoformat(args.end_time.replace("Z", "+00:00")).astimezone(timezone.utc)
+    else:
+        end_time = datetime.now(timezone.utc).replace(microsecond=0)
+    parameters = {
+        "_startTime": end_time - args.time_range,
+        "_endTime": end_time,
+        "AssetFilter": args.asset_filter,
+        "DisplayMode": args.display_mode
+    }
+
+    query_files = discover_queries(args.queries)
+    if not query_files:
+        print(f"❌ No KQL files found in {KQL_DIR} for {args.queries}")
+        sys.exit(1)
+
+    previous_report = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            previous_report = json.load(f)
+
+    started_at = datetime.now(timezone.utc)
+    print(f"🔗 Connecting to {args.cluster_uri} ({'emulator' if args.emulator else 'Fabric'})...")
+    client = create_benchmark_client(args.cluster_uri, args.emulator)
+    results = benchmark_queries(client, args.database, query_files, parameters, args.iterations, args.warmup, args.timeout)
+
+    report = {
+        "run": {
+            "cluster_uri": args.cluster_uri,
+            "database": args.database,
+            "emulator": args.emulator,
+            "started_at": started_at.isoformat(timespec="seconds"),
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+            "parameters": {k: v.isoformat() if isinstance(v, datetime) else v for k, v in parameters.items()}
+        },
+        "results": results
+    }
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    report_name = f"kql_benchmark_{started_at.strftime('%Y%m%dT%H%M%SZ')}"
+    json_path = os.path.join(args.output_dir, f"{report_name}.json")
+    markdown_path = os.path.join(args.output_dir, f"{report_name}.md")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    with open(markdown_path, "w", encoding="utf-8") as f:
+        f.write(build_markdown_report(report, previous_report))
+
+    completed = sum(1 for r in results if r["status"] == "completed")
+    failed = sum(1 for r in results if r["status"] == "failed")
+    skipped = sum(1 for r in results if r["status"] == "skipped")
+    print(f"\n✅ Benchmark complete: {completed} completed, {failed} failed, {skipped} skipped")
+    print(f"   JSON report: {json_path}")
+    print(f"   Markdown report: {markdown_path}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
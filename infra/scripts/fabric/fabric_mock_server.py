@@ -0,0 +1,859 @@
+#!/usr/bin/env python3
+"""
+Fabric Mock Server Module
+
+This module provides a local stand-in for the subset of the Microsoft Fabric REST API used by
+FabricApiClient and FabricWorkspaceApiClient, so the deployment scripts can be profiled and
+load-tested on a laptop without Fabric capacity. State is kept in memory and served with the
+standard library HTTP server, so no extra dependencies are needed.
+
+Supported endpoints (relative to /v1):
+    capacities, workspaces, workspaces/{id}/assignToCapacity, workspaces/{id}/roleAssignments,
+    workspaces/{id}/folders, workspaces/{id}/items, workspaces/{id}/{collection} for eventhouses,
+    kqlDatabases, eventstreams, reflexes, kqlDashboards, notebooks, environments, dataagents and
+    lakehouses, getDefinition/updateDefinition, environments/{id}/staging/publish, notebook job
+    instances and their cancellation, connections and operations/{id}[/result]
+
+Fabric behavior that is simulated:
+    - Long-running operations: 202 with Location, x-ms-operation-id and Retry-After headers,
+      polled through operations/{id} until they succeed (or fail, when injected)
+    - Throttling: 429 with Retry-After, randomly and/or above a requests-per-second limit
+    - Pagination: continuationToken/continuationUri on every list endpoint
+    - Latency: fixed delay plus random jitter on every request
+    - Error injection: random 5xx responses, optionally limited to matching routes
+
+Usage:
+    # Serve on http://127.0.0.1:8765/v1 and point the deployment scripts at it
+    python fabric_mock_server.py --port 8765 --latency 0.2 --jitter 0.1 --throttle-rate 0.05
+
+    # Run a deployment script in-process against a fresh mock server
+    python fabric_mock_server.py --latency 0.2 --run deploy_fabric_rti.py
+
+    from fabric_mock_server import MockFabricConfig, start_mock_server
+    server = start_mock_server(MockFabricConfig(latency_sec=0.1))
+    client = FabricApiClient(api_url=server.api_url, credential=StaticTokenCredential())
+
+    GET  /_mock/stats - request counts, status codes and latency per route
+    POST /_mock/reset - drop all state and statistics
+
+Environment Variables (set by --run, or by hand when serving):
+    FABRIC_API_URL - Base URL of the Fabric REST API used by FabricApiClient
+"""
+
+import argparse
+import base64
+import json
+import os
+import random
+import re
+import runpy
+import sys
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+from fabric_token_cache import StaticTokenCredential, set_shared_credential
+
+# Workspace item collections and the item type they hold ("items" holds every type)
+ITEM_COLLECTIONS = {
+    "items": None,
+    "eventhouses": "Eventhouse",
+    "kqlDatabases": "KQLDatabase",
+    "eventstreams": "Eventstream",
+    "reflexes": "Reflex",
+    "kqlDashboards": "KQLDashboard",
+    "notebooks": "Notebook",
+    "environments": "Environment",
+    "dataagents": "DataAgent",
+    "lakehouses": "Lakehouse",
+}
+
+# Item types whose creation runs as a long-running operation in Fabric
+LRO_ITEM_TYPES = {"Eventstream", "Notebook"}
+
+GUID_PATTERN = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+
+
+@dataclass
+class MockFabricConfig:
+    """Behavior of the mock Fabric server.
+
+    Attributes:
+        latency_sec: Fixed delay added to every request
+        jitter_sec: Maximum random delay added on top of latency_sec
+        lro_duration_sec: Time a long-running operation stays running
+        job_duration_sec: Time a notebook job instance stays in progress
+        retry_after_sec: Retry-After header sent with 202 and 429 responses
+        page_size: Maximum number of items per page of a list endpoint
+        throttle_rate: Fraction of requests randomly rejected with 429
+        max_requests_per_sec: Requests per second above which requests get 429 (0 disables)
+        error_rate: Fraction of requests randomly failed with error_status
+        error_status: HTTP status of injected errors
+        error_pattern: Optional regex on "METHOD /path" limiting throttling and error injection
+        lro_failure_rate: Fraction of long-running operations and jobs that end as Failed
+        capacities: Display names of the capacities the mock exposes
+        kusto_uri: Query service URI reported for eventhouses and KQL databases
+        seed: Optional random seed for reproducible runs
+    """
+
+    latency_sec: float = 0.0
+    jitter_sec: float = 0.0
+    lro_duration_sec: float = 2.0
+    job_duration_sec: float = 5.0
+    retry_after_sec: int = 1
+    page_size: int = 100
+    throttle_rate: float = 0.0
+    max_requests_per_sec: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+    error_pattern: Optional[str] = None
+    lro_failure_rate: float = 0.0
+    capacities: List[str] = field(default_factory=lambda: ["mock-capacity"])
+    kusto_uri: str = "http://localhost:8080"
+    seed: Optional[int] = None
+
+
+class MockApiError(Exception):
+    """Error response of the mock server, in the Fabric error format."""
+
+    def __init__(self, status: int, error_code: str, message: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(message)
+        self.status = status
+        self.error_code = error_code
+        self.message = message
+        self.headers = headers or {}
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+class MockFabricState:
+    """In-memory Fabric tenant: capacities, workspaces, items, connections and operations."""
+
+    def __init__(self, config: MockFabricConfig):
+        self.config = config
+        self.lock = threading.RLock()
+        self.capacities = [
+            {"id": str(uuid.uuid4()), "displayName": name, "sku": "F2", "region": "Local", "state": "Active"}
+            for name in config.capacities
+        ]
+        self.workspaces: Dict[str, Dict[str, Any]] = {}
+        self.role_assignments: Dict[str, List[Dict[str, Any]]] = {}
+        self.folders: Dict[str, Dict[str, Any]] = {}
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self.definitions: Dict[str, Dict[str, Any]] = {}
+        self.connections: Dict[str, Dict[str, Any]] = {}
+        self.operations: Dict[str, Dict[str, Any]] = {}
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+
+    # Long-running operations
+    def start_operation(self, on_success: Callable[[], Any]) -> str:
+        """Register a long-running operation that runs on_success once it completes."""
+        operation_id = str(uuid.uuid4())
+        self.operations[operation_id] = {
+            "id": operation_id,
+            "status": "Running",
+            "createdTimeUtc": _utc_now(),
+            "lastUpdatedTimeUtc": _utc_now(),
+            "percentComplete": 0,
+            "started_at": time.time(),
+            "fail": random.random() < self.config.lro_failure_rate,
+            "on_success": on_success,
+            "result": None,
+        }
+        return operation_id
+
+    def get_operation(self, operation_id: str) -> Dict[str, Any]:
+        """Get an operation, completing it once its duration has elapsed."""
+        operation = self.operations.get(operation_id)
+        if not operation:
+            raise MockApiError(404, "OperationNotFound", f"Operation {operation_id} not found")
+        if operation["status"] == "Running" and time.time() - operation["started_at"] >= self.config.lro_duration_sec:
+            if operation["fail"]:
+                operation["status"] = "Failed"
+                operation["error"] = {"errorCode": "InjectedFailure", "message": "Operation failed (injected by the mock server)"}
+            else:
+                try:
+                    operation["result"] = operation["on_success"]()
+                    operation["status"] = "Succeeded"
+                except MockApiError as e:
+                    operation["status"] = "Failed"
+                    operation["error"] = {"errorCode": e.error_code, "message": e.message}
+            operation["percentComplete"] = 100
+            operation["lastUpdatedTimeUtc"] = _utc_now()
+        return operation
+
+    # Workspaces
+    def get_workspace(self, workspace_id: str) -> Dict[str, Any]:
+        workspace = self.workspaces.get(workspace_id)
+        if not workspace:
+            raise MockApiError(404, "WorkspaceNotFound", f"Workspace {workspace_id} not found")
+        return workspace
+
+    def create_workspace(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        name = body.get("displayName")
+        if not name:
+            raise MockApiError(400, "InvalidInput", "displayName is required")
+        if any(w["displayName"].lower() == name.lower() for w in self.workspaces.values()):
+            raise MockApiError(409, "WorkspaceNameAlreadyExists", f"Workspace '{name}' already exists")
+        workspace = {
+            "id": str(uuid.uuid4()),
+            "displayName": name,
+            "description": body.get("description", ""),
+            "type": "Workspace",
+        }
+        if body.get("capacityId"):
+            workspace["capacityId"] = body["capacityId"]
+        self.workspaces[workspace["id"]] = workspace
+        self.role_assignments[workspace["id"]] = []
+        return workspace
+
+    def delete_workspace(self, workspace_id: str) -> None:
+        self.get_workspace(workspace_id)
+        del self.workspaces[workspace_id]
+        self.role_assignments.pop(workspace_id, None)
+        for folder_id in [f["id"] for f in self.folders.values() if f["workspaceId"] == workspace_id]:
+            del self.folders[folder_id]
+        for item_id in [i["id"] for i in self.items.values() if i["workspaceId"] == workspace_id]:
+            self.items.pop(item_id, None)
+            self.definitions.pop(item_id, None)
+
+    # Items
+    def list_items(self, workspace_id: str, item_type: Optional[str]) -> List[Dict[str, Any]]:
+        self.get_workspace(workspace_id)
+        return [
+            item for item in self.items.values()
+            if item["workspaceId"] == workspace_id and (item_type is None or item["type"] == item_type)
+        ]
+
+    def get_item(self, workspace_id: str, item_id: str, item_type: Optional[str] = None) -> Dict[str, Any]:
+        item = self.items.get(item_id)
+        if not item or item["workspaceId"] != workspace_id or (item_type and item["type"] != item_type):
+            raise MockApiError(404, "ItemNotFound", f"Item {item_id} not found")
+        return item
+
+    def create_item(self, workspace_id: str, item_type: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        name = body.get("displayName")
+        if not name:
+            raise MockApiError(400, "InvalidInput", "displayName is required")
+        folder_id = body.get("folderId")
+        if any(i["type"] == item_type and i["displayName"] == name and i.get("folderId") == folder_id
+               for i in self.list_items(workspace_id, None)):
+            raise MockApiError(409, "ItemDisplayNameAlreadyInUse", f"Requested '{name}' is already in use")
+        item = {
+            "id": str(uuid.uuid4()),
+            "type": item_type,
+            "displayName": name,
+            "description": body.get("description", ""),
+            "workspaceId": workspace_id,
+        }
+        if folder_id:
+            item["folderId"] = folder_id
+        self.items[item["id"]] = item
+        if body.get("definition"):
+            self.definitions[item["id"]] = body["definition"]
+
+        if item_type == "Eventhouse":
+            # Every eventhouse comes with a default KQL database of the same name
+            database = self.create_item(workspace_id, "KQLDatabase", {"displayName": name, "folderId": folder_id})
+            database["properties"]["parentEventhouseItemId"] = item["id"]
+            item["properties"] = {
+                "queryServiceUri": self.config.kusto_uri,
+                "ingestionServiceUri": self.config.kusto_uri,
+                "databasesItemIds": [database["id"]],
+            }
+        elif item_type == "KQLDatabase":
+            creation_payload = body.get("creationPayload") or {}
+            item["properties"] = {
+                "parentEventhouseItemId": creation_payload.get("parentEventhouseItemId"),
+                "queryServiceUri": self.config.kusto_uri,
+                "ingestionServiceUri": self.config.kusto_uri,
+                "databaseType": creation_payload.get("databaseType", "ReadWrite"),
+            }
+        return item
+
+    def delete_item(self, workspace_id: str, item_id: str, item_type: Optional[str] = None) -> None:
+        item = self.get_item(workspace_id, item_id, item_type)
+        if item["type"] == "Eventhouse":
+            for database_id in item.get("properties", {}).get("databasesItemIds", []):
+                self.items.pop(database_id, None)
+                self.definitions.pop(database_id, None)
+        del self.items[item_id]
+        self.definitions.pop(item_id, None)
+
+    # Notebook jobs
+    def start_job(self, workspace_id: str, item_id: str, job_type: str) -> Dict[str, Any]:
+        self.get_item(workspace_id, item_id)
+        job = {
+            "id": str(uuid.uuid4()),
+            "itemId": item_id,
+            "jobType": job_type,
+            "invokeType": "Manual",
+            "status": "NotStarted",
+            "failureReason": None,
+            "startTimeUtc": _utc_now(),
+            "endTimeUtc": None,
+            "started_at": time.time(),
+            "fail": random.random() < self.config.lro_failure_rate,
+        }
+        self.jobs[job["id"]] = job
+        return job
+
+    def get_job(self, item_id: str, job_id: str) -> Dict[str, Any]:
+        job = self.jobs.get(job_id)
+        if not job or job["itemId"] != item_id:
+            raise MockApiError(404, "JobInstanceNotFound", f"Job instance {job_id} not found")
+        elapsed = time.time() - job["started_at"]
+        if job["status"] in ("NotStarted", "InProgress"):
+            if elapsed >= self.config.job_duration_sec:
+                job["status"] = "Failed" if job["fail"] else "Completed"
+                job["endTimeUtc"] = _utc_now()
+                if job["fail"]:
+                    job["failureReason"] = {"errorCode": "InjectedFailure", "message": "Job failed (injected by the mock server)"}
+            elif elapsed > 0:
+                job["status"] = "InProgress"
+        return job
+
+
+class MockFabricRequestHandler(BaseHTTPRequestHandler):
+    """HTTP request handler routing Fabric REST API calls to the MockFabricState."""
+
+    server_version = "FabricMock/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args) -> None:
+        # Request logging would dominate the output of the deployment scripts
+        pass
+
+    def do_GET(self) -> None:
+        self._handle("GET")
+
+    def do_POST(self) -> None:
+        self._handle("POST")
+
+    def do_PATCH(self) -> None:
+        self._handle("PATCH")
+
+    def do_PUT(self) -> None:
+        self._handle("PUT")
+
+    def do_DELETE(self) -> None:
+        self._handle("DELETE")
+
+    def _read_body(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        raw = self.rfile.read(length)
+        try:
+            return json.loads(raw.decode("utf-8"))
+        except (ValueError, UnicodeDecodeError):
+            raise MockApiError(400, "InvalidRequest", "Request body is not valid JSON")
+
+    def _send(self, status: int, body: Optional[Any] = None, headers: Optional[Dict[str, str]] = None) -> None:
+        payload = json.dumps(body).encode("utf-8") if body is not None else b""
+        self.send_response(status)
+        self.send_header("requestId", str(uuid.uuid4()))
+        if payload:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if payload:
+            self.wfile.write(payload)
+
+    def _handle(self, method: str) -> None:
+        server: MockFabricServer = self.server
+        started = time.time()
+        parsed = urlparse(self.path)
+        path = parsed.path.rstrip("/")
+        query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        status = 500
+        try:
+            body = self._read_body()
+            if path.startswith("/_mock/"):
+                status, response, headers = server.handle_control(method, path)
+            else:
+                server.simulate_latency()
+                server.check_faults(method, path)
+                status, response, headers = server.route(method, path, query, body)
+        except MockApiError as e:
+            status, headers = e.status, e.headers
+            response = {"requestId": str(uuid.uuid4()), "errorCode": e.error_code, "message": e.message}
+        except Exception as e:
+            status, headers = 500, {}
+            response = {"requestId": str(uuid.uuid4()), "errorCode": "InternalError", "message": str(e)}
+        self._send(status, response, headers)
+        if not path.startswith("/_mock/"):
+            server.record(method, path, status, time.time() - started)
+
+
+class MockFabricServer(ThreadingHTTPServer):
+    """Threaded HTTP server implementing the mock Fabric REST API."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], config: Optional[MockFabricConfig] = None):
+        super().__init__(address, MockFabricRequestHandler)
+        self.config = config or MockFabricConfig()
+        self.random = random.Random(self.config.seed)
+        self.state = MockFabricState(self.config)
+        self.stats_lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, Any]] = {}
+        self.recent_requests: List[float] = []
+        self.error_pattern = re.compile(self.config.error_pattern) if self.config.error_pattern else None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_url(self) -> str:
+        return f"{self.base_url}/v1"
+
+    # Simulated network behavior
+    def simulate_latency(self) -> None:
+        delay = self.config.latency_sec + self.random.uniform(0, self.config.jitter_sec)
+        if delay > 0:
+            time.sleep(delay)
+
+    def check_faults(self, method: str, path: str) -> None:
+        """Reject the request with 429 or an injected error, as configured."""
+        retry_after = {"Retry-After": str(self.config.retry_after_sec)}
+        if self.config.max_requests_per_sec > 0:
+            with self.stats_lock:
+                now = time.time()
+                self.recent_requests = [t for t in self.recent_requests if now - t < 1.0]
+                over_limit = len(self.recent_requests) >= self.config.max_requests_per_sec
+                if not over_limit:
+                    self.recent_requests.append(now)
+            if over_limit:
+                raise MockApiError(429, "RequestBlocked", "Request is blocked by the upstream service until the Retry-After time", retry_after)
+
+        if self.error_pattern and not self.error_pattern.search(f"{method} {path}"):
+            return
+        if self.random.random() < self.config.throttle_rate:
+            raise MockApiError(429, "RequestBlocked", "Request is blocked by the upstream service until the Retry-After time", retry_after)
+        if self.random.random() < self.config.error_rate:
+            raise MockApiError(self.config.error_status, "InjectedError", "Request failed (injected by the mock server)")
+
+    # Statistics
+    def record(self, method: str, path: str, status: int, elapsed_sec: float) -> None:
+        route = f"{method} {GUID_PATTERN.sub('{id}', path)}"
+        with self.stats_lock:
+            entry = self.stats.setdefault(route, {"count": 0, "statuses": {}, "total_sec": 0.0, "max_sec": 0.0})
+            entry["count"] += 1
+            entry["statuses"][str(status)] = entry["statuses"].get(str(status), 0) + 1
+            entry["total_sec"] += elapsed_sec
+            entry["max_sec"] = max(entry["max_sec"], elapsed_sec)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self.stats_lock:
+            routes = {route: dict(entry, statuses=dict(entry["statuses"])) for route, entry in self.stats.items()}
+        statuses: Dict[str, int] = {}
+        for entry in routes.values():
+            for status, count in entry["statuses"].items():
+                statuses[status] = statuses.get(status, 0) + count
+        return {
+            "total_requests": sum(entry["count"] for entry in routes.values()),
+            "statuses": statuses,
+            "routes": routes,
+        }
+
+    def reset(self) -> None:
+        with self.state.lock:
+            self.state = MockFabricState(self.config)
+        with self.stats_lock:
+            self.stats = {}
+            self.recent_requests = []
+
+    def handle_control(self, method: str, path: str) -> Tuple[int, Any, Dict[str, str]]:
+        if method == "GET" and path == "/_mock/stats":
+            return 200, self.get_stats(), {}
+        if method == "POST" and path == "/_mock/reset":
+            self.reset()
+            return 200, {"reset": True}, {}
+        raise MockApiError(404, "UnknownRoute", f"No mock control endpoint {method} {path}")
+
+    # Responses
+    def page(self, items: List[Dict[str, Any]], path: str, query: Dict[str, str]) -> Tuple[int, Any, Dict[str, str]]:
+        """Return one page of a list, with a continuation token when more items exist."""
+        offset = 0
+        token = query.get("continuationToken")
+        if token:
+            try:
+                offset = int(base64.urlsafe_b64decode(token.encode()).decode())
+            except ValueError:
+                raise MockApiError(400, "InvalidContinuationToken", "The continuation token is not valid")
+        end = offset + self.config.page_size
+        response: Dict[str, Any] = {"value": items[offset:end]}
+        if end < len(items):
+            next_token = base64.urlsafe_b64encode(str(end).encode()).decode()
+            response["continuationToken"] = next_token
+            response["continuationUri"] = f"{self.api_url}{path[3:]}?continuationToken={next_token}"
+        return 200, response, {}
+
+    def accepted(self, operation_id: str) -> Tuple[int, Any, Dict[str, str]]:
+        return 202, None, {
+            "Location": f"{self.api_url}/operations/{operation_id}",
+            "x-ms-operation-id": operation_id,
+            "Retry-After": str(self.config.retry_after_sec),
+        }
+
+    # Routing
+    def route(self, method: str, path: str, query: Dict[str, str], body: Dict[str, Any]) -> Tuple[int, Any, Dict[str, str]]:
+        """Dispatch a request under /v1 to the matching Fabric API handler."""
+        if not path.startswith("/v1/"):
+            raise MockApiError(404, "UnknownRoute", f"No mock endpoint for {method} {path}")
+        parts = path[len("/v1/"):].split("/")
+        state = self.state
+        with state.lock:
+            if parts[0] == "capacities" and len(parts) == 1 and method == "GET":
+                return self.page(state.capacities, path, query)
+            if parts[0] == "operations" and len(parts) in (2, 3) and method == "GET":
+                return self._route_operation(parts)
+            if parts[0] == "connections":
+                return self._route_connections(method, path, parts, query, body)
+            if parts[0] == "workspaces":
+                return self._route_workspaces(method, path, parts, query, body)
+        raise MockApiError(404, "UnknownRoute", f"No mock endpoint for {method} {path}")
+
+    def _route_operation(self, parts: List[str]) -> Tuple[int, Any, Dict[str, str]]:
+        operation = self.state.get_operation(parts[1])
+        if len(parts) == 3:
+            if parts[2] != "result" or operation["status"] != "Succeeded":
+                raise MockApiError(400, "OperationHasNoResult", f"Operation {parts[1]} has no result")
+            return 200, operation["result"] or {}, {}
+        # Operation state carries no id, so clients look created items up by name as with Fabric
+        response = {key: value for key, value in operation.items() if key not in ("id", "started_at", "fail", "on_success", "result")}
+        headers = {"Retry-After": str(self.config.retry_after_sec)} if operation["status"] == "Running" else {}
+        if operation["status"] == "Succeeded":
+            headers["Location"] = f"{self.api_url}/operations/{operation['id']}/result"
+        return 200, response, headers
+
+    def _route_connections(self, method: str, path: str, parts: List[str], query: Dict[str, str], body: Dict[str, Any]) -> Tuple[int, Any, Dict[str, str]]:
+        connections = self.state.connections
+        if len(parts) == 1:
+            if method == "GET":
+                return self.page(list(connections.values()), path, query)
+            if method == "POST":
+                name = body.get("displayName")
+                if any(c["displayName"] == name for c in connections.values()):
+                    raise MockApiError(409, "DuplicateConnectionName", f"Connection '{name}' already exists")
+                connection = {
+                    "id": str(uuid.uuid4()),
+                    "displayName": name,
+                    "connectivityType": body.get("connectivityType"),
+                    "connectionDetails": body.get("connectionDetails", {}),
+                    "privacyLevel": "Organizational",
+                    "credentialDetails": {"credentialType": (body.get("credentialDetails") or {}).get("credentials", {}).get("credentialType")},
+                }
+                connections[connection["id"]] = connection
+                return 201, connection, {}
+        elif len(parts) == 2 and parts[1] == "supportedConnectionTypes" and method == "GET":
+            return self.page([{"type": "EventHub", "creationMethods": [{"name": "EventHub.Contents"}]}], path, query)
+        elif len(parts) == 2:
+            connection = connections.get(parts[1])
+            if not connection:
+                raise MockApiError(404, "ConnectionNotFound", f"Connection {parts[1]} not found")
+            if method == "GET":
+                return 200, connection, {}
+            if method == "PATCH":
+                for key in ("displayName", "connectivityType"):
+                    if key in body:
+                        connection[key] = body[key]
+                return 200, connection, {}
+            if method == "DELETE":
+                del connections[parts[1]]
+                return 200, None, {}
+        raise MockApiError(404, "UnknownRoute", f"No mock endpoint for {method} {path}")
+
+    def _route_workspaces(self, method: str, path: str, parts: List[str], query: Dict[str, str], body: Dict[str, Any]) -> Tuple[int, Any, Dict[str, str]]:
+        state = self.state
+        if len(parts) == 1:
+            if method == "GET":
+                return self.page(list(state.workspaces.values()), path, query)
+            if method == "POST":
+                return 201, state.create_workspace(body), {}
+            raise MockApiError(404, "UnknownRoute", f"No mock endpoint for {method} {path}")
+
+        workspace_id = parts[1]
+        workspace = state.get_workspace(workspace_id)
+        if len(parts) == 2:
+            if method == "GET":
+                return 200, workspace, {}
+            if method == "DELETE":
+                state.delete_workspace(workspace_id)
+                return 200, None, {}
+            raise MockApiError(404, "UnknownRoute", f"No mock endpoint for {method} {path}")
+
+        resource = parts[2]
+        if resource == "assignToCapacity" and method == "POST":
+            capacity_id = body.get("capacityId")
+            if not any(c["id"] == capacity_id for c in state.capacities):
+                raise MockApiError(404, "CapacityNotFound", f"Capacity {capacity_id} not found")
+
+            def assign():
+                workspace["capacityId"] = capacity_id
+            return self.accepted(state.start_operation(assign))
+        if resource == "roleAssignments":
+            return self._route_role_assignments(method, path, workspace_id, parts, query, body)
+        if resource == "folders":
+            return self._route_folders(method, path, workspace_id, parts, query, body)
+        if resource in ITEM_COLLECTIONS:
+            return self._route_items(method, path, workspace_id, parts, query, body)
+        raise MockApiError(404, "UnknownRoute", f"No mock endpoint for {method} {path}")
+
+    def _route_role_assignments(self, method: str, path: str, workspace_id: str, parts: List[str], query: Dict[str, str], body: Dict[str, Any]) -> Tuple[int, Any, Dict[str, str]]:
+        assignments = self.state.role_assignments.setdefault(workspace_id, [])
+        if len(parts) == 3:
+            if method == "GET":
+                return self.page(assignments, path, query)
+            if method == "POST":
+                principal = body.get("principal") or {}
+                if any(a["principal"].get("id") == principal.get("id") for a in assignments):
+                    raise MockApiError(409, "PrincipalAlreadyHasWorkspaceRolePermissions", f"Principal {principal.get('id')} already has a role")
+                assignment = {"id": principal.get("id"), "principal": principal, "role": body.get("role")}
+                assignments.append(assignment)
+                return 201, assignment, {}
+        elif len(parts) == 4:
+            assignment = next((a for a in assignments if a["id"] == parts[3]), None)
+            if not assignment:
+                raise MockApiError(404, "WorkspaceRoleAssignmentNotFound", f"Role assignment {parts[3]} not found")
+            if method == "GET":
+                return 200, assignment, {}
+            if method == "PATCH":
+                assignment["role"] = body.get("role", assignment["role"])
+                return 200, assignment, {}
+            if method == "DELETE":
+                assignments.remove(assignment)
+                return 200, None, {}
+        raise MockApiError(404, "UnknownRoute", f"No mock endpoint for {method} {path}")
+
+    def _route_folders(self, method: str, path: str, workspace_id: str, parts: List[str], query: Dict[str, str], body: Dict[str, Any]) -> Tuple[int, Any, Dict[str, str]]:
+        folders = self.state.folders
+        if len(parts) == 3:
+            if method == "GET":
+                return self.page([f for f in folders.values() if f["workspaceId"] == workspace_id], path, query)
+            if method == "POST":
+                name = body.get("displayName")
+                parent_id = body.get("parentFolderId")
+                if any(f["workspaceId"] == workspace_id and f["displayName"] == name and f.get("parentFolderId") == parent_id
+                       for f in folders.values()):
+                    raise MockApiError(409, "FolderDisplayNameAlreadyInUse", f"Folder '{name}' already exists")
+                folder = {"id": str(uuid.uuid4()), "displayName": name, "workspaceId": workspace_id}
+                if parent_id:
+                    folder["parentFolderId"] = parent_id
+                folders[folder["id"]] = folder
+                return 201, folder, {}
+        elif len(parts) == 4:
+            folder = folders.get(parts[3])
+            if not folder or folder["workspaceId"] != workspace_id:
+                raise MockApiError(404, "FolderNotFound", f"Folder {parts[3]} not found")
+            if method == "GET":
+                return 200, folder, {}
+            if method == "DELETE":
+                del folders[parts[3]]
+                return 200, None, {}
+        raise MockApiError(404, "UnknownRoute", f"No mock endpoint for {method} {path}")
+
+    def _route_items(self, method: str, path: str, workspace_id: str, parts: List[str], query: Dict[str, str], body: Dict[str, Any]) -> Tuple[int, Any, Dict[str, str]]:
+        state = self.state
+        collection_type = ITEM_COLLECTIONS[parts[2]]
+
+        if len(parts) == 3:
+            if method == "GET":
+                item_type = collection_type or query.get("type")
+                return self.page(state.list_items(workspace_id, item_type), path, query)
+            if method == "POST":
+                item_type = collection_type or body.get("type")
+                if not item_type:
+                    raise MockApiError(400, "InvalidInput", "type is required")
+                if item_type in LRO_ITEM_TYPES:
+                    # Validate before accepting, as Fabric does for duplicate names
+                    if any(i["type"] == item_type and i["displayName"] == body.get("displayName") and i.get("folderId") == body.get("folderId")
+                           for i in state.list_items(workspace_id, None)):
+                        raise MockApiError(409, "ItemDisplayNameAlreadyInUse", f"Requested '{body.get('displayName')}' is already in use")
+                    return self.accepted(state.start_operation(lambda: state.create_item(workspace_id, item_type, body)))
+                return 201, state.create_item(workspace_id, item_type, body), {}
+            raise MockApiError(404, "UnknownRoute", f"No mock endpoint for {method} {path}")
+
+        item_id = parts[3]
+        item = state.get_item(workspace_id, item_id, collection_type)
+        if len(parts) == 4:
+            if method == "GET":
+                return 200, item, {}
+            if method == "PATCH":
+                for key in ("displayName", "description"):
+                    if key in body:
+                        item[key] = body[key]
+                return 200, item, {}
+            if method == "DELETE":
+                state.delete_item(workspace_id, item_id, collection_type)
+                return 200, None, {}
+
+        action = "/".join(parts[4:])
+        if action == "getDefinition" and method == "POST":
+            def get_definition():
+                return {"definition": state.definitions.get(item_id, {"parts": []})}
+            return self.accepted(state.start_operation(get_definition))
+        if action == "updateDefinition" and method == "POST":
+            definition = body.get("definition") or {}
+
+            def update_definition():
+                state.definitions[item_id] = definition
+            return self.accepted(state.start_operation(update_definition))
+        if action == "staging/publish" and method == "POST" and item["type"] == "Environment":
+            def publish():
+                item.setdefault("properties", {})["publishDetails"] = {"state": "Success", "endTime": _utc_now()}
+                return {"publishDetails": item["properties"]["publishDetails"]}
+            return self.accepted(state.start_operation(publish))
+
+        job_match = re.fullmatch(r"jobs/([^/]+)/instances", action)
+        if job_match and method == "POST":
+            job = state.start_job(workspace_id, item_id, job_match.group(1))
+            location = f"{self.api_url}/workspaces/{workspace_id}/items/{item_id}/jobs/instances/{job['id']}"
+            return 202, None, {"Location": location, "Retry-After": str(self.config.retry_after_sec)}
+        job_match = re.fullmatch(r"jobs/instances/([^/]+)", action)
+        if job_match and method == "GET":
+            job = state.get_job(item_id, job_match.group(1))
+            response = {key: value for key, value in job.items() if key not in ("started_at", "fail")}
+            headers = {"Retry-After": str(self.config.retry_after_sec)} if job["status"] in ("NotStarted", "InProgress") else {}
+            return 200, response, headers
+        job_match = re.fullmatch(r"jobs/instances/([^/]+)/cancel", action)
+        if job_match and method == "POST":
+            job = state.get_job(item_id, job_match.group(1))
+            if job["status"] in ("NotStarted", "InProgress"):
+                job["status"] = "Cancelled"
+                job["endTimeUtc"] = _utc_now()
+            location = f"{self.api_url}/workspaces/{workspace_id}/items/{item_id}/jobs/instances/{job['id']}"
+            return 202, None, {"Location": location}
+        raise MockApiError(404, "UnknownRoute", f"No mock endpoint for {method} {path}")
+
+
+def start_mock_server(config: Optional[MockFabricConfig] = None, host: str = "127.0.0.1", port: int = 0) -> MockFabricServer:
+    """Start a mock Fabric server in a background thread.
+
+    Args:
+        config: Behavior of the mock server (defaults to no latency and no faults)
+        host: Interface to listen on
+        port: Port to listen on (0 picks a free port)
+
+    Returns:
+        Running MockFabricServer; its api_url is the base URL to give FabricApiClient
+    """
+    server = MockFabricServer((host, port), config)
+    thread = threading.Thread(target=server.serve_forever, name="fabric-mock-server", daemon=True)
+    thread.start()
+    return server
+
+
+def print_stats(stats: Dict[str, Any]) -> None:
+    """Print the request statistics of a mock server run."""
+    print(f"\n📊 Mock Fabric API statistics: {stats['total_requests']} request(s)")
+    print(f"   Status codes: {', '.join(f'{status}: {count}' for status, count in sorted(stats['statuses'].items())) or 'none'}")
+    for route, entry in sorted(stats["routes"].items(), key=lambda r: -r[1]["total_sec"]):
+        average_ms = entry["total_sec"] / entry["count"] * 1000
+        print(f"   {entry['count']:>5}  {average_ms:>8.1f} ms avg  {entry['max_sec'] * 1000:>8.1f} ms max  {route}")
+
+
+def main():
+    """Main function to serve the mock Fabric API or run a script against it."""
+    parser = argparse.ArgumentParser(
+        description="Local stand-in for the Microsoft Fabric REST API used by the deployment scripts",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python fabric_mock_server.py --port 8765 --latency 0.2 --jitter 0.1
+  python fabric_mock_server.py --throttle-rate 0.1 --error-rate 0.02 --error-pattern "POST .*/items" --run deploy_fabric_rti.py
+  python fabric_mock_server.py --max-requests-per-sec 5 --page-size 2 --capacity my-capacity --run deploy_fabric_rti.py
+        """
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765, 0 picks a free port)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Fixed delay per request in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Maximum random delay added per request in seconds")
+    parser.add_argument("--lro-duration", type=float, default=2.0, help="Seconds a long-running operation stays running (default: 2)")
+    parser.add_argument("--job-duration", type=float, default=5.0, help="Seconds a notebook job stays in progress (default: 5)")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 202 and 429 responses (default: 1)")
+    parser.add_argument("--page-size", type=int, default=100, help="Items per page of list endpoints (default: 100)")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests rejected with 429")
+    parser.add_argument("--max-requests-per-sec", type=float, default=0.0, help="Request rate above which requests get 429 (default: unlimited)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests failed with --error-status")
+    parser.add_argument("--error-status", type=int, default=500, help="HTTP status of injected errors (default: 500)")
+    parser.add_argument("--error-pattern", help="Regex on 'METHOD /v1/path' limiting throttling and error injection")
+    parser.add_argument("--lro-failure-rate", type=float, default=0.0, help="Fraction of long-running operations and jobs that fail")
+    parser.add_argument("--capacity", action="append", help="Capacity display name to expose (repeatable, default: mock-capacity)")
+    parser.add_argument("--kusto-uri", default="http://localhost:8080", help="Query service URI reported for eventhouses (e.g. a Kusto emulator)")
+    parser.add_argument("--seed", type=int, help="Random seed for reproducible latency and fault injection")
+    parser.add_argument("--run", nargs=argparse.REMAINDER, help="Script (and arguments) to run in-process against the mock server")
+    args = parser.parse_args()
+
+    config = MockFabricConfig(
+        latency_sec=args.latency,
+        jitter_sec=args.jitter,
+        lro_duration_sec=args.lro_duration,
+        job_duration_sec=args.job_duration,
+        retry_after_sec=args.retry_after,
+        page_size=args.page_size,
+        throttle_rate=args.throttle_rate,
+        max_requests_per_sec=args.max_requests_per_sec,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        error_pattern=args.error_pattern,
+        lro_failure_rate=args.lro_failure_rate,
+        capacities=args.capacity or ["mock-capacity"],
+        kusto_uri=args.kusto_uri,
+        seed=args.seed,
+    )
+    if args.seed is not None:
+        random.seed(args.seed)
+    server = start_mock_server(config, host=args.host, port=args.port)
+    print(f"🧪 Mock Fabric API listening on {server.api_url}")
+    print(f"   Capacities: {', '.join(config.capacities)}")
+
+    if not args.run:
+        print(f"   Set FABRIC_API_URL={server.api_url} to point the deployment scripts at it")
+        print(f"   Press Ctrl+C to stop")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.shutdown()
+            print_stats(server.get_stats())
+        return
+
+    script_path = os.path.abspath(args.run[0])
+    os.environ["FABRIC_API_URL"] = server.api_url
+    set_shared_credential(StaticTokenCredential())
+    sys.argv = args.run
+    sys.path.insert(0, os.path.dirname(script_path))
+
+    print(f"🚀 Running {' '.join(args.run)}")
+    started = time.time()
+    exit_code = 0
+    try:
+        runpy.run_path(script_path, run_name="__main__")
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except BaseException:
+        exit_code = 1
+        raise
+    finally:
+        server.shutdown()
+        print_stats(server.get_stats())
+        print(f"   Script finished in {time.time() - started:.1f}s with exit code {exit_code}")
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,517 @@
+#!/usr/bin/env python3
+"""
+Fabric OneLake Backfill Module
+
+This module loads large event histories into the Eventhouse through OneLake, instead of the queued
+ingestion of a single local CSV file used by fabric_data_ingester.py. The events CSV is read in
+chunks and written as Parquet files partitioned by day, the files are uploaded to the Files area
+of a lakehouse with parallel chunked uploads, and the Eventhouse then either:
+
+- ingests them ("ingest" mode) with `.ingest async` commands of several files each, which Kusto
+  runs in parallel and which are tracked together until they complete. Ingested files are
+  tagged with ingest-by tags and skipped by later runs, or
+- exposes them as an external table partitioned by day ("external-table" mode), so the history
+  can be queried with external_table() without being ingested at all.
+
+Backfills are resumable: Parquet files are named by a hash of their rows, files that already exist
+in OneLake with the same size are not uploaded again and files already ingested are not ingested
+again, so a backfill that stopped halfway can simply be run again. Files of an earlier run that
+are not part of the current one (e.g., after the CSV was regenerated) are deleted from OneLake.
+
+Usage:
+    python fabric_onelake_backfill.py --workspace-id "..." --cluster-uri "https://..." --database "rti_kqldb_suffix"
+    python fabric_onelake_backfill.py --workspace-id "..." --mode external-table --external-table "events_history"
+    python fabric_onelake_backfill.py --workspace-id "..." --mode upload --max-parallel-files 16 --chunk-size-mb 16
+
+Requirements:
+    - pyarrow (Parquet support of pandas)
+    - Azure CLI authentication with access to the workspace
+    - The events table set up by fabric_database.py (ingest mode)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Set
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import requests.adapters
+from azure.core.exceptions import ResourceNotFoundError
+from azure.core.pipeline.transport import RequestsTransport
+from azure.kusto.data import KustoClient
+from azure.storage.filedatalake import FileSystemClient
+
+from fabric_api import FabricWorkspaceApiClient
+from fabric_data_ingester import clear_table_data, create_kusto_client
+from fabric_database import get_table_columns, wait_for_operations
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+repo_dir = os.path.abspath(os.path.join(script_dir, "..", "..", ".."))
+
+ONELAKE_HOST = "onelake.dfs.fabric.microsoft.com"
+DEFAULT_TARGET_DIR = "backfill/events"
+
+DEFAULT_CSV_CHUNK_ROWS = 1_000_000
+DEFAULT_MAX_PARALLEL_FILES = 8
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_CHUNK_SIZE_MB = 8
+DEFAULT_FILES_PER_INGEST = 20
+DEFAULT_INGEST_TIMEOUT_SEC = 3600
+
+# Arrow types of the KQL column types; Kusto datetimes have 100ns ticks, so microseconds suffice
+ARROW_TYPES = {
+    "string": pa.string(),
+    "int": pa.int32(),
+    "long": pa.int64(),
+    "real": pa.float64(),
+    "bool": pa.bool_(),
+    "datetime": pa.timestamp("us", tz="UTC")
+}
+
+
+def get_events_arrow_schema() -> pa.Schema:
+    """Get the Arrow schema of the events table, so every Parquet file has the table's column types."""
+    return pa.schema([(name, ARROW_TYPES[kql_type]) for name, kql_type in get_table_columns()["events"]])
+
+
+def write_event_partitions(events_csv: str, output_dir: str, chunk_rows: int = DEFAULT_CSV_CHUNK_ROWS) -> List[str]:
+    """Convert an events CSV to Parquet files partitioned by day.
+
+    The CSV is read chunk by chunk, so histories larger than memory can be converted. Every
+    chunk writes one file per day it covers, to "{output_dir}/date=YYYY-MM-DD/part-{hash}.parquet",
+    where the hash is computed from the rows of the file. A file name therefore identifies its
+    content, so a regenerated CSV gives new names rather than new content under names that were
+    uploaded and ingested before. pandas infers column types per chunk (e.g., int64 for a chunk of
+    whole-number readings), so every chunk is cast to the events table schema before it is written.
+
+    Args:
+        events_csv: Path of the events CSV written by src/sample_data.py
+        output_dir: Local directory for the Parquet files (replaced if it exists)
+        chunk_rows: Number of CSV rows converted at a time
+
+    Returns:
+        Paths of the Parquet files written
+    """
+    if not os.path.exists(events_csv):
+        raise FileNotFoundError(f"CSV not found at path: {events_csv}")
+
+    if os.path.exists(output_dir):
+        shutil.rmtree(output_dir)
+    os.makedirs(output_dir)
+
+    print(f"Converting {events_csv} to Parquet files partitioned by day...")
+    schema = get_events_arrow_schema()
+    file_paths = []
+    row_count = 0
+    for chunk in pd.read_csv(events_csv, chunksize=chunk_rows):
+        chunk["Timestamp"] = pd.to_datetime(chunk["Timestamp"], utc=True, format="ISO8601")
+        for day, partition in chunk.groupby(chunk["Timestamp"].dt.strftime("%Y-%m-%d")):
+            partition_dir = os.path.join(output_dir, f"date={day}")
+            os.makedirs(partition_dir, exist_ok=True)
+            rows = partition[schema.names]
+            # Hash the rows rather than the Parquet bytes, which change with the pyarrow version
+            content = rows.to_csv(index=False, date_format="%Y-%m-%dT%H:%M:%S.%fZ").encode("utf-8")
+            content_hash = hashlib.sha256(content).hexdigest()
+            file_path = os.path.join(partition_dir, f"part-{content_hash[:16]}.parquet")
+            table = pa.Table.from_pandas(rows, preserve_index=False)
+            pq.write_table(table.cast(schema), file_path)
+            file_paths.append(file_path)
+        row_count += len(chunk)
+
+    print(f"  ✓ Wrote {row_count:,} events to {len(file_paths)} Parquet files")
+    return file_paths
+
+
+def create_onelake_transport(pool_size: int) -> RequestsTransport:
+    """Create an HTTP transport with enough pooled connections for parallel uploads.
+
+    Args:
+        pool_size: Maximum number of concurrent connections to OneLake
+
+    Returns:
+        RequestsTransport for DataLakeServiceClient
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    return RequestsTransport(session=session, session_owner=True)
+
+
+def get_onelake_uri(workspace_id: str, item_id: str, path: str) -> str:
+    """Get the abfss URI of a path in the Files area of a lakehouse.
+
+    Args:
+        workspace_id: ID of the Fabric workspace
+        item_id: ID of the lakehouse
+        path: Path relative to the Files area
+
+    Returns:
+        abfss URI of the path
+    """
+    return f"abfss://{workspace_id}@{ONELAKE_HOST}/{item_id}/Files/{path.strip('/')}"
+
+
+def upload_files_to_onelake(file_system_client: FileSystemClient,
+                            local_dir: str,
+                            target_dir: str,
+                            max_parallel_files: int = DEFAULT_MAX_PARALLEL_FILES,
+                            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE_MB * 1024 * 1024) -> Dict[str, Any]:
+    """Upload a local directory tree to OneLake with parallel chunked uploads.
+
+    Several files are uploaded at a time, and every file larger than chunk_size is uploaded in
+    chunks of which up to max_concurrency are in flight. Files that already exist with the same
+    size are skipped, and files under target_dir that are not in local_dir are deleted, so the
+    target directory holds exactly the files of the current run.
+
+    Args:
+        file_system_client: OneLake file system client of the workspace
+        local_dir: Local directory to upload
+        target_dir: Target directory, relative to the file system (e.g., "{lakehouse_id}/Files/backfill/events")
+        max_parallel_files: Number of files uploaded at a time
+        max_concurrency: Number of chunks of one file uploaded at a time
+        chunk_size: Size of the upload chunks in bytes
+
+    Returns:
+        Dictionary with "uploaded", "skipped" and "deleted" remote paths and the number of "bytes" uploaded
+    """
+    try:
+        existing_sizes = {
+            path.name: path.content_length
+            for path in file_system_client.get_paths(path=target_dir, recursive=True)
+            if not path.is_directory
+        }
+    except ResourceNotFoundError:
+        existing_sizes = {}
+
+    uploads = {}
+    for root, _, file_names in os.walk(local_dir):
+        for file_name in sorted(file_names):
+            local_path = os.path.join(root, file_name)
+            relative_path = os.path.relpath(local_path, local_dir).replace(os.sep, "/")
+            uploads[f"{target_dir.strip('/')}/{relative_path}"] = local_path
+
+    skipped = {remote_path for remote_path, local_path in uploads.items()
+               if existing_sizes.get(remote_path) == os.path.getsize(local_path)}
+    pending = {remote_path: local_path for remote_path, local_path in uploads.items() if remote_path not in skipped}
+    if skipped:
+        print(f"  ✓ Skipping {len(skipped)} files already uploaded")
+
+    def upload(remote_path: str, local_path: str) -> int:
+        size = os.path.getsize(local_path)
+        file_client = file_system_client.get_file_client(remote_path)
+        with open(local_path, "rb") as data:
+            file_client.upload_data(data, length=size, overwrite=True,
+                                    max_concurrency=max_concurrency, chunk_size=chunk_size)
+        return size
+
+    print(f"Uploading {len(pending)} files to {target_dir} ({max_parallel_files} files at a time, "
+          f"{max_concurrency} chunks of {chunk_size // (1024 * 1024)} MB per file)...")
+    start_time = time.time()
+    uploaded = []
+    uploaded_bytes = 0
+    failures = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_parallel_files)) as executor:
+        futures = {executor.submit(upload, remote_path, local_path): remote_path
+                   for remote_path, local_path in pending.items()}
+        for future in as_completed(futures):
+            remote_path = futures[future]
+            try:
+                uploaded_bytes += future.result()
+                uploaded.append(remote_path)
+                if len(uploaded) % 50 == 0:
+                    print(f"  ... {len(uploaded)}/{len(pending)} files uploaded")
+            except Exception as e:
+                failures[remote_path] = e
+                print(f"  ❌ Failed to upload {remote_path}: {e}")
+
+    if failures:
+        raise RuntimeError(f"{len(failures)} of {len(pending)} file uploads failed, run the backfill again to retry them")
+
+    elapsed = max(time.time() - start_time, 0.001)
+    print(f"  ✓ Uploaded {len(uploaded)} files ({uploaded_bytes / (1024 * 1024):.1f} MB) "
+          f"in {elapsed:.1f}s ({uploaded_bytes / (1024 * 1024) / elapsed:.1f} MB/s)")
+
+    # Files of earlier runs would otherwise be read by the external table
+    stale = sorted(remote_path for remote_path in existing_sizes if remote_path not in uploads)
+    if stale:
+        print(f"Deleting {len(stale)} files of earlier runs from {target_dir}...")
+        with ThreadPoolExecutor(max_workers=max(1, max_parallel_files)) as executor:
+            list(executor.map(file_system_client.delete_file, stale))
+        print(f"  ✓ Deleted {len(stale)} files")
+    return {"uploaded": sorted(uploaded), "skipped": sorted(skipped), "deleted": stale, "bytes": uploaded_bytes}
+
+
+def get_ingested_files(kusto_client: KustoClient, database_name: str, table_name: str) -> Set[str]:
+    """Get the files already ingested into a table, from the ingest-by tags of its extents.
+
+    Args:
+        kusto_client: Kusto client of the Eventhouse
+        database_name: Name of the KQL database
+        table_name: Name of the table
+
+    Returns:
+        Values of the ingest-by tags (file paths relative to the lakehouse Files area)
+    """
+    response = kusto_client.execute_mgmt(database_name, f".show table ['{table_name}'] extents where tags has 'ingest-by:'")
+    ingested = set()
+    for row in response.primary_results[0]:
+        for tag in (row["Tags"] or "").split():
+            if tag.startswith("ingest-by:"):
+                ingested.add(tag[len("ingest-by:"):])
+    return ingested
+
+
+def ingest_from_onelake(kusto_client: KustoClient,
+                        database_name: str,
+                        table_name: str,
+                        file_uris: Dict[str, str],
+                        files_per_command: int = DEFAULT_FILES_PER_INGEST,
+                        timeout_sec: int = DEFAULT_INGEST_TIMEOUT_SEC) -> Dict[str, Any]:
+    """Ingest Parquet files from OneLake into a table, skipping files ingested before.
+
+    Files are ingested with `.ingest async` commands of files_per_command files each. The commands
+    return at once and Kusto runs them in parallel; the caller's identity is used to read OneLake.
+    Every command tags its extents with an ingest-by tag per file and sets ingestIfNotExists, so
+    re-running a backfill (e.g., after an interruption) does not ingest a file twice.
+
+    Args:
+        kusto_client: Kusto client of the Eventhouse
+        database_name: Name of the KQL database
+        table_name: Name of the target table
+        file_uris: Dictionary mapping file paths relative to the lakehouse Files area to their abfss URIs
+        files_per_command: Number of files per ingestion command
+        timeout_sec: Maximum time to wait for the ingestion
+
+    Returns:
+        Dictionary with the "ingested" and "skipped" file paths
+    """
+    ingested = get_ingested_files(kusto_client, database_name, table_name)
+    skipped = sorted(path for path in file_uris if path in ingested)
+    pending = sorted(path for path in file_uris if path not in ingested)
+    if skipped:
+        print(f"  ✓ Skipping {len(skipped)} files already ingested into {table_name}")
+
+    operation_ids = []
+    for start in range(0, len(pending), files_per_command):
+        paths = pending[start:start + files_per_command]
+        sources = ",\n    ".join(f"h'{file_uris[path]};impersonate'" for path in paths)
+        tags = json.dumps([f"ingest-by:{path}" for path in paths])
+        command = (f".ingest async into table ['{table_name}'] (\n    {sources}\n) "
+                   f"with (format='parquet', tags='{tags}', ingestIfNotExists='{json.dumps(paths)}')")
+        response = kusto_client.execute_mgmt(database_name, command)
+        operation_ids.append(str(response.primary_results[0][0]["OperationId"]))
+
+    print(f"Ingesting {len(pending)} files into {database_name}.{table_name} with {len(operation_ids)} operations...")
+    finished = wait_for_operations(kusto_client, database_name, operation_ids, timeout_sec)
+    if len(finished) < len(operation_ids):
+        raise TimeoutError(f"{len(operation_ids) - len(finished)} ingestion operations still running after {timeout_sec}s")
+    failed = {operation_id: result for operation_id, result in finished.items() if result["State"] != "Completed"}
+    for operation_id, result in failed.items():
+        print(f"  ❌ Ingestion operation {operation_id} {result['State']}: {result['Status']}")
+    if failed:
+        raise RuntimeError(f"{len(failed)} of {len(operation_ids)} ingestion operations did not complete, "
+                           "run the backfill again to retry them")
+    print(f"  ✓ Ingested {len(pending)} files into {table_name}")
+    return {"ingested": pending, "skipped": skipped}
+
+
+def create_onelake_external_table(kusto_client: KustoClient,
+                                  database_name: str,
+                                  external_table_name: str,
+                                  source_uri: str,
+                                  columns: List[tuple]) -> None:
+    """Create or alter an external table over the day-partitioned Parquet files in OneLake.
+
+    The "date=YYYY-MM-DD" folders are declared as partitions on the Timestamp column, so queries
+    filtering on Timestamp only read the folders of the days they need.
+
+    Args:
+        kusto_client: Kusto client of the Eventhouse
+        database_name: Name of the KQL database
+        external_table_name: Name of the external table
+        source_uri: abfss URI of the directory holding the date= folders
+        columns: List of (column name, KQL type)
+    """
+    schema = ", ".join(f"['{name}']: {kql_type}" for name, kql_type in columns)
+    command = (
+        f".create-or-alter external table ['{external_table_name}'] ({schema})\n"
+        "kind=storage\n"
+        "partition by (Day: datetime = bin(Timestamp, 1d))\n"
+        "pathformat = (\"date=\" datetime_pattern(\"yyyy-MM-dd\", Day))\n"
+        "dataformat=parquet\n"
+        f"(\n    h@'{source_uri};impersonate'\n)"
+    )
+    kusto_client.execute_mgmt(database_name, command)
+    print(f"  ✓ External table {external_table_name} reads {source_uri}")
+
+
+def get_or_create_lakehouse(workspace_client: FabricWorkspaceApiClient, lakehouse_name: str) -> Dict[str, Any]:
+    """Get the backfill lakehouse, creating it if it does not exist.
+
+    Args:
+        workspace_client: Authenticated workspace API client
+        lakehouse_name: Name of the lakehouse
+
+    Returns:
+        Dictionary containing the lakehouse details
+    """
+    lakehouse = workspace_client.get_lakehouse_by_name(lakehouse_name)
+    if lakehouse:
+        print(f"✅ Using existing lakehouse '{lakehouse_name}' ({lakehouse['id']})")
+        return lakehouse
+    lakehouse = workspace_client.create_lakehouse(lakehouse_name)
+    print(f"✅ Created lakehouse '{lakehouse_name}' ({lakehouse['id']})")
+    return lakehouse
+
+
+def backfill_events(workspace_client: FabricWorkspaceApiClient,
+                    lakehouse_name: str,
+                    events_csv: str,
+                    mode: str = "ingest",
+                    cluster_uri: Optional[str] = None,
+                    database_name: Optional[str] = None,
+                    table_name: str = "events",
+                    external_table_name: str = "events_history",
+                    target_dir: str = DEFAULT_TARGET_DIR,
+                    overwrite_existing: bool = False,
+                    max_parallel_files: int = DEFAULT_MAX_PARALLEL_FILES,
+                    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                    chunk_size_mb: int = DEFAULT_CHUNK_SIZE_MB,
+                    files_per_command: int = DEFAULT_FILES_PER_INGEST) -> Dict[str, Any]:
+    """
+    Backfill an events CSV into the Eventhouse through OneLake.
+
+    Args:
+        workspace_client: Authenticated workspace API client
+        lakehouse_name: Name of the lakehouse holding the Parquet files (created if missing)
+        events_csv: Path of the events CSV
+        mode: "upload" (upload only), "ingest" (ingest into table_name) or
+            "external-table" (expose the files as external_table_name)
+        cluster_uri: Query URI of the Eventhouse (not needed in "upload" mode)
+        database_name: Name of the KQL database (not needed in "upload" mode)
+        table_name: Table to ingest into in "ingest" mode
+        external_table_name: External table created in "external-table" mode
+        target_dir: Directory in the lakehouse Files area for the Parquet files
+        overwrite_existing: Whether to clear table_name before ingesting
+        max_parallel_files: Number of files uploaded at a time
+        max_concurrency: Number of chunks of one file uploaded at a time
+        chunk_size_mb: Size of the upload chunks in MB
+        files_per_command: Number of files per ingestion command
+
+    Returns:
+        Dictionary with the lakehouse ID, the OneLake URI of the files and the upload results
+    """
+    if mode != "upload" and not (cluster_uri and database_name):
+        raise ValueError(f"Mode '{mode}' needs the Eventhouse cluster URI and database name")
+
+    workspace_id = workspace_client.workspace_id
+    lakehouse = get_or_create_lakehouse(workspace_client, lakehouse_name)
+
+    parquet_dir = os.path.join(os.path.dirname(os.path.abspath(events_csv)), "temp", "events_parquet")
+    write_event_partitions(events_csv, parquet_dir)
+
+    transport = create_onelake_transport(max_parallel_files * max_concurrency)
+    file_system_client = workspace_client.get_workspace_file_system_client(workspace_id, transport=transport)
+    upload_result = upload_files_to_onelake(
+        file_system_client,
+        parquet_dir,
+        f"{lakehouse['id']}/Files/{target_dir.strip('/')}",
+        max_parallel_files=max_parallel_files,
+        max_concurrency=max_concurrency,
+        chunk_size=chunk_size_mb * 1024 * 1024
+    )
+    source_uri = get_onelake_uri(workspace_id, lakehouse["id"], target_dir)
+
+    if mode == "ingest":
+        kusto_client = create_kusto_client(cluster_uri)
+        if overwrite_existing:
+            clear_table_data(kusto_client, database_name, table_name)
+        relative_paths = [path.split("/Files/", 1)[1] for path in upload_result["uploaded"] + upload_result["skipped"]]
+        file_uris = {path: get_onelake_uri(workspace_id, lakehouse["id"], path) for path in relative_paths}
+        ingest_from_onelake(kusto_client, database_name, table_name, file_uris, files_per_command)
+    elif mode == "external-table":
+        kusto_client = create_kusto_client(cluster_uri)
+        create_onelake_external_table(kusto_client, database_name, external_table_name,
+                                      source_uri, get_table_columns()["events"])
+
+    shutil.rmtree(parquet_dir, ignore_errors=True)
+    return {"lakehouse_id": lakehouse["id"], "source_uri": source_uri, **upload_result}
+
+
+def main():
+    """Main function to handle command line arguments and execute the OneLake backfill."""
+    parser = argparse.ArgumentParser(
+        description="Backfill historical events into the Eventhouse through OneLake",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python fabric_onelake_backfill.py --workspace-id "12345678-1234-1234-1234-123456789abc" --cluster-uri "https://cluster.kusto.fabric.microsoft.com" --database "rti_kqldb_suffix"
+  python fabric_onelake_backfill.py --workspace-id "..." --cluster-uri "..." --database "..." --mode external-table
+  python fabric_onelake_backfill.py --workspace-id "..." --mode upload --max-parallel-files 16 --chunk-size-mb 16
+        """
+    )
+    parser.add_argument("--workspace-id", required=True, help="ID of the Fabric workspace")
+    parser.add_argument("--lakehouse-name", default="rti_lakehouse",
+                        help="Lakehouse holding the Parquet files, created if missing (default: rti_lakehouse)")
+    parser.add_argument("--events-csv", default=os.path.join(repo_dir, "infra", "data", "events.csv"),
+                        help="Events CSV to backfill (default: infra/data/events.csv)")
+    parser.add_argument("--mode", choices=["upload", "ingest", "external-table"], default="ingest",
+                        help="Upload only, ingest into the events table, or expose the files as an external table (default: ingest)")
+    parser.add_argument("--cluster-uri", help="Eventhouse query URI")
+    parser.add_argument("--database", help="KQL database name")
+    parser.add_argument("--table", default="events", help="Table to ingest into (default: events)")
+    parser.add_argument("--external-table", default="events_history", help="External table to create (default: events_history)")
+    parser.add_argument("--target-dir", default=DEFAULT_TARGET_DIR,
+                        help=f"Directory in the lakehouse Files area (default: {DEFAULT_TARGET_DIR})")
+    parser.add_argument("--overwrite", action="store_true", help="Clear the table before ingesting")
+    parser.add_argument("--max-parallel-files", type=int, default=DEFAULT_MAX_PARALLEL_FILES,
+                        help=f"Number of files uploaded at a time (default: {DEFAULT_MAX_PARALLEL_FILES})")
+    parser.add_argument("--max-concurrency", type=int, default=DEFAULT_MAX_CONCURRENCY,
+                        help=f"Number of chunks of one file uploaded at a time (default: {DEFAULT_MAX_CONCURRENCY})")
+    parser.add_argument("--chunk-size-mb", type=int, default=DEFAULT_CHUNK_SIZE_MB,
+                        help=f"Upload chunk size in MB (default: {DEFAULT_CHUNK_SIZE_MB})")
+    parser.add_argument("--files-per-command", type=int, default=DEFAULT_FILES_PER_INGEST,
+                        help=f"Number of files per ingestion command (default: {DEFAULT_FILES_PER_INGEST})")
+    args = parser.parse_args()
+
+    from fabric_auth import authenticate_workspace
+
+    workspace_client = authenticate_workspace(args.workspace_id)
+    if not workspace_client:
+        print("❌ Failed to authenticate workspace-specific Fabric API client")
+        sys.exit(1)
+
+    try:
+        result = backfill_events(
+            workspace_client=workspace_client,
+            lakehouse_name=args.lakehouse_name,
+            events_csv=args.events_csv,
+            mode=args.mode,
+            cluster_uri=args.cluster_uri,
+            database_name=args.database,
+            table_name=args.table,
+            external_table_name=args.external_table,
+            target_dir=args.target_dir,
+            overwrite_existing=args.overwrite,
+            max_parallel_files=args.max_parallel_files,
+            max_concurrency=args.max_concurrency,
+            chunk_size_mb=args.chunk_size_mb,
+            files_per_command=args.files_per_command
+        )
+    except Exception as e:
+        print(f"\n❌ Backfill failed: {e}")
+        sys.exit(1)
+
+    print(f"\n✅ Backfill complete: {result['source_uri']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Fabric Profiler Module
+
+This module provides timing instrumentation for the deployment scripts. When profiling is
+enabled, deployment steps, Fabric API calls, retries, throttling waits and long-running
+operation polls and waits are recorded as nested spans. At exit, a JSON timeline is written
+and a summary is printed with the slowest calls and the time spent on network requests,
+waiting on long-running operations and waiting on throttling.
+
+Span kinds:
+    step - Deployment step started by print_step()
+    api_call / retry - Fabric API call, and each retry of it after throttling
+    http - Single HTTP round trip
+    throttle - Sleep after a 429 response
+    rate_limit - Sleep pacing requests by the client-side rate limiter
+    retry_wait - Sleep before retrying a failed request
+    lro - Wait for one or more long-running operations
+    lro_poll - Single poll of a long-running operation
+    lro_wait - Sleep between long-running operation polls
+
+Spans are optionally exported to OpenTelemetry, when the opentelemetry-api package is
+installed. With opentelemetry-sdk and the OTLP exporter installed and
+OTEL_EXPORTER_OTLP_ENDPOINT set, an exporter is configured; otherwise the globally configured
+tracer provider is used (e.g. when running under opentelemetry-instrument).
+
+Usage:
+    FABRIC_PROFILE=true python deploy_fabric_rti.py
+    python fabric_profiler.py .azure/myenv/fabric_deploy_profile.json --top 20
+
+    from fabric_profiler import profile_span
+    with profile_span("GET workspaces", "http"):
+        response = http_request("GET", url)
+
+Environment Variables:
+    FABRIC_PROFILE - Set to "true" to profile the deployment scripts
+    FABRIC_PROFILE_PATH - Custom path of the JSON timeline
+        (defaults to ".azure/{AZURE_ENV_NAME}/fabric_{run}_profile.json" in the repository root)
+    FABRIC_PROFILE_OTEL - Set to "true" to export spans to OpenTelemetry
+"""
+
+import argparse
+import atexit
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:
+    otel_trace = None
+
+# Span kinds counted as network time, LRO waits, throttling, rate limiting and retry waits in the summary
+NETWORK_KINDS = ("http", "lro_poll")
+WAIT_CATEGORIES = {
+    "network": NETWORK_KINDS,
+    "lro_wait": ("lro_wait",),
+    "throttle": ("throttle",),
+    "rate_limit": ("rate_limit",),
+    "retry_wait": ("retry_wait",),
+}
+
+
+def get_profile_path(run_name: str) -> str:
+    """Get the path of the JSON timeline of a profiled run.
+
+    Args:
+        run_name: Name of the profiled script (e.g. "deploy")
+
+    Returns:
+        Absolute path of the timeline file
+    """
+    custom_path = os.getenv("FABRIC_PROFILE_PATH")
+    if custom_path:
+        return os.path.abspath(custom_path)
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    repo_dir = os.path.abspath(os.path.join(script_dir, "..", "..", ".."))
+    env_name = os.getenv("AZURE_ENV_NAME", "default")
+    return os.path.join(repo_dir, ".azure", env_name, f"fabric_{run_name}_profile.json")
+
+
+class DeploymentProfiler:
+    """
+    Collector of timing spans of a deployment run.
+
+    Spans nest per thread; spans started outside of any other span on a thread are attached to
+    the deployment step of that thread, or to the latest step started by any thread, so work done
+    in worker threads is attributed to its step. Steps are tracked per thread as well, so the
+    steps of environments deployed concurrently by deploy_fabric_rti_fleet.py do not end each other.
+    """
+
+    def __init__(self, run_name: str = "deploy", export_otel: bool = False):
+        """
+        Initialize the DeploymentProfiler.
+
+        Args:
+            run_name: Name of the profiled run
+            export_otel: Whether to export spans to OpenTelemetry
+        """
+        self.run_name = run_name
+        self.started_at = time.time()
+        self.spans: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._next_id = 1
+        self._current_step: Optional[Dict[str, Any]] = None
+        self._tracer = _get_otel_tracer() if export_otel else None
+
+    def _stack(self) -> List[Dict[str, Any]]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def start_span(self, name: str, kind: str, root: bool = False, **attributes) -> Dict[str, Any]:
+        """Start a span, nested in the current span of this thread (or the current step) unless root."""
+        stack = self._stack()
+        parent = None if root else (stack[-1] if stack else self._get_step())
+        with self._lock:
+            span = {
+                "id": self._next_id,
+                "parent_id": parent["id"] if parent else None,
+                "name": name,
+                "kind": kind,
+                "thread": threading.current_thread().name,
+                "start_sec": time.time() - self.started_at,
+                "duration_sec": None,
+                "status": "ok",
+                "attributes": {key: value for key, value in attributes.items() if value is not None},
+            }
+            self._next_id += 1
+            self.spans.append(span)
+        if self._tracer:
+            context = otel_trace.set_span_in_context(parent["_otel"]) if parent and parent.get("_otel") else None
+            span["_otel"] = self._tracer.start_span(f"{kind} {name}", context=context, attributes=span["attributes"])
+        return span
+
+    def end_span(self, span: Dict[str, Any], error: Optional[BaseException] = None) -> None:
+        """End a span, marking it failed if an error is given."""
+        span["duration_sec"] = time.time() - self.started_at - span["start_sec"]
+        if error is not None:
+            span["status"] = "error"
+            span["attributes"]["error"] = str(error)[:500]
+        otel_span = span.pop("_otel", None)
+        if otel_span is not None:
+            if error is not None:
+                otel_span.set_attribute("error", span["attributes"]["error"])
+            otel_span.end()
+
+    @contextmanager
+    def span(self, name: str, kind: str, **attributes) -> Iterator[Dict[str, Any]]:
+        """Record the enclosed block as a span."""
+        span = self.start_span(name, kind, **attributes)
+        stack = self._stack()
+        stack.append(span)
+        try:
+            yield span
+        except BaseException as e:
+            self.end_span(span, e)
+            raise
+        else:
+            self.end_span(span)
+        finally:
+            stack.pop()
+
+    def _get_step(self) -> Optional[Dict[str, Any]]:
+        return getattr(self._local, "step", None) or self._current_step
+
+    def begin_step(self, name: str, **attributes) -> None:
+        """End the current deployment step of this thread and start the next one."""
+        self.end_step()
+        self._local.step = self._current_step = self.start_span(name, "step", root=True, **attributes)
+
+    def end_step(self) -> None:
+        """End the current deployment step of this thread, if any."""
+        step = getattr(self._local, "step", None)
+        if step is not None:
+            self.end_span(step)
+            self._local.step = None
+            if self._current_step is step:
+                self._current_step = None
+
+    def get_timeline(self) -> Dict[str, Any]:
+        """Get the recorded spans and their summary as a JSON-serializable timeline."""
+        with self._lock:
+            spans = [{key: value for key, value in span.items() if key != "_otel"} for span in self.spans]
+        duration_sec = time.time() - self.started_at
+        for span in spans:
+            # Spans still open at exit (e.g. a failed step) end with the run
+            if span["duration_sec"] is None:
+                span["duration_sec"] = duration_sec - span["start_sec"]
+                span["status"] = "open"
+        return {
+            "run": self.run_name,
+            "started_at": datetime.fromtimestamp(self.started_at, timezone.utc).isoformat(),
+            "duration_sec": duration_sec,
+            "summary": summarize_spans(spans, duration_sec),
+            "spans": spans,
+        }
+
+    def write_timeline(self, path: str) -> Dict[str, Any]:
+        """Write the timeline to a JSON file.
+
+        Args:
+            path: Path of the timeline file
+
+        Returns:
+            Written timeline
+        """
+        timeline = self.get_timeline()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(timeline, f, indent=2)
+        return timeline
+
+
+def _get_otel_tracer() -> Optional[Any]:
+    """Get an OpenTelemetry tracer, configuring an OTLP exporter when possible."""
+    if otel_trace is None:
+        print("⚠️ FABRIC_PROFILE_OTEL is set but opentelemetry-api is not installed; skipping OpenTelemetry export")
+        return None
+    if os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT"):
+        try:
+            from opentelemetry.sdk.resources import Resource
+            from opentelemetry.sdk.trace import TracerProvider
+            from opentelemetry.sdk.trace.export import BatchSpanProcessor
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+            provider = TracerProvider(resource=Resource.create({"service.name": os.getenv("OTEL_SERVICE_NAME", "fabric-deployment")}))
+            provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+            otel_trace.set_tracer_provider(provider)
+            atexit.register(provider.shutdown)
+        except ImportError:
+            print("⚠️ opentelemetry-sdk or the OTLP exporter is not installed; using the global tracer provider")
+    return otel_trace.get_tracer("fabric-deployment")
+
+
+def summarize_spans(spans: List[Dict[str, Any]], duration_sec: float, top_n: int = 10) -> Dict[str, Any]:
+    """Summarize the spans of a run.
+
+    Args:
+        spans: Finished spans of the run
+        duration_sec: Wall-clock duration of the run
+        top_n: Number of slowest API calls to include
+
+    Returns:
+        Dictionary with step durations, the slowest API calls, and time per wait category
+        (summed over threads, so it can exceed the wall-clock duration)
+    """
+    categories = {
+        category: round(sum(s["duration_sec"] for s in spans if s["kind"] in kinds), 3)
+        for category, kinds in WAIT_CATEGORIES.items()
+    }
+    # API call spans include their retries and LRO waits
+    calls = [s for s in spans if s["kind"] == "api_call"]
+    slowest = sorted(calls, key=lambda s: -s["duration_sec"])[:top_n]
+    return {
+        "wall_clock_sec": round(duration_sec, 3),
+        "api_calls": sum(1 for s in spans if s["kind"] == "api_call"),
+        "retries": sum(1 for s in spans if s["kind"] == "retry"),
+        "lro_polls": sum(1 for s in spans if s["kind"] == "lro_poll"),
+        "time_sec": categories,
+        "steps": [{"name": s["name"], "duration_sec": round(s["duration_sec"], 3), "status": s["status"]}
+                  for s in spans if s["kind"] == "step"],
+        "slowest_calls": [{"name": s["name"], "duration_sec": round(s["duration_sec"], 3), "status": s["status"]}
+                          for s in slowest],
+    }
+
+
+def print_profile_summary(summary: Dict[str, Any], top_n: Optional[int] = None) -> None:
+    """Print the summary of a profiled run as tables."""
+    print(f"\n⏱️  PROFILE: {summary['wall_clock_sec']:.1f}s wall clock, {summary['api_calls']} API call(s), "
+          f"{summary['retries']} retr(ies), {summary['lro_polls']} LRO poll(s)")
+    time_sec = summary["time_sec"]
+    print(f"   Network: {time_sec['network']:.1f}s | Waiting on LROs: {time_sec['lro_wait']:.1f}s | "
+          f"Throttling: {time_sec['throttle']:.1f}s | Rate limiting: {time_sec.get('rate_limit', 0.0):.1f}s | "
+          f"Retry backoff: {time_sec['retry_wait']:.1f}s")
+
+    if summary["steps"]:
+        print(f"\n   {'Duration':>9}  Step")
+        for step in summary["steps"]:
+            status = "" if step["status"] == "ok" else f" ({step['status']})"
+            print(f"   {step['duration_sec']:>8.1f}s  {step['name']}{status}")
+
+    slowest = summary["slowest_calls"][:top_n] if top_n else summary["slowest_calls"]
+    if slowest:
+        print(f"\n   {'Duration':>9}  Slowest calls")
+        for call in slowest:
+            status = "" if call["status"] == "ok" else f" ({call['status']})"
+            print(f"   {call['duration_sec']:>8.1f}s  {call['name']}{status}")
+
+
+_profiler: Optional[DeploymentProfiler] = None
+_profiler_lock = threading.Lock()
+
+
+def get_profiler() -> Optional[DeploymentProfiler]:
+    """Get the active profiler, or None if profiling is disabled."""
+    return _profiler
+
+
+def start_profiling(run_name: str, output_path: Optional[str] = None, export_otel: Optional[bool] = None) -> DeploymentProfiler:
+    """Start profiling this process and write the timeline and summary at exit.
+
+    Args:
+        run_name: Name of the profiled run, used in the default timeline path
+        output_path: Optional path of the timeline (defaults to get_profile_path())
+        export_otel: Whether to export spans to OpenTelemetry (defaults to FABRIC_PROFILE_OTEL)
+
+    Returns:
+        Active DeploymentProfiler
+    """
+    global _profiler
+    with _profiler_lock:
+        if _profiler is not None:
+            return _profiler
+        if export_otel is None:
+            export_otel = os.getenv("FABRIC_PROFILE_OTEL", "").lower() == "true"
+        _profiler = DeploymentProfiler(run_name, export_otel=export_otel)
+    path = output_path or get_profile_path(run_name)
+
+    def report():
+        _profiler.end_step()
+        timeline = _profiler.write_timeline(path)
+        print_profile_summary(timeline["summary"])
+        print(f"   Timeline written to: {path}")
+
+    atexit.register(report)
+    print(f"⏱️  Profiling enabled, timeline will be written to: {path}")
+    return _profiler
+
+
+def start_profiling_from_env(run_name: str) -> Optional[DeploymentProfiler]:
+    """Start profiling if FABRIC_PROFILE is set to "true".
+
+    Args:
+        run_name: Name of the profiled run
+
+    Returns:
+        Active DeploymentProfiler, or None if profiling is disabled
+    """
+    if os.getenv("FABRIC_PROFILE", "").lower() != "true":
+        return None
+    return start_profiling(run_name)
+
+
+@contextmanager
+def profile_span(name: str, kind: str, **attributes) -> Iterator[Optional[Dict[str, Any]]]:
+    """Record the enclosed block as a span of the active profiler (no-op when disabled).
+
+    Args:
+        name: Span name, e.g. "GET workspaces/{id}/items"
+        kind: Span kind (see module docstring)
+        **attributes: Additional span attributes
+
+    Yields:
+        Span dictionary, or None when profiling is disabled
+    """
+    profiler = _profiler
+    if profiler is None:
+        yield None
+        return
+    with profiler.span(name, kind, **attributes) as span:
+        yield span
+
+
+def begin_profile_step(name: str, **attributes) -> None:
+    """Start the next deployment step span of the active profiler (no-op when disabled)."""
+    profiler = _profiler
+    if profiler is not None:
+        profiler.begin_step(name, **attributes)
+
+
+def end_profile_step() -> None:
+    """End the current deployment step span of this thread (no-op when disabled)."""
+    profiler = _profiler
+    if profiler is not None:
+        profiler.end_step()
+
+
+def main():
+    """Main function to print the summary of a recorded timeline."""
+    parser = argparse.ArgumentParser(description="Print the summary of a recorded deployment profile")
+    parser.add_argument("timeline", help="Path of the JSON timeline")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest calls to show (default: 10)")
+    args = parser.parse_args()
+
+    with open(args.timeline, "r", encoding="utf-8") as f:
+        timeline = json.load(f)
+    print(f"📄 {timeline['run']} run started at {timeline['started_at']}")
+    print_profile_summary(summarize_spans(timeline["spans"], timeline["duration_sec"], top_n=args.top))
+
+
+if __name__ == "__main__":
+    main()
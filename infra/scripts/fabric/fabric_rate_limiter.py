@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Fabric Rate Limiter Module
+
+This module provides client-side, adaptive rate limiting of Fabric REST API calls. Fabric
+throttles per user and API family, and answers with 429 and a Retry-After of up to minutes.
+When deployment steps run concurrently, or several workspaces are deployed at once, each
+caller would otherwise keep sending requests until it is throttled and then sleep on its own.
+
+Requests are paced by one token bucket per API family (workspaces, workspace items,
+connections, jobs, operations), shared by all clients and threads of the process. The rate
+adapts with AIMD (additive increase, multiplicative decrease):
+    - Every successful request raises the rate by about increase_per_sec per second
+    - A 429 halves the rate (at most once per throttling episode) and pauses the whole family
+      until the Retry-After has passed, after which requests resume paced instead of in a burst
+
+Usage:
+    from fabric_rate_limiter import get_rate_limiter
+    limiter = get_rate_limiter("workspaces/{id}/items")
+    delay = limiter.reserve()
+    time.sleep(delay)
+    ...
+    limiter.on_throttle(retry_after) if response.status_code == 429 else limiter.on_success()
+
+Environment Variables:
+    FABRIC_RATE_LIMIT_RPS - Initial requests per second per API family (default: 10, 0 disables)
+    FABRIC_RATE_LIMIT_MAX_RPS - Maximum requests per second per API family (default: 50)
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+DEFAULT_RATE_PER_SEC = 10.0
+DEFAULT_MAX_RATE_PER_SEC = 50.0
+DEFAULT_MIN_RATE_PER_SEC = 0.5
+
+
+def get_api_family(uri: str) -> str:
+    """Get the throttling family of a Fabric API URI.
+
+    Args:
+        uri: API URI relative to the base URL, or a full URL (e.g. of an LRO)
+
+    Returns:
+        "jobs", "connections", "operations", "items" (anything below a workspace) or "workspaces"
+    """
+    path = urlsplit(uri).path if "://" in uri else uri
+    # Strip the base path of full URLs, e.g. "/v1/"
+    segments = [s for s in path.split("/") if s]
+    if segments and segments[0].lower().startswith("v1"):
+        segments = segments[1:]
+    if "jobs" in segments:
+        return "jobs"
+    if not segments or segments[0] == "workspaces":
+        return "items" if len(segments) > 2 else "workspaces"
+    if segments[0] in ("connections", "operations"):
+        return segments[0]
+    return "workspaces"
+
+
+class AdaptiveRateLimiter:
+    """
+    Thread-safe AIMD token bucket for one API family.
+
+    Callers reserve a slot with reserve() and sleep for the returned delay before sending the
+    request, so the bucket never needs a background thread. The bucket is implemented as a
+    generic cell rate algorithm: _next_slot is the time the next request is due at the current
+    rate, and up to burst requests may run ahead of it.
+    """
+
+    def __init__(self,
+                 family: str,
+                 rate_per_sec: float = DEFAULT_RATE_PER_SEC,
+                 burst: int = 10,
+                 min_rate_per_sec: float = DEFAULT_MIN_RATE_PER_SEC,
+                 max_rate_per_sec: float = DEFAULT_MAX_RATE_PER_SEC,
+                 increase_per_sec: float = 0.5,
+                 decrease_factor: float = 0.5):
+        """
+        Initialize the AdaptiveRateLimiter.
+
+        Args:
+            family: API family name, for logging
+            rate_per_sec: Initial request rate
+            burst: Number of requests that may be sent at once after an idle period
+            min_rate_per_sec: Lower bound of the adapted rate
+            max_rate_per_sec: Upper bound of the adapted rate
+            increase_per_sec: Rate increase per second of successful requests at full rate
+            decrease_factor: Factor applied to the rate on throttling
+        """
+        self.family = family
+        self.rate_per_sec = min(max(rate_per_sec, min_rate_per_sec), max_rate_per_sec)
+        self.burst = max(1, burst)
+        self.min_rate_per_sec = min_rate_per_sec
+        self.max_rate_per_sec = max_rate_per_sec
+        self.increase_per_sec = increase_per_sec
+        self.decrease_factor = decrease_factor
+        self.throttled_count = 0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self._paused_until = 0.0
+
+    def reserve(self) -> float:
+        """Reserve a slot for one request.
+
+        Returns:
+            Seconds to wait before sending the request (0 if it can be sent now)
+        """
+        with self._lock:
+            now = time.monotonic()
+            interval = 1.0 / self.rate_per_sec
+            next_slot = max(self._next_slot, now)
+            start = max(now, next_slot - self.burst * interval, self._paused_until)
+            self._next_slot = max(next_slot, start) + interval
+            return start - now
+
+    def on_success(self) -> None:
+        """Additively increase the rate after a request that was not throttled."""
+        with self._lock:
+            # Adding increase_per_sec / rate per request adds about increase_per_sec per second
+            self.rate_per_sec = min(self.max_rate_per_sec, self.rate_per_sec + self.increase_per_sec / self.rate_per_sec)
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """Multiplicatively decrease the rate and pause the family after a 429 response.
+
+        Args:
+            retry_after: Retry-After of the response in seconds (defaults to one request interval)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.throttled_count += 1
+            # Concurrent requests of one throttling episode only decrease the rate once
+            if now >= self._paused_until:
+                self.rate_per_sec = max(self.min_rate_per_sec, self.rate_per_sec * self.decrease_factor)
+                print(f"🐢 Fabric API '{self.family}' requests throttled, reducing rate to {self.rate_per_sec:.1f}/s")
+            pause = retry_after if retry_after is not None else 1.0 / self.rate_per_sec
+            self._paused_until = max(self._paused_until, now + pause)
+            # Resume paced at the reduced rate rather than with a burst of queued requests
+            self._next_slot = max(self._next_slot, self._paused_until + self.burst / self.rate_per_sec)
+
+
+_rate_limiters: Dict[str, AdaptiveRateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(uri: str) -> Optional[AdaptiveRateLimiter]:
+    """Get the process-wide rate limiter of the API family of a URI, creating it on first use.
+
+    Args:
+        uri: API URI relative to the base URL, or a full URL
+
+    Returns:
+        AdaptiveRateLimiter, or None if rate limiting is disabled (FABRIC_RATE_LIMIT_RPS=0)
+    """
+    rate_per_sec = float(os.getenv("FABRIC_RATE_LIMIT_RPS", DEFAULT_RATE_PER_SEC))
+    if rate_per_sec <= 0:
+        return None
+    family = get_api_family(uri)
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(family)
+        if limiter is None:
+            max_rate_per_sec = float(os.getenv("FABRIC_RATE_LIMIT_MAX_RPS", DEFAULT_MAX_RATE_PER_SEC))
+            limiter = AdaptiveRateLimiter(family, rate_per_sec=rate_per_sec, max_rate_per_sec=max(rate_per_sec, max_rate_per_sec))
+            _rate_limiters[family] = limiter
+        return limiter
@@ -23,6 +23,7 @@ import os
 import sys
 from fabric_api import FabricWorkspaceApiClient, FabricApiError
 from fabric_auth import authenticate_workspace
+from fabric_definition_state import is_definition_unchanged, record_definition_hash
 
 def setup_real_time_dashboard(workspace_client: FabricWorkspaceApiClient,
                               workspace_id: str,
@@ -74,6 +75,7 @@ def setup_real_time_dashboard(workspace_client: FabricWorkspaceApiClient,
         print("🔄 Encoding dashboard configuration to Base64...")
         dashboard_base64 = base64.b64encode(json.dumps(dashboard_config).encode('utf-8')).decode('utf-8')
         print(f"✅ Dashboard configuration encoded ({len(dashboard_base64)} characters)")
+        definition_parts = {"RealTimeDashboard.json": dashboard_base64}
 
         # List all available dashboards to check if one with this title already exists
         print("🔍 Checking for existing dashboards...")
@@ -84,12 +86,17 @@ def setup_real_time_dashboard(workspace_client: FabricWorkspaceApiClient,
             print(f"🔄 Updating existing dashboard '{dashboard_title}' (ID: {existing_dashboard.get('id')})...")
             dashboard_id = existing_dashboard.get('id')
             
+            if is_definition_unchanged(workspace_client, dashboard_id, definition_parts):
+                print(f"⏭️  Skipping update of dashboard '{dashboard_title}' (ID: {dashboard_id}), definition unchanged")
+                return existing_dashboard
+            
             update_success = workspace_client.update_kql_dashboard_content(
                 dashboard_id=dashboard_id,
                 dashboard_definition_base64=dashboard_base64
             )
             
             if update_success:
+                record_definition_hash(workspace_client, dashboard_id, definition_parts)
                 print(f"✅ Successfully updated dashboard '{dashboard_title}' (ID: {dashboard_id})")
                 return existing_dashboard
             else:
@@ -105,6 +112,7 @@ def setup_real_time_dashboard(workspace_client: FabricWorkspaceApiClient,
             )
             
             dashboard_id = dashboard_result.get('id')
+            record_definition_hash(workspace_client, dashboard_id, definition_parts)
             print(f"✅ Successfully created dashboard '{dashboard_title}' (ID: {dashboard_id})")
             
             return dashboard_result
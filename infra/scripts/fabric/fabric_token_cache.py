@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Fabric Token Cache Module
+
+This module provides a shared, thread-safe access token cache for all Azure clients used by
+the deployment scripts. Every AzureCliCredential.get_token() call shells out to
+"az account get-access-token", which takes seconds, so the Fabric, Graph, Kusto and Event Hub
+clients all share a single credential that caches tokens per scope.
+
+Tokens are refreshed in a background thread once they get close to expiry, so callers keep
+using the current token instead of blocking on the Azure CLI. Optionally, tokens can be
+persisted so separate processes of one deployment reuse them. Persisted tokens are encrypted
+with the platform secret store through msal-extensions (DPAPI on Windows, Keychain on macOS,
+libsecret on Linux); where none is available tokens are only cached in memory. They are
+stored per Azure CLI account (user and tenant), so after "az login" as another account the
+previous account's tokens are not used, and every write merges with the tokens other
+processes persisted meanwhile, under a file lock.
+
+Usage:
+    from fabric_token_cache import get_shared_credential
+    credential = get_shared_credential()
+
+    # Offline runs against fabric_mock_server.py
+    set_shared_credential(StaticTokenCredential())
+
+    python fabric_token_cache.py --clear
+
+Environment Variables:
+    FABRIC_TOKEN_CACHE_PERSIST - Set to "true" to persist tokens to disk across processes
+    FABRIC_TOKEN_CACHE_PATH - Custom path of the persisted token cache
+        (defaults to "~/.azure/fabric_token_cache.bin")
+    FABRIC_HTTP_CASSETTE_MODE - Set to "replay" (with FABRIC_HTTP_CASSETTE) to use a static token
+"""
+
+import argparse
+import contextvars
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from azure.core.credentials import AccessToken
+from azure.identity import AzureCliCredential
+from msal_extensions import CrossPlatLock, build_encrypted_persistence
+from msal_extensions.persistence import PersistenceNotFound
+
+# Tokens expiring within this window are refreshed in the background
+REFRESH_WINDOW_SEC = 600
+# Tokens expiring within this window are refreshed before being returned
+MIN_VALIDITY_SEC = 120
+
+
+def get_token_cache_path() -> str:
+    """Get the path of the persisted token cache.
+
+    Returns:
+        Absolute path of the cache file
+    """
+    custom_path = os.getenv("FABRIC_TOKEN_CACHE_PATH")
+    if custom_path:
+        return os.path.abspath(custom_path)
+    return os.path.join(os.path.expanduser("~"), ".azure", "fabric_token_cache.bin")
+
+
+def get_azure_cli_account() -> Optional[str]:
+    """Get the account the Azure CLI is logged in with, from its profile file.
+
+    Returns:
+        "{user name}|{tenant ID}" of the default subscription, or None if it cannot be determined
+    """
+    config_dir = os.getenv("AZURE_CONFIG_DIR") or os.path.join(os.path.expanduser("~"), ".azure")
+    try:
+        # The Azure CLI writes its profile with a byte order mark
+        with open(os.path.join(config_dir, "azureProfile.json"), "r", encoding="utf-8-sig") as f:
+            profile = json.load(f)
+    except (OSError, ValueError):
+        return None
+    for subscription in profile.get("subscriptions", []):
+        if subscription.get("isDefault") and subscription.get("user", {}).get("name"):
+            return f"{subscription['user']['name'].lower()}|{subscription.get('tenantId', '')}"
+    return None
+
+
+def is_cassette_replayed() -> bool:
+    """Check whether HTTP traffic is replayed from a cassette, which needs no real tokens."""
+    return bool(os.getenv("FABRIC_HTTP_CASSETTE")) and os.getenv("FABRIC_HTTP_CASSETTE_MODE", "").lower() == "replay"
+
+
+def is_token_cache_persisted() -> bool:
+    """Check whether tokens should be persisted to disk."""
+    return os.getenv("FABRIC_TOKEN_CACHE_PERSIST", "").lower() == "true"
+
+
+class StaticTokenCredential:
+    """
+    Credential returning a fixed access token, for running the deployment scripts offline.
+
+    Implements the azure-core TokenCredential protocol (get_token). The mock server and
+    cassette replay accept any bearer token, so no Azure CLI login is needed.
+    """
+
+    def __init__(self, token: str = "mock-token", lifetime_sec: int = 3600):
+        self.token = token
+        self.lifetime_sec = lifetime_sec
+
+    def get_token(self, *scopes: str, **kwargs) -> AccessToken:
+        return AccessToken(self.token, int(time.time()) + self.lifetime_sec)
+
+
+class CachedTokenCredential:
+    """
+    Azure credential wrapper that caches access tokens per scope.
+
+    Implements the azure-core TokenCredential protocol (get_token), so it can be passed to
+    any Azure SDK client in place of the wrapped credential.
+    """
+
+    def __init__(self,
+                 credential: Optional[Any] = None,
+                 cache_path: Optional[str] = None,
+                 account: Optional[str] = None,
+                 refresh_window_sec: int = REFRESH_WINDOW_SEC,
+                 min_validity_sec: int = MIN_VALIDITY_SEC):
+        """
+        Initialize the CachedTokenCredential.
+
+        Args:
+            credential: Azure credential to acquire tokens with (defaults to AzureCliCredential)
+            cache_path: Optional path of an encrypted file to persist tokens to (None keeps them in memory)
+            account: Identity the credential acquires tokens for, which persisted tokens are stored
+                under; tokens are only persisted when it is known
+            refresh_window_sec: Time before expiry at which tokens are refreshed in the background
+            min_validity_sec: Minimum remaining validity of a token returned to callers
+        """
+        self._credential = credential or AzureCliCredential()
+        self.cache_path = cache_path if account else None
+        self.account = account
+        self.refresh_window_sec = refresh_window_sec
+        self.min_validity_sec = min_validity_sec
+        self._tokens: Dict[str, AccessToken] = {}
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._scope_locks: Dict[str, threading.Lock] = {}
+        self._persistence = self._open_persistence() if self.cache_path else None
+        if self._persistence:
+            self._tokens.update(self._load_persisted_tokens())
+
+    def _get_cache_key(self, scopes: Tuple[str, ...], tenant_id: Optional[str]) -> str:
+        return f"{tenant_id or ''}|{' '.join(sorted(scopes))}"
+
+    def _get_scope_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._scope_locks.setdefault(key, threading.Lock())
+
+    def get_token(self, *scopes: str, claims: Optional[str] = None, tenant_id: Optional[str] = None, **kwargs) -> AccessToken:
+        """
+        Get an access token for the given scopes, using the cache when possible.
+
+        Args:
+            scopes: Scopes to request (e.g., "https://api.fabric.microsoft.com/.default")
+            claims: Additional claims from a claims challenge (always bypasses the cache)
+            tenant_id: Optional tenant to request the token for
+
+        Returns:
+            AccessToken with token and expires_on
+        """
+        if claims:
+            return self._credential.get_token(*scopes, claims=claims, tenant_id=tenant_id, **kwargs)
+
+        key = self._get_cache_key(scopes, tenant_id)
+        token = self._tokens.get(key)
+        remaining = token.expires_on - time.time() if token else 0
+
+        if remaining > self.refresh_window_sec:
+            return token
+
+        if remaining > self.min_validity_sec:
+            self._start_background_refresh(key, scopes, tenant_id, kwargs)
+            return token
+
+        # Missing or about to expire - refresh synchronously, once per scope
+        with self._get_scope_lock(key):
+            token = self._tokens.get(key)
+            if token and token.expires_on - time.time() > self.min_validity_sec:
+                return token
+            return self._refresh(key, scopes, tenant_id, kwargs)
+
+    def _refresh(self, key: str, scopes: Tuple[str, ...], tenant_id: Optional[str], kwargs: Dict[str, Any]) -> AccessToken:
+        """Acquire a new token from the wrapped credential and store it."""
+        if tenant_id:
+            kwargs = {**kwargs, 'tenant_id': tenant_id}
+        token = self._credential.get_token(*scopes, **kwargs)
+        with self._lock:
+            self._tokens[key] = token
+        if self._persistence:
+            self._persist_tokens()
+        return token
+
+    def _start_background_refresh(self, key: str, scopes: Tuple[str, ...], tenant_id: Optional[str], kwargs: Dict[str, Any]) -> None:
+        """Refresh a token in a daemon thread unless a refresh for it is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                with self._get_scope_lock(key):
+                    self._refresh(key, scopes, tenant_id, kwargs)
+            except Exception as e:
+                # The current token is still valid - the next call retries synchronously if needed
+                print(f"⚠️  Background token refresh failed: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=contextvars.copy_context().run, args=(refresh,), name="token-refresh", daemon=True).start()
+
+    def _open_persistence(self) -> Optional[Any]:
+        """Open the encrypted token store, or return None if the platform has no secret store."""
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), mode=0o700, exist_ok=True)
+            return build_encrypted_persistence(self.cache_path)
+        except Exception as e:
+            # Never fall back to plaintext - tokens stay cached in memory
+            print(f"⚠️  Encrypted token storage is not available, tokens are not persisted: {e}")
+            return None
+
+    def _read_persisted_entries(self) -> Dict[str, Dict[str, Any]]:
+        """Read the persisted tokens of all accounts (the caller holds the file lock)."""
+        try:
+            return json.loads(self._persistence.load() or "{}")
+        except PersistenceNotFound:
+            return {}
+        except Exception as e:
+            print(f"⚠️  Ignoring unreadable token cache {self.cache_path}: {e}")
+            return {}
+
+    def _load_persisted_tokens(self) -> Dict[str, AccessToken]:
+        """Load the unexpired persisted tokens of this credential's account."""
+        with CrossPlatLock(f"{self.cache_path}.lock"):
+            entries = self._read_persisted_entries().get(self.account, {})
+        now = time.time()
+        return {
+            key: AccessToken(entry["token"], int(entry["expires_on"]))
+            for key, entry in entries.items()
+            if entry.get("expires_on", 0) - now > self.min_validity_sec
+        }
+
+    def _persist_tokens(self) -> None:
+        """Merge this credential's unexpired tokens into the encrypted store."""
+        now = time.time()
+        with self._lock:
+            entries = {
+                key: {"token": token.token, "expires_on": token.expires_on}
+                for key, token in self._tokens.items()
+                if token.expires_on > now
+            }
+        try:
+            with CrossPlatLock(f"{self.cache_path}.lock"):
+                accounts = {}
+                for account, account_entries in self._read_persisted_entries().items():
+                    unexpired = {key: entry for key, entry in account_entries.items() if entry.get("expires_on", 0) > now}
+                    if unexpired:
+                        accounts[account] = unexpired
+                accounts[self.account] = {**accounts.get(self.account, {}), **entries}
+                self._persistence.save(json.dumps(accounts))
+        except Exception as e:
+            # Persistence is only an optimization - tokens stay cached in memory
+            print(f"⚠️  Could not persist token cache: {e}")
+
+    def clear(self) -> None:
+        """Drop all cached tokens, including the persisted ones of every account."""
+        with self._lock:
+            self._tokens.clear()
+        if self._persistence:
+            with CrossPlatLock(f"{self.cache_path}.lock"):
+                self._persistence.save("{}")
+
+    def close(self) -> None:
+        """Close the wrapped credential."""
+        if hasattr(self._credential, "close"):
+            self._credential.close()
+
+
+_shared_credential = None
+_shared_credential_lock = threading.Lock()
+
+
+def get_shared_credential() -> CachedTokenCredential:
+    """Get the process-wide cached credential, creating it on first use.
+
+    Returns:
+        CachedTokenCredential wrapping an AzureCliCredential (a static token when replaying
+        an HTTP cassette)
+    """
+    global _shared_credential
+    with _shared_credential_lock:
+        if _shared_credential is None:
+            if is_cassette_replayed():
+                _shared_credential = CachedTokenCredential(credential=StaticTokenCredential())
+            else:
+                cache_path = None
+                account = None
+                if is_token_cache_persisted():
+                    cache_path = get_token_cache_path()
+                    account = get_azure_cli_account()
+                    if not account:
+                        print("⚠️  Could not determine the Azure CLI account, tokens are not persisted")
+                _shared_credential = CachedTokenCredential(cache_path=cache_path, account=account)
+        return _shared_credential
+
+
+def set_shared_credential(credential: Any) -> CachedTokenCredential:
+    """Replace the process-wide credential, e.g. with a static token for offline runs.
+
+    Args:
+        credential: Azure credential to acquire tokens with
+
+    Returns:
+        CachedTokenCredential wrapping the given credential
+    """
+    global _shared_credential
+    with _shared_credential_lock:
+        _shared_credential = CachedTokenCredential(credential=credential)
+        return _shared_credential
+
+
+def main():
+    """Main function to clear the persisted token cache."""
+    parser = argparse.ArgumentParser(description="Manage the persisted Azure token cache used by the deployment scripts")
+    parser.add_argument("--clear", action="store_true", help="Delete the persisted token cache (e.g., after switching accounts)")
+    args = parser.parse_args()
+
+    cache_path = get_token_cache_path()
+    if args.clear:
+        if os.path.exists(cache_path):
+            try:
+                with CrossPlatLock(f"{cache_path}.lock"):
+                    build_encrypted_persistence(cache_path).save("{}")
+            except Exception as e:
+                print(f"⚠️  Could not clear the encrypted token store: {e}")
+            os.remove(cache_path)
+            print(f"✅ Removed token cache: {cache_path}")
+        else:
+            print(f"ℹ️  No token cache found at: {cache_path}")
+        return
+
+    print(f"📄 Token cache file: {cache_path}")
+    print(f"   Persistence enabled: {is_token_cache_persisted()}")
+    print(f"   Azure CLI account: {get_azure_cli_account() or 'unknown'}")
+
+
+if __name__ == "__main__":
+    main()
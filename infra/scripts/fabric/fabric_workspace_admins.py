@@ -7,6 +7,8 @@ Supports both user principal names (UPNs) and service principal object IDs via C
 
 Features:
 - Add administrators by UPN (user@contoso.com) or GUID with Graph API resolution
+- Resolve all administrators with batched Graph API requests ($batch, 20 lookups per request)
+- Add role assignments concurrently
 - Skip existing administrators to avoid duplicates
 - Comprehensive error handling and reporting
 - Support for both individual users and service principals
@@ -22,11 +24,16 @@ Requirements:
 """
 
 import argparse
+import contextvars
 import sys
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from fabric_api import FabricApiClient, FabricWorkspaceApiClient, FabricApiError
 from graph_api import create_graph_client, GraphApiError
 
+# Maximum number of role assignments added at once
+MAX_PARALLEL_ASSIGNMENTS = 8
+
 ####################
 # Helper Functions #
 ####################
@@ -69,23 +76,61 @@ def detect_principal_type(admin_identifier, graph_client=None):
         
         return principal_type, object_id, principal_data
         
-    except GraphApiError as e:
+    except Exception as e:
+        return get_fallback_principal(admin_identifier, e)
+
+def get_fallback_principal(admin_identifier, error):
+    """
+    Get the principal type of an identifier that could not be resolved with the Graph API.
+    
+    Args:
+        admin_identifier: User UPN, object ID (GUID), or application ID (GUID)
+        error: Exception raised by the Graph API lookup
+    
+    Returns:
+        Tuple of (principal_type, object_id, principal_data), with principal_type "Unknown"
+        if both ServicePrincipal and User should be tried
+    """
+    print(f"  ⚠️ WARNING: Graph API lookup failed for '{admin_identifier}': {str(error)}")
+    if isinstance(error, GraphApiError):
         # Convert Graph API errors to Unknown type for fallback handling
-        print(f"  ⚠️ WARNING: Graph API lookup failed for '{admin_identifier}': {str(e)}")
         print(f"     Will try both ServicePrincipal and User types...")
         return "Unknown", admin_identifier, {"id": admin_identifier, "displayName": "Unknown"}
+    
+    # Fallback to original logic if Graph API is not available
+    print(f"     Falling back to basic identifier pattern detection...")
+    if is_valid_guid(admin_identifier):
+        return "ServicePrincipal", admin_identifier, {"id": admin_identifier, "displayName": "Unknown"}
+    elif "@" in admin_identifier and "." in admin_identifier:
+        return "User", admin_identifier, {"userPrincipalName": admin_identifier, "displayName": "Unknown"}
+    else:
+        print(f"     Unable to determine principal type - will try both ServicePrincipal and User...")
+        return "Unknown", admin_identifier, {"id": admin_identifier, "displayName": "Unknown"}
+
+def resolve_admin_principals(admin_identifiers, graph_client=None):
+    """
+    Resolve several administrators with batched Graph API requests.
+    
+    Args:
+        admin_identifiers: List of user UPNs, object IDs (GUIDs), or application IDs (GUIDs)
+        graph_client: Optional Graph API client (pattern detection is used without one)
+    
+    Returns:
+        Dictionary mapping each identifier to a tuple of (principal_type, object_id, principal_data)
+    """
+    if not admin_identifiers:
+        return {}
+    try:
+        if graph_client is None:
+            raise RuntimeError("Graph API client is not available")
+        print(f"    🔎 Resolving {len(admin_identifiers)} administrator(s) with batched Graph API requests...")
+        results = graph_client.resolve_principals(admin_identifiers)
     except Exception as e:
-        # Fallback to original logic if Graph API is not available
-        print(f"  ⚠️ WARNING: Graph API lookup failed for '{admin_identifier}': {str(e)}")
-        print(f"     Falling back to basic identifier pattern detection...")
-        
-        if is_valid_guid(admin_identifier):
-            return "ServicePrincipal", admin_identifier, {"id": admin_identifier, "displayName": "Unknown"}
-        elif "@" in admin_identifier and "." in admin_identifier:
-            return "User", admin_identifier, {"userPrincipalName": admin_identifier, "displayName": "Unknown"}
-        else:
-            print(f"     Unable to determine principal type - will try both ServicePrincipal and User...")
-            return "Unknown", admin_identifier, {"id": admin_identifier, "displayName": "Unknown"}
+        # A failed batch request applies the same fallback to every identifier
+        results = {identifier: e for identifier in admin_identifiers}
+    
+    return {identifier: result if isinstance(result, tuple) else get_fallback_principal(identifier, result)
+            for identifier, result in results.items()}
 
 def get_existing_admin_principals(workspace_client):
     """Get set of existing admin principal IDs for duplicate checking."""
@@ -118,7 +163,7 @@ def get_existing_admin_principals(workspace_client):
         print("       Will proceed but may create duplicates")
         return set()
 
-def add_workspace_admin(workspace_client, admin_identifier, existing_principals, graph_client):
+def add_workspace_admin(workspace_client, admin_identifier, existing_principals, graph_client, resolved_principal=None):
     """Add a single workspace administrator with simplified error handling."""
     # Check if already exists
     if admin_identifier.lower() in existing_principals:
@@ -126,8 +171,8 @@ def add_workspace_admin(workspace_client, admin_identifier, existing_principals,
         return {'status': 'skipped', 'message': 'Already exists'}
     
     try:
-        # Try to resolve principal type using Graph API
-        principal_type, object_id, principal_data = detect_principal_type(admin_identifier, graph_client)
+        # Try to resolve principal type using Graph API, unless already resolved in a batch
+        principal_type, object_id, principal_data = resolved_principal or detect_principal_type(admin_identifier, graph_client)
         
         if object_id.lower() in existing_principals:
             print(f"    ⏭️ Skipping '{admin_identifier}' - already a workspace administrator")
@@ -234,7 +279,7 @@ def setup_workspace_administrators(workspace_client: FabricWorkspaceApiClient, f
         return {'added': 0, 'skipped': 0, 'failed': 0, 'errors': []}
     
     # Split by comma and clean up whitespace
-    admins_to_add = [admin.strip() for admin in fabric_admins_csv.split(',') if admin.strip()]
+    admins_to_add = list(dict.fromkeys(admin.strip() for admin in fabric_admins_csv.split(',') if admin.strip()))
     
     if not admins_to_add:
         print("ℹ️ No valid administrators found - skipping workspace administrator setup")
@@ -256,12 +301,36 @@ def setup_workspace_administrators(workspace_client: FabricWorkspaceApiClient, f
     
     workspace_stats = {'added': 0, 'skipped': 0, 'failed': 0, 'errors': []}
     
-    # Process administrators (UPNs and object IDs with Graph API resolution)
+    # Resolve all administrators not yet assigned with batched Graph API requests
+    pending_admins = [admin for admin in admins_to_add if admin.lower() not in existing_admin_principals]
+    resolved_principals = resolve_admin_principals(pending_admins, graph_client)
+    
+    # Identifiers resolving to the same principal (e.g. UPN and object ID) are added once
+    principal_owners = {}
+    duplicate_admins = set()
+    for admin_identifier in pending_admins:
+        object_id = resolved_principals[admin_identifier][1].lower()
+        if object_id in principal_owners:
+            duplicate_admins.add(admin_identifier)
+        else:
+            principal_owners[object_id] = admin_identifier
+    
+    # Process administrators concurrently (UPNs and object IDs with Graph API resolution)
     print(f"    👥 Adding administrators...")
     
-    for admin_identifier in admins_to_add:
-        result = add_workspace_admin(workspace_client, admin_identifier, existing_admin_principals, graph_client)
-        
+    def add_admin(admin_identifier):
+        if admin_identifier in duplicate_admins:
+            print(f"    ⏭️ Skipping '{admin_identifier}' - same principal as another listed administrator")
+            return {'status': 'skipped', 'message': 'Duplicate of another listed administrator'}
+        return add_workspace_admin(workspace_client, admin_identifier, existing_admin_principals, graph_client,
+                                   resolved_principal=resolved_principals.get(admin_identifier))
+    
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_ASSIGNMENTS) as executor:
+        futures = [executor.submit(contextvars.copy_context().run, add_admin, admin_identifier)
+                   for admin_identifier in admins_to_add]
+        results = [future.result() for future in futures]
+    
+    for admin_identifier, result in zip(admins_to_add, results):
         if result['status'] == 'success':
             workspace_stats['added'] += 1
         elif result['status'] == 'skipped':
@@ -16,6 +16,7 @@ Requirements:
 
 import argparse
 import sys
+from typing import Dict, List, Tuple
 from fabric_api import FabricApiClient, FabricApiError
 
 def lookup_workspace(fabric_client: FabricApiClient, workspace_name: str):
@@ -54,6 +55,35 @@ def lookup_workspace(fabric_client: FabricApiClient, workspace_name: str):
         print(f"❌ Error: {e}")
         return None
 
+def lookup_workspaces(fabric_client: FabricApiClient, workspace_names: List[str]) -> Dict[str, Tuple[str, str]]:
+    """
+    Look up several workspaces by name with a single scan of the workspace list.
+    
+    Args:
+        fabric_client: Authenticated FabricApiClient instance
+        workspace_names: Workspace names to look up
+        
+    Returns:
+        Dictionary mapping each found name to a tuple of (workspace_id, workspace_display_name)
+        
+    Raises:
+        FabricApiError: If listing the workspaces fails
+    """
+    print(f"Looking up {len(workspace_names)} workspace(s)")
+    targets = {name.lower(): name for name in workspace_names}
+    found = {}
+    for workspace in fabric_client.paginate("workspaces"):
+        name = targets.get(workspace.get('displayName', '').lower())
+        if name and name not in found:
+            found[name] = (workspace['id'], workspace['displayName'])
+    
+    for name in workspace_names:
+        if name in found:
+            print(f"✅ Found workspace: '{found[name][1]}' (ID: {found[name][0]})")
+        else:
+            print(f"   Workspace '{name}' not found")
+    return found
+
 def delete_workspace(fabric_client: FabricApiClient, workspace_id: str):
     """
     Delete a Fabric workspace by ID.
@@ -6,10 +6,14 @@ It focuses on user and service principal lookups to support identity management
 in the Real-Time Intelligence Operations Solution Accelerator project.
 
 Core Features:
-- Authentication management with Azure CLI credentials
+- Authentication management with shared, cached Azure CLI credentials
 - User and service principal lookups by UPN, email, or object ID
 - Principal type detection and object ID resolution
+- JSON batching ($batch) of up to 20 requests per call, used to resolve many principals at once
+- Persistent cache of resolved principals, including negative results (see graph_principal_cache.py)
 - HTTP request handling with error management
+- Optional HTTP record/replay of all requests (see fabric_http_cassette.py)
+- Optional timing spans of requests and retries (see fabric_profiler.py)
 
 Dependencies:
     pip install requests azure-identity
@@ -17,6 +21,7 @@ Dependencies:
 Author: Generated for Real-Time Intelligence Operations Solution Accelerator
 """
 
+import base64
 import json
 import requests
 import time
@@ -24,6 +29,14 @@ import uuid
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Union, Any, Tuple
 from azure.identity import AzureCliCredential, DefaultAzureCredential
+from fabric_token_cache import get_shared_credential
+from fabric_http_cassette import http_request
+from fabric_profiler import profile_span
+from graph_principal_cache import PrincipalCache, get_shared_principal_cache, to_principal
+
+# Maximum number of requests in one JSON batch
+# https://learn.microsoft.com/en-us/graph/json-batching
+MAX_BATCH_SIZE = 20
 
 
 class GraphApiError(Exception):
@@ -47,22 +60,27 @@ class GraphApiClient:
                  api_url: str = "https://graph.microsoft.com/v1.0",
                  resource_url: str = "https://graph.microsoft.com",
                  credential: Optional[Any] = None,
-                 timeout_sec: int = 60):
+                 timeout_sec: int = 60,
+                 principal_cache: Optional[PrincipalCache] = None):
         """
         Initialize the Graph API client.
         
         Args:
             api_url: Base URL for Graph API
             resource_url: Resource URL for authentication scope
-            credential: Azure credential object (defaults to AzureCliCredential)
+            credential: Azure credential object (defaults to the shared cached AzureCliCredential)
             timeout_sec: Default timeout for API requests
+            principal_cache: Cache of resolved principals (defaults to the shared persistent cache,
+                None when it is disabled)
         """
         self.api_url = api_url.rstrip('/')
         self.resource_url = resource_url
         self.timeout_sec = timeout_sec
-        self._credential = credential or AzureCliCredential()
+        self.principal_cache = principal_cache or get_shared_principal_cache()
+        self._credential = credential or get_shared_credential()
         self._token = None
         self._token_expiry = None
+        self._tenant_id = None
     
     def _log(self, message: str, level: str = "INFO") -> None:
         """Log message with timestamp."""
@@ -91,6 +109,39 @@ class GraphApiClient:
         except Exception as e:
             raise GraphApiError(f"Failed to get authentication token: {str(e)}")
     
+    def _get_tenant_id(self) -> str:
+        """
+        Get the tenant of the signed-in identity, from the tid claim of the access token.
+        
+        Cached principals are keyed by tenant, so a cache entry never resolves an identifier
+        in another tenant.
+        
+        Returns:
+            Tenant ID, or "" if the token carries no tenant (e.g., the static token of offline runs)
+        """
+        if self._tenant_id is None:
+            try:
+                payload = self._get_auth_token().split(".")[1]
+                claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+                self._tenant_id = claims.get("tid", "")
+            except (IndexError, ValueError):
+                self._tenant_id = ""
+        return self._tenant_id
+    
+    def _get_principal_cache(self) -> Tuple[Optional[PrincipalCache], str]:
+        """
+        Get the principal cache and the tenant its entries are keyed by.
+        
+        Returns:
+            Tuple of (principal cache, tenant ID); the cache is None when it is disabled or the
+            token carries no tenant (e.g., the static token of offline and mock server runs), so
+            principals of such runs are never cached
+        """
+        if not self.principal_cache:
+            return None, ""
+        tenant_id = self._get_tenant_id()
+        return (self.principal_cache if tenant_id else None), tenant_id
+    
     def _make_request(self,
                      uri: str,
                      method: str = "GET",
@@ -135,20 +186,22 @@ class GraphApiClient:
             data = json.dumps(data)
         
         try:
-            response = requests.request(
-                method=method,
-                url=url,
-                headers=request_headers,
-                data=data,
-                timeout=timeout or self.timeout_sec
-            )
+            with profile_span(f"{method} {url}", "http"):
+                response = http_request(
+                    method=method,
+                    url=url,
+                    headers=request_headers,
+                    data=data,
+                    timeout=timeout or self.timeout_sec
+                )
             
             # Handle rate limiting
             if response.status_code == 429:
                 retry_after = int(response.headers.get('Retry-After', 60))
                 if retry_count < max_retries:
                     self._log(f"Rate limited. Retrying after {retry_after} seconds (attempt {retry_count + 1}/{max_retries})")
-                    time.sleep(retry_after)
+                    with profile_span(f"Retry-After {retry_after}s", "throttle", uri=uri):
+                        time.sleep(retry_after)
                     return self._make_request(uri, method, data, headers, timeout, max_retries, retry_count + 1)
                 else:
                     raise GraphApiError(f"Rate limit exceeded and max retries reached", 429, response.json() if response.content else None)
@@ -174,7 +227,8 @@ class GraphApiClient:
                 if retry_count < max_retries:
                     wait_time = min(2 ** retry_count, 60)  # Exponential backoff, max 60s
                     self._log(f"Server error {response.status_code}. Retrying after {wait_time} seconds (attempt {retry_count + 1}/{max_retries})")
-                    time.sleep(wait_time)
+                    with profile_span(f"Backoff {wait_time}s", "retry_wait", uri=uri):
+                        time.sleep(wait_time)
                     return self._make_request(uri, method, data, headers, timeout, max_retries, retry_count + 1)
                 else:
                     error_data = response.json() if response.content else {}
@@ -304,6 +358,138 @@ class GraphApiClient:
                 return None
             raise
     
+    # Batch operations
+    def batch(self, batch_requests: List[Dict[str, Any]], max_retries: int = 3) -> Dict[str, Dict[str, Any]]:
+        """
+        Send requests as JSON batches of up to MAX_BATCH_SIZE requests each.
+        
+        Requests of a batch that are throttled (429) are sent again in a later batch after
+        the longest Retry-After of the batch.
+        
+        Args:
+            batch_requests: Requests with unique "id", "method" and "url" (relative to the
+                API version, e.g. "/users/user@contoso.com"), and optionally "body" and "headers"
+            max_retries: Maximum number of retries of throttled requests
+            
+        Returns:
+            Dictionary mapping request IDs to their response ({"id", "status", "headers", "body"})
+            
+        Raises:
+            GraphApiError: If a batch request fails
+        """
+        responses = {}
+        pending = list(batch_requests)
+        for attempt in range(max_retries + 1):
+            throttled = []
+            retry_after = 0
+            for start in range(0, len(pending), MAX_BATCH_SIZE):
+                chunk = pending[start:start + MAX_BATCH_SIZE]
+                response = self._make_request("$batch", method="POST", data={"requests": chunk})
+                by_id = {request["id"]: request for request in chunk}
+                for item in response.json().get("responses", []):
+                    if item.get("status") == 429 and attempt < max_retries:
+                        throttled.append(by_id[item["id"]])
+                        headers = item.get("headers") or {}
+                        retry_after = max(retry_after, int(headers.get("Retry-After", 5)))
+                    else:
+                        responses[item["id"]] = item
+            if not throttled:
+                break
+            self._log(f"{len(throttled)} batched request(s) throttled. Retrying after {retry_after} seconds (attempt {attempt + 1}/{max_retries})")
+            with profile_span(f"Retry-After {retry_after}s", "throttle", uri="$batch"):
+                time.sleep(retry_after)
+            pending = throttled
+        return responses
+    
+    def resolve_principals(self, identifiers: List[str]) -> Dict[str, Union[Tuple[str, str, Dict[str, Any]], GraphApiError]]:
+        """
+        Resolve several principal identifiers with JSON batches instead of one request per lookup.
+        
+        Each identifier is resolved in the same order as resolve_principal(), one lookup per
+        round: all identifiers are looked up together in the first round, identifiers that were
+        not found move on to their next lookup in the next round (at most three rounds).
+        Identifiers in the principal cache are not looked up at all.
+        
+        Args:
+            identifiers: User UPNs, object IDs (GUIDs) or application IDs (GUIDs)
+            
+        Returns:
+            Dictionary mapping each identifier to a tuple of (principal_type, object_id, principal_data),
+            or to the GraphApiError if it could not be resolved
+            
+        Raises:
+            GraphApiError: If a batch request fails
+        """
+        def get_lookups(identifier: str) -> List[Tuple[str, str]]:
+            try:
+                uuid.UUID(identifier)
+            except ValueError:
+                return [("User", f"/users/{identifier}")] if "@" in identifier else []
+            return [
+                ("ServicePrincipal", f"/servicePrincipals/{identifier}"),
+                ("User", f"/users/{identifier}"),
+                ("ServicePrincipal", f"/servicePrincipals?$filter=appId eq '{identifier}'"),
+            ]
+        
+        identifiers = list(dict.fromkeys(identifier.strip() for identifier in identifiers))
+        lookups = {identifier: get_lookups(identifier) for identifier in identifiers}
+        results: Dict[str, Union[Tuple[str, str, Dict[str, Any]], GraphApiError]] = {}
+        
+        # Known principals (and known unknowns) are served from the cache without any request
+        cached = set()
+        principal_cache, tenant_id = self._get_principal_cache()
+        for identifier in identifiers:
+            entry = principal_cache.get(identifier, tenant_id) if principal_cache else None
+            if entry:
+                results[identifier] = to_principal(entry) if entry["found"] else self._get_unresolved_error(identifier, cached=True)
+                cached.add(identifier)
+        
+        round_number = 0
+        while True:
+            current = {str(index): identifier for index, identifier in enumerate(identifiers)
+                       if identifier not in results and round_number < len(lookups[identifier])}
+            if not current:
+                break
+            responses = self.batch([
+                {"id": request_id, "method": "GET", "url": lookups[identifier][round_number][1]}
+                for request_id, identifier in current.items()
+            ])
+            for request_id, identifier in current.items():
+                principal_type = lookups[identifier][round_number][0]
+                response = responses.get(request_id, {})
+                status = response.get("status")
+                body = response.get("body") or {}
+                if status == 200:
+                    # appId lookups return a filtered collection
+                    data = (body.get("value") or [None])[0] if "value" in body else body
+                    if data:
+                        results[identifier] = (principal_type, data["id"], data)
+                elif status != 404:
+                    message = body.get("error", {}).get("message", f"HTTP {status}")
+                    results[identifier] = GraphApiError(f"Client error: {message}", status, body)
+            round_number += 1
+        
+        for identifier in identifiers:
+            if identifier not in results:
+                results[identifier] = self._get_unresolved_error(identifier)
+                if principal_cache:
+                    principal_cache.put_not_found(identifier, tenant_id)
+            elif identifier not in cached and isinstance(results[identifier], tuple) and principal_cache:
+                principal_cache.put(identifier, tenant_id, results[identifier][0], results[identifier][2])
+        if principal_cache:
+            principal_cache.save()
+        
+        resolved = sum(1 for result in results.values() if isinstance(result, tuple))
+        self._log(f"Resolved {resolved} of {len(identifiers)} principal(s) ({len(cached)} cached) in {round_number} batch round(s)")
+        return results
+    
+    def _get_unresolved_error(self, identifier: str, cached: bool = False) -> GraphApiError:
+        """Get the error raised for an identifier that matches no user or service principal."""
+        return GraphApiError(f"Unable to resolve principal identifier '{identifier}'{' (cached)' if cached else ''}. "
+                             f"Ensure it's a valid user UPN (user@domain.com), "
+                             f"user object ID (GUID), service principal object ID (GUID), "
+                             f"or application ID (GUID).")
+    
     # Combined operations
     def resolve_principal(self, identifier: str) -> Tuple[str, str, Dict[str, Any]]:
         """
@@ -338,34 +524,52 @@ class GraphApiClient:
         # Clean the identifier
         identifier = identifier.strip()
         
+        # Known principals (and known unknowns) are served from the cache
+        principal_cache, tenant_id = self._get_principal_cache()
+        entry = principal_cache.get(identifier, tenant_id) if principal_cache else None
+        if entry:
+            if not entry["found"]:
+                raise self._get_unresolved_error(identifier, cached=True)
+            return to_principal(entry)
+        
+        resolved = None
+        
         # Strategy 1: If it looks like a GUID, try service principal first
         if is_valid_guid(identifier):
             # Try as service principal object ID
             sp_data = self.get_service_principal_by_id(identifier)
             if sp_data:
-                return "ServicePrincipal", sp_data['id'], sp_data
+                resolved = "ServicePrincipal", sp_data['id'], sp_data
             
             # Try as user object ID
-            user_data = self.get_user_by_id(identifier)
-            if user_data:
-                return "User", user_data['id'], user_data
+            if not resolved:
+                user_data = self.get_user_by_id(identifier)
+                if user_data:
+                    resolved = "User", user_data['id'], user_data
             
             # Try as application ID for service principal
-            sp_data = self.get_service_principal_by_app_id(identifier)
-            if sp_data:
-                return "ServicePrincipal", sp_data['id'], sp_data
+            if not resolved:
+                sp_data = self.get_service_principal_by_app_id(identifier)
+                if sp_data:
+                    resolved = "ServicePrincipal", sp_data['id'], sp_data
         
         # Strategy 2: If it contains '@', try as user UPN
         elif "@" in identifier:
             user_data = self.get_user_by_upn(identifier)
             if user_data:
-                return "User", user_data['id'], user_data
+                resolved = "User", user_data['id'], user_data
+        
+        if principal_cache:
+            if resolved:
+                principal_cache.put(identifier, tenant_id, resolved[0], resolved[2])
+            else:
+                principal_cache.put_not_found(identifier, tenant_id)
+            principal_cache.save()
+        if resolved:
+            return resolved
         
         # If we get here, the identifier couldn't be resolved
-        raise GraphApiError(f"Unable to resolve principal identifier '{identifier}'. "
-                          f"Ensure it's a valid user UPN (user@domain.com), "
-                          f"user object ID (GUID), service principal object ID (GUID), "
-                          f"or application ID (GUID).")
+        raise self._get_unresolved_error(identifier)
 
 
 # Convenience functions
@@ -374,7 +578,7 @@ def create_graph_client(credential: Optional[Any] = None) -> GraphApiClient:
     Create a new Graph API client.
     
     Args:
-        credential: Azure credential (defaults to AzureCliCredential)
+        credential: Azure credential (defaults to the shared cached AzureCliCredential)
         
     Returns:
         GraphApiClient instance
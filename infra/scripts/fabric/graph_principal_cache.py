@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Graph Principal Cache Module
+
+This module provides a persistent cache of resolved principal identifiers for GraphApiClient.
+Workspace administrators are the same from one deployment to the next, so every identifier
+(UPN, object ID or application ID) that was resolved is stored with its principal type, object
+ID, display name, UPN and application ID. Repeat deployments and the environments of a fleet
+deployment then resolve known principals without calling Graph at all.
+
+Identifiers that could not be resolved are cached as well (negative caching), with a shorter
+time to live, so a misspelled administrator does not cost up to three Graph lookups per run.
+Only "not found" results are cached; throttling and other errors are not.
+
+The cache is a JSON file in the Azure CLI configuration directory, next to the token cache and
+outside the repository, shared by all environments since principals belong to the tenant rather
+than to an environment. Entries are keyed by tenant ID and identifier, so after switching
+tenants the previous tenant's object IDs are never used. Writes merge with the file on disk, so
+concurrent deployment processes do not drop each other's entries. The cache is not used while
+an HTTP cassette is recorded or replayed, so cassettes always contain the Graph lookups, nor
+with tokens that carry no tenant (offline and mock server runs).
+
+Usage:
+    python graph_principal_cache.py --show
+    python graph_principal_cache.py --clear
+
+Environment Variables:
+    FABRIC_PRINCIPAL_CACHE_PATH - Custom path of the cache file
+        (defaults to "graph_principal_cache.json" in $AZURE_CONFIG_DIR or ~/.azure)
+    FABRIC_PRINCIPAL_CACHE_TTL_SEC - Time to live of resolved principals (default: 604800, 7 days; 0 disables the cache)
+    FABRIC_PRINCIPAL_CACHE_NEGATIVE_TTL_SEC - Time to live of identifiers that were not found (default: 3600)
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_TTL_SEC = 7 * 24 * 3600
+DEFAULT_NEGATIVE_TTL_SEC = 3600
+
+
+def get_principal_cache_path() -> str:
+    """Get the path of the principal cache file.
+
+    Returns:
+        Absolute path of the cache file
+    """
+    custom_path = os.getenv("FABRIC_PRINCIPAL_CACHE_PATH")
+    if custom_path:
+        return os.path.abspath(custom_path)
+    config_dir = os.getenv("AZURE_CONFIG_DIR") or os.path.join(os.path.expanduser("~"), ".azure")
+    return os.path.join(config_dir, "graph_principal_cache.json")
+
+
+class PrincipalCache:
+    """
+    Thread-safe TTL cache of resolved principal identifiers, persisted to a JSON file.
+
+    Entries are keyed by tenant ID and lowercased identifier and hold either a resolved
+    principal ("found": true) or a negative result ("found": false).
+    """
+
+    def __init__(self,
+                 cache_path: Optional[str] = None,
+                 ttl_sec: int = DEFAULT_TTL_SEC,
+                 negative_ttl_sec: int = DEFAULT_NEGATIVE_TTL_SEC):
+        """
+        Initialize the PrincipalCache.
+
+        Args:
+            cache_path: Optional path of the cache file (defaults to get_principal_cache_path())
+            ttl_sec: Time to live of resolved principals
+            negative_ttl_sec: Time to live of identifiers that were not found
+        """
+        self.cache_path = cache_path or get_principal_cache_path()
+        self.ttl_sec = ttl_sec
+        self.negative_ttl_sec = negative_ttl_sec
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = set()
+
+    def _load_entries(self) -> Dict[str, Dict[str, Any]]:
+        """Load the cache file (an empty cache if it is missing or unreadable)."""
+        if not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Ignoring unreadable principal cache {self.cache_path}: {e}")
+            return {}
+
+    def _get_entries(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            self._entries = self._load_entries()
+        return self._entries
+
+    def _is_fresh(self, entry: Dict[str, Any], now: float) -> bool:
+        ttl_sec = self.ttl_sec if entry.get("found") else self.negative_ttl_sec
+        return now - entry.get("cached_at", 0) < ttl_sec
+
+    def _get_key(self, identifier: str, tenant_id: str) -> str:
+        return f"{tenant_id.lower()}|{identifier.strip().lower()}"
+
+    def get(self, identifier: str, tenant_id: str) -> Optional[Dict[str, Any]]:
+        """Get the unexpired cache entry of an identifier.
+
+        Args:
+            identifier: User UPN, object ID or application ID
+            tenant_id: Tenant the identifier is resolved in
+
+        Returns:
+            Cache entry ("found" is False for identifiers that were not found), or None if not cached
+        """
+        with self._lock:
+            entry = self._get_entries().get(self._get_key(identifier, tenant_id))
+        if entry and self._is_fresh(entry, time.time()):
+            return entry
+        return None
+
+    def put(self, identifier: str, tenant_id: str, principal_type: str, principal_data: Dict[str, Any]) -> None:
+        """Cache a resolved principal.
+
+        Args:
+            identifier: User UPN, object ID or application ID that was resolved
+            tenant_id: Tenant the identifier was resolved in
+            principal_type: "User" or "ServicePrincipal"
+            principal_data: Principal object from Graph API
+        """
+        self._set(self._get_key(identifier, tenant_id), {
+            "found": True,
+            "principal_type": principal_type,
+            "object_id": principal_data["id"],
+            "display_name": principal_data.get("displayName"),
+            "user_principal_name": principal_data.get("userPrincipalName"),
+            "app_id": principal_data.get("appId"),
+        })
+
+    def put_not_found(self, identifier: str, tenant_id: str) -> None:
+        """Cache an identifier that could not be resolved.
+
+        Args:
+            identifier: User UPN, object ID or application ID that was not found
+            tenant_id: Tenant the identifier was looked up in
+        """
+        self._set(self._get_key(identifier, tenant_id), {"found": False})
+
+    def _set(self, key: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._get_entries()[key] = {**entry, "cached_at": time.time()}
+            self._dirty.add(key)
+
+    def save(self) -> None:
+        """Write new entries to the cache file, merged with entries other processes wrote meanwhile."""
+        with self._lock:
+            if not self._dirty:
+                return
+            now = time.time()
+            entries = {key: entry for key, entry in self._load_entries().items() if self._is_fresh(entry, now)}
+            entries.update({key: self._entries[key] for key in self._dirty})
+            self._entries = entries
+            self._dirty.clear()
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            temp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(entries, f, indent=2, sort_keys=True)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            # The cache is only an optimization - the next run resolves the principals again
+            print(f"⚠️  Could not save principal cache: {e}")
+
+    def clear(self) -> None:
+        """Drop all cached principals, including the cache file."""
+        with self._lock:
+            self._entries = {}
+            self._dirty.clear()
+        if os.path.exists(self.cache_path):
+            os.remove(self.cache_path)
+
+
+def to_principal(entry: Dict[str, Any]) -> Tuple[str, str, Dict[str, Any]]:
+    """Convert a cache entry of a resolved principal to the result of GraphApiClient.resolve_principal().
+
+    Args:
+        entry: Cache entry with "found" set
+
+    Returns:
+        Tuple of (principal_type, object_id, principal_data)
+    """
+    principal_data = {"id": entry["object_id"], "displayName": entry.get("display_name")}
+    if entry.get("user_principal_name"):
+        principal_data["userPrincipalName"] = entry["user_principal_name"]
+    if entry.get("app_id"):
+        principal_data["appId"] = entry["app_id"]
+    return entry["principal_type"], entry["object_id"], principal_data
+
+
+_shared_cache: Optional[PrincipalCache] = None
+_shared_cache_loaded = False
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_principal_cache() -> Optional[PrincipalCache]:
+    """Get the process-wide principal cache, creating it on first use.
+
+    Returns:
+        PrincipalCache, or None if the cache is disabled (TTL of 0, or an HTTP cassette is active)
+    """
+    global _shared_cache, _shared_cache_loaded
+    with _shared_cache_lock:
+        if not _shared_cache_loaded:
+            ttl_sec = int(os.getenv("FABRIC_PRINCIPAL_CACHE_TTL_SEC", DEFAULT_TTL_SEC))
+            if ttl_sec > 0 and not os.getenv("FABRIC_HTTP_CASSETTE"):
+                negative_ttl_sec = int(os.getenv("FABRIC_PRINCIPAL_CACHE_NEGATIVE_TTL_SEC", DEFAULT_NEGATIVE_TTL_SEC))
+                _shared_cache = PrincipalCache(ttl_sec=ttl_sec, negative_ttl_sec=negative_ttl_sec)
+            _shared_cache_loaded = True
+        return _shared_cache
+
+
+def main():
+    """Main function to inspect or clear the principal cache."""
+    parser = argparse.ArgumentParser(description="Manage the cache of principals resolved through Microsoft Graph")
+    parser.add_argument("--show", action="store_true", help="Show the cached principals")
+    parser.add_argument("--clear", action="store_true", help="Delete the cache file")
+    args = parser.parse_args()
+
+    cache = PrincipalCache()
+    if args.clear:
+        if os.path.exists(cache.cache_path):
+            cache.clear()
+            print(f"✅ Removed principal cache: {cache.cache_path}")
+        else:
+            print(f"ℹ️  No principal cache found at: {cache.cache_path}")
+        return
+
+    print(f"📄 Principal cache file: {cache.cache_path}")
+    if args.show:
+        now = time.time()
+        for key, entry in sorted(cache._get_entries().items()):
+            cached_at = datetime.fromtimestamp(entry.get("cached_at", 0)).isoformat(timespec="seconds")
+            state = "" if cache._is_fresh(entry, now) else " (expired)"
+            if entry.get("found"):
+                print(f"   {key}: {entry['principal_type']} {entry['object_id']} ({entry.get('display_name')}), cached {cached_at}{state}")
+            else:
+                print(f"   {key}: not found, cached {cached_at}{state}")
+
+
+if __name__ == "__main__":
+    main()
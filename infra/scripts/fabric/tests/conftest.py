@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The Fabric scripts are flat modules that import each other by name
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -0,0 +1,50 @@
+"""Record/replay tests of fabric_http_cassette against the mock Fabric server."""
+
+import json
+
+import pytest
+
+from fabric_api import FabricApiClient
+from fabric_http_cassette import REDACTED, HttpCassette, _redact_body, load_cassette, set_active_cassette
+from fabric_mock_server import MockFabricConfig, start_mock_server
+from fabric_token_cache import StaticTokenCredential
+
+
+@pytest.fixture
+def mock_server():
+    server = start_mock_server(MockFabricConfig(page_size=2, retry_after_sec=0))
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def no_active_cassette():
+    yield
+    set_active_cassette(None)
+
+
+def test_continuation_tokens_are_not_redacted():
+    body = json.dumps({"value": [], "continuationToken": "abc", "continuationUri": "https://x/?continuationToken=abc", "accessToken": "secret"})
+    redacted = json.loads(_redact_body(body))
+    assert redacted["continuationToken"] == "abc"
+    assert redacted["continuationUri"] == "https://x/?continuationToken=abc"
+    assert redacted["accessToken"] == REDACTED
+
+
+def test_multi_page_listing_replays(mock_server, tmp_path):
+    cassette_path = str(tmp_path / "cassette.jsonl")
+    client = FabricApiClient(api_url=mock_server.api_url, credential=StaticTokenCredential())
+    for index in range(5):
+        client.create_workspace(f"workspace {index}")
+
+    set_active_cassette(HttpCassette(cassette_path, mode="record"))
+    recorded = [workspace["displayName"] for workspace in client.paginate("workspaces")]
+    assert len(recorded) == 5
+    assert sum(1 for entry in load_cassette(cassette_path) if "continuationToken=" in entry["url"]) == 2
+
+    replay = HttpCassette(cassette_path, mode="replay", replay_latency="zero")
+    set_active_cassette(replay)
+    replayed = [workspace["displayName"] for workspace in client.paginate("workspaces")]
+    assert replayed == recorded
+    assert replay.remaining() == 0
@@ -13,8 +13,8 @@ class Asset:
     """Represents a manufacturing asset."""
 
     Id: str
-    SiteId: int
     Name: str
+    SiteId: int
     Type: str
     SerialNumber: str
     MaintenanceStatus: str
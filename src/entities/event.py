@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 
+from entities.schema import get_kql_table_schema
+
 
 @dataclass
 class Event:
@@ -12,13 +14,13 @@ class Event:
     Id: str
     AssetId: str
     ProductId: str
+    Timestamp: datetime
     BatchId: str
     Vibration: Decimal
     Temperature: Decimal
     Humidity: Decimal
     Speed: Decimal
     DefectProbability: Decimal
-    Timestamp: datetime
 
     def to_dict(self) -> dict:
         """Convert event to dictionary representation."""
@@ -38,15 +40,4 @@ class Event:
     @staticmethod
     def get_table_schema() -> str:
         """Get KQL table schema for events."""
-        return """(
-            Id: string,
-            AssetId: string,
-            ProductId: string,
-            Timestamp: datetime,
-            BatchId: string,
-            Vibration: real,
-            Temperature: real,
-            Humidity: real,
-            Speed: real,
-            DefectProbability: real
-        )"""
+        return get_kql_table_schema(Event)
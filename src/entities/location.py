@@ -0,0 +1,20 @@
+"""Location data model for manufacturing operations."""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class Location:
+    """Represents a city where manufacturing sites are located."""
+
+    Id: int
+    City: str
+    Country: str
+
+    def to_dict(self) -> dict:
+        """Convert location to dictionary representation."""
+        return {
+            "Id": self.Id,
+            "City": self.City,
+            "Country": self.Country
+        }
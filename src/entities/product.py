@@ -0,0 +1,38 @@
+"""Product data model for manufacturing operations."""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class Product:
+    """Represents a product manufactured on the assets."""
+
+    Id: str
+    CategoryId: int
+    CategoryName: str
+    Name: str
+    Description: str
+    BrandName: str
+    Number: str
+    Status: str
+    Color: str
+    ListPrice: float
+    UnitCost: float
+    IsoCurrencyCode: str
+
+    def to_dict(self) -> dict:
+        """Convert product to dictionary representation."""
+        return {
+            "Id": self.Id,
+            "CategoryId": self.CategoryId,
+            "CategoryName": self.CategoryName,
+            "Name": self.Name,
+            "Description": self.Description,
+            "BrandName": self.BrandName,
+            "Number": self.Number,
+            "Status": self.Status,
+            "Color": self.Color,
+            "ListPrice": self.ListPrice,
+            "UnitCost": self.UnitCost,
+            "IsoCurrencyCode": self.IsoCurrencyCode
+        }
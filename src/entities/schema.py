@@ -0,0 +1,45 @@
+"""KQL table schema generation from entity dataclasses.
+
+Entity fields are the single source of truth for the Eventhouse table schemas.
+Field order is the table column order, which CSV ingestion relies on, so new
+fields must be appended at the end of the dataclass.
+"""
+
+from dataclasses import fields
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Tuple, get_type_hints
+
+# Sensor metrics are Decimal in the entities but stored as real in KQL
+KQL_TYPES = {
+    str: "string",
+    int: "int",
+    float: "real",
+    Decimal: "real",
+    bool: "bool",
+    datetime: "datetime"
+}
+
+
+def get_kql_columns(entity_type: type) -> List[Tuple[str, str]]:
+    """Get (column name, KQL type) pairs for an entity dataclass."""
+    type_hints = get_type_hints(entity_type)
+    columns = []
+    for field in fields(entity_type):
+        field_type = type_hints[field.name]
+        if field_type not in KQL_TYPES:
+            raise TypeError(
+                f"No KQL type for field '{entity_type.__name__}.{field.name}' "
+                f"of type {field_type}"
+            )
+        columns.append((field.name, KQL_TYPES[field_type]))
+    return columns
+
+
+def get_kql_table_schema(entity_type: type) -> str:
+    """Get the KQL table schema for an entity dataclass."""
+    columns = ",\n".join(
+        f"            {name}: {kql_type}"
+        for name, kql_type in get_kql_columns(entity_type)
+    )
+    return f"(\n{columns}\n        )"
@@ -0,0 +1,22 @@
+"""Site data model for manufacturing operations."""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class Site:
+    """Represents a manufacturing plant at a location."""
+
+    Id: int
+    Name: str
+    LocationId: int
+    PlantType: str
+
+    def to_dict(self) -> dict:
+        """Convert site to dictionary representation."""
+        return {
+            "Id": self.Id,
+            "Name": self.Name,
+            "LocationId": self.LocationId,
+            "PlantType": self.PlantType
+        }
@@ -1,25 +1,113 @@
 """Sample data generation for manufacturing simulation."""
 
+import argparse
+import csv
 import os
 import random
 import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Iterator, Optional
 
 import pandas as pd
 
 from entities.asset import Asset, AssetType
 from entities.event import Event
 
+# Scale profiles for query and ingestion performance testing. Event volume is
+# assets x days x 1440 / mins_between_events, so the larger profiles sample
+# less often to stay within tens of millions of events.
+SCALE_PROFILES = {
+    "S": {
+        "num_locations": 2,
+        "num_sites": 5,
+        "num_assets_per_site": 2,
+        "event_days_back": 90,
+        "mins_between_events": 1
+    },
+    "M": {
+        "num_locations": 5,
+        "num_sites": 20,
+        "num_assets_per_site": 5,
+        "event_days_back": 90,
+        "mins_between_events": 1
+    },
+    "L": {
+        "num_locations": 20,
+        "num_sites": 100,
+        "num_assets_per_site": 10,
+        "event_days_back": 90,
+        "mins_between_events": 5
+    },
+    "XL": {
+        "num_locations": 40,
+        "num_sites": 500,
+        "num_assets_per_site": 20,
+        "event_days_back": 90,
+        "mins_between_events": 15
+    }
+}
+
+# Share of assets that misbehave and the anomaly rate ranges of healthy and
+# misbehaving assets, used when no explicit per-asset rates are given.
+DEFAULT_ANOMALY_RATE_DISTRIBUTION = {
+    "faulty_share": 0.1,
+    "healthy_rate_range": (0.005, 0.03),
+    "faulty_rate_range": (0.05, 0.15)
+}
+
 
-def generate_locations() -> pd.DataFrame:
+def generate_locations(num: int = 1) -> pd.DataFrame:
     """Generate location data."""
     city_country_map = {
-        "Ho Chi Minh City": "Vietnam"
+        "Ho Chi Minh City": "Vietnam",
+        "Monterrey": "Mexico",
+        "Stuttgart": "Germany",
+        "Pune": "India",
+        "Shenzhen": "China",
+        "Detroit": "United States",
+        "Nagoya": "Japan",
+        "Wroclaw": "Poland",
+        "Sao Paulo": "Brazil",
+        "Bangkok": "Thailand",
+        "Ulsan": "South Korea",
+        "Turin": "Italy",
+        "Lyon": "France",
+        "Manchester": "United Kingdom",
+        "Izmir": "Turkey",
+        "Penang": "Malaysia",
+        "Queretaro": "Mexico",
+        "Gothenburg": "Sweden",
+        "Brno": "Czech Republic",
+        "Chennai": "India",
+        "Suzhou": "China",
+        "Columbus": "United States",
+        "Hamamatsu": "Japan",
+        "Eindhoven": "Netherlands",
+        "Curitiba": "Brazil",
+        "Cebu": "Philippines",
+        "Bursa": "Turkey",
+        "Gyor": "Hungary",
+        "Valencia": "Spain",
+        "Toronto": "Canada",
+        "Cordoba": "Argentina",
+        "Durban": "South Africa",
+        "Batam": "Indonesia",
+        "Hai Phong": "Vietnam",
+        "Ningbo": "China",
+        "Greenville": "United States",
+        "Linz": "Austria",
+        "Kaunas": "Lithuania",
+        "Tangier": "Morocco",
+        "Melbourne": "Australia"
     }
+    if num > len(city_country_map):
+        raise ValueError(
+            f"At most {len(city_country_map)} locations are supported, "
+            f"got {num}"
+        )
 
     locations = []
-    for city, country in city_country_map.items():
+    for city, country in list(city_country_map.items())[:num]:
         location_id = len(locations) + 1
         locations.append({
             "Id": location_id,
@@ -143,32 +231,42 @@ def generate_products(num: int) -> pd.DataFrame:
     return pd.DataFrame(products)
 
 
-def generate_historical_events(
+def generate_asset_anomaly_rates(
+    num_assets: int,
+    distribution: Optional[dict] = None
+) -> list[float]:
+    """Draw a per-asset event anomaly rate from a healthy/faulty mix."""
+    distribution = {
+        **DEFAULT_ANOMALY_RATE_DISTRIBUTION,
+        **(distribution or {})
+    }
+    rates = []
+    for _ in range(num_assets):
+        if random.random() < distribution["faulty_share"]:
+            rate_range = distribution["faulty_rate_range"]
+        else:
+            rate_range = distribution["healthy_rate_range"]
+        rates.append(round(random.uniform(*rate_range), 4))
+    return rates
+
+
+def iter_historical_events(
     assets_df: pd.DataFrame,
     products_df: pd.DataFrame,
     asset_event_anomaly_rates: list[float],
-    start_date: datetime,
+    start_date: Optional[datetime],
     days_back: int,
     mins_between_events: int
-) -> pd.DataFrame:
-    """Generate historical event data."""
+) -> Iterator[Event]:
+    """Yield historical events in time order without holding them in memory."""
     if start_date is None:
         start_date = datetime.now(timezone.utc)
 
-    if days_back > 90:
-        print(
-            f"Warning: days_back ({days_back}) exceeds maximum of 90 "
-            f"days. Setting to 90."
-        )
-        days_back = 90
-
     end_date = start_date - timedelta(days=days_back)
 
     assets_list = assets_df.to_dict('records')
     products_list = products_df.to_dict('records')
 
-    events: list[Event] = []
-
     current_time = end_date
     batch_counter = 1
     current_batch_id = f"BATCH_{batch_counter:06d}"
@@ -194,7 +292,7 @@ def generate_historical_events(
             anomaly_rate = asset_event_anomaly_rates[
                 index % len(asset_event_anomaly_rates)
             ]
-            event = asset_type.create_random_event(
+            yield asset_type.create_random_event(
                 asset_id=asset["Id"],
                 product_id=product["Id"],
                 batch_id=current_batch_id,
@@ -202,19 +300,93 @@ def generate_historical_events(
                 anomaly=random.random() < anomaly_rate
             )
 
-            events.append(event)
-
         current_time += timedelta(minutes=mins_between_events)
 
+
+def _limit_days_back(days_back: int) -> int:
+    """Cap the event history at 90 days."""
+    if days_back > 90:
+        print(
+            f"Warning: days_back ({days_back}) exceeds maximum of 90 "
+            f"days. Setting to 90."
+        )
+        return 90
+    return days_back
+
+
+def generate_historical_events(
+    assets_df: pd.DataFrame,
+    products_df: pd.DataFrame,
+    asset_event_anomaly_rates: list[float],
+    start_date: datetime,
+    days_back: int,
+    mins_between_events: int
+) -> pd.DataFrame:
+    """Generate historical event data."""
+    days_back = _limit_days_back(days_back)
+
+    events: list[Event] = list(iter_historical_events(
+        assets_df,
+        products_df,
+        asset_event_anomaly_rates,
+        start_date,
+        days_back,
+        mins_between_events
+    ))
+
     print(
         f"✅ Generated {len(events)} historical events across "
-        f"{len(assets_list)} assets ({days_back} days of data)"
+        f"{len(assets_df)} assets ({days_back} days of data)"
     )
 
     events_data = [event.to_dict() for event in events]
     return pd.DataFrame(events_data)
 
 
+def write_historical_events(
+    file_path: str,
+    assets_df: pd.DataFrame,
+    products_df: pd.DataFrame,
+    asset_event_anomaly_rates: list[float],
+    start_date: Optional[datetime],
+    days_back: int,
+    mins_between_events: int
+) -> int:
+    """Stream historical events straight to a CSV file and return the count."""
+    days_back = _limit_days_back(days_back)
+    expected = (
+        len(assets_df)
+        * (days_back * 24 * 60 // mins_between_events + 1)
+    )
+    print(f"Streaming about {expected:,} events to {file_path}...")
+
+    count = 0
+    with open(file_path, "w", newline="", encoding="utf-8") as f:
+        writer = None
+        for event in iter_historical_events(
+            assets_df,
+            products_df,
+            asset_event_anomaly_rates,
+            start_date,
+            days_back,
+            mins_between_events
+        ):
+            row = event.to_dict()
+            if writer is None:
+                writer = csv.DictWriter(f, fieldnames=list(row.keys()))
+                writer.writeheader()
+            writer.writerow(row)
+            count += 1
+            if count % 1_000_000 == 0:
+                print(f"  ... {count:,} events written")
+
+    print(
+        f"✅ Streamed {count:,} historical events across "
+        f"{len(assets_df)} assets ({days_back} days of data)"
+    )
+    return count
+
+
 def generate_sample_data(
     num_sites: int,
     num_assets_per_site: int,
@@ -225,14 +397,39 @@ def generate_sample_data(
     asset_event_anomaly_rates: list[float],
     event_start_date: Optional[datetime],
     event_days_back: int,
-    mins_between_events: int
+    mins_between_events: int,
+    scale_profile: Optional[str] = None,
+    num_locations: int = 1,
+    anomaly_rate_distribution: Optional[dict] = None,
+    stream_events: Optional[bool] = None,
+    path: str = "../infra/data"
 ) -> dict:
-    """Generate all sample data for the simulation."""
+    """Generate all sample data for the simulation.
+
+    A scale profile (S/M/L/XL, see SCALE_PROFILES) overrides the location,
+    site, asset and event arguments, draws per-asset anomaly rates from
+    anomaly_rate_distribution and streams events straight to CSV instead
+    of returning them as a DataFrame.
+    """
     random.seed(random_seed)
 
-    try:
-        path = "../infra/data"
+    if scale_profile is not None:
+        if scale_profile not in SCALE_PROFILES:
+            raise ValueError(
+                f"Unknown scale profile '{scale_profile}', expected one of "
+                f"{', '.join(SCALE_PROFILES)}"
+            )
+        profile = SCALE_PROFILES[scale_profile]
+        num_locations = profile["num_locations"]
+        num_sites = profile["num_sites"]
+        num_assets_per_site = profile["num_assets_per_site"]
+        event_days_back = profile["event_days_back"]
+        mins_between_events = profile["mins_between_events"]
+        asset_event_anomaly_rates = None
+        if stream_events is None:
+            stream_events = True
 
+    try:
         print("Generating sample data...")
         print(f"Output directory: {os.path.abspath(path)}")
 
@@ -262,17 +459,34 @@ def generate_sample_data(
                 )
 
         print(
-            f"Generating {num_sites} sites, "
+            f"Generating {num_locations} locations, {num_sites} sites, "
             f"{num_assets_per_site} assets per site, "
             f"{num_products} products..."
         )
-        locations_df = generate_locations()
+        locations_df = generate_locations(num_locations)
         sites_df = generate_sites(num_sites, locations_df)
         assets_df = generate_assets(num_assets_per_site, sites_df)
         products_df = generate_products(num_products)
 
+        if not asset_event_anomaly_rates:
+            asset_event_anomaly_rates = generate_asset_anomaly_rates(
+                len(assets_df),
+                anomaly_rate_distribution
+            )
+
         events_df = None
-        if include_events:
+        event_count = None
+        if include_events and stream_events:
+            event_count = write_historical_events(
+                csv_files["events"],
+                assets_df,
+                products_df,
+                asset_event_anomaly_rates,
+                event_start_date,
+                event_days_back,
+                mins_between_events
+            )
+        elif include_events:
             print(
                 f"Generating historical events for "
                 f"{event_days_back} days..."
@@ -306,6 +520,9 @@ def generate_sample_data(
 
         if include_events and events_df is not None:
             result["events_df"] = events_df
+        if event_count is not None:
+            result["events_file"] = csv_files["events"]
+            result["event_count"] = event_count
 
         return result
 
@@ -318,6 +535,22 @@ def generate_sample_data(
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generate the manufacturing sample data CSV files"
+    )
+    parser.add_argument(
+        "--scale-profile",
+        choices=list(SCALE_PROFILES),
+        help="Generate a large dataset for performance testing "
+             "(events are streamed to CSV)"
+    )
+    parser.add_argument(
+        "--output-path",
+        default="../infra/data",
+        help="Output directory of the CSV files (default: ../infra/data)"
+    )
+    args = parser.parse_args()
+
     result = generate_sample_data(
         num_sites=2,
         num_assets_per_site=1,
@@ -328,5 +561,7 @@ if __name__ == "__main__":
         asset_event_anomaly_rates=[0.02, 0.06],
         event_start_date=datetime.now(timezone.utc),
         event_days_back=90,
-        mins_between_events=1
+        mins_between_events=1,
+        scale_profile=args.scale_profile,
+        path=args.output_path
     )